@@ -0,0 +1,180 @@
+"""
+Headless batch entry point.
+
+Runs the configured scenarios and only writes files (CSV, and PNG when
+--plots is given); nothing is shown on screen and the plotting stack is
+never imported unless plots are requested.
+
+Run with: python -m src.batch [--config scenarios.json] [--output-dir results]
+
+A config file is JSON of the form
+    {
+        "params": {"steps": 300, "dt": 0.005, "gamma": 1.5, "k": 1.0, "sigma": 0.2, "n_simulations": 1000},
+        "scenarios": [
+            {"name": "Avellaneda", "market": "ABM",
+             "strategy": "AvellanedaStoikovStrategyAbm", "execution": "PoissonExecutionAbm"}
+        ]
+    }
+where every scenario may override any entry of "params". Setting "qmc_replicates"
+to a positive number draws the Monte Carlo paths from that many scrambled Sobol
+sequences (randomized QMC, requires scipy) instead of pseudo-random numbers.
+"""
+import argparse
+import json
+import os
+import re
+
+from src.executions.poisson_execution_abm import PoissonExecutionAbm
+from src.executions.poisson_execution_gbm import PoissonExecutionGbm
+from src.simulations.arithmetic_brownian import ArithmeticBrownianMotion
+from src.simulations.geometric_brownian import GeometricBrownianMotion
+from src.strategies.avellaneda_stoikov_abm import AvellanedaStoikovStrategyAbm
+from src.strategies.avellaneda_stoikov_gbm import AvellanedaStoikovStrategyGbm
+from src.strategies.symmetric_strategy import SymmetricStrategy
+from src.utils.plotting import StreamingHistogram
+from src.utils.risk_metrics import RiskAccumulator
+from src.utils.simulation_helpers import run_strategy, run_monte_carlo
+
+SIMULATORS = {
+    "ABM": ArithmeticBrownianMotion,
+    "GBM": GeometricBrownianMotion,
+}
+
+STRATEGIES = {
+    "AvellanedaStoikovStrategyAbm": AvellanedaStoikovStrategyAbm,
+    "AvellanedaStoikovStrategyGbm": AvellanedaStoikovStrategyGbm,
+    "SymmetricStrategy": SymmetricStrategy,
+}
+
+EXECUTIONS = {
+    "PoissonExecutionAbm": PoissonExecutionAbm,
+    "PoissonExecutionGbm": PoissonExecutionGbm,
+}
+
+# Same defaults and scenarios as src/main.py
+DEFAULT_CONFIG = {
+    "params": {"steps": 300, "dt": 0.005, "gamma": 1.5, "k": 1.0, "sigma": 0.2, "n_simulations": 1000, "seed": 0,
+               "qmc_replicates": 0},
+    "scenarios": [
+        {"name": "Avellaneda", "market": "ABM",
+         "strategy": "AvellanedaStoikovStrategyAbm", "execution": "PoissonExecutionAbm"},
+        {"name": "Avellaneda", "market": "GBM",
+         "strategy": "AvellanedaStoikovStrategyGbm", "execution": "PoissonExecutionGbm"},
+        {"name": "Symmetric", "market": "ABM",
+         "strategy": "SymmetricStrategy", "execution": "PoissonExecutionAbm"},
+    ],
+}
+
+PARAM_NAMES = ("steps", "dt", "gamma", "k", "sigma")
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", text.lower()).strip("_")
+
+
+def _scenario_kwargs(scenario: dict, params: dict) -> tuple[dict, dict]:
+    merged = {**params, **{key: value for key, value in scenario.items() if key in params}}
+    return dict(
+        simulator=SIMULATORS[scenario["market"]],
+        strategy_class=STRATEGIES[scenario["strategy"]],
+        execution_class=EXECUTIONS[scenario["execution"]],
+        strategy_name=scenario["name"],
+        market_name=scenario["market"],
+        **{name: merged[name] for name in PARAM_NAMES}
+    ), merged
+
+
+def run_batch(config: dict, output_dir: str, mode: str = "both", plots: bool = False) -> list:
+    """
+    Runs every scenario of `config` and writes the results into `output_dir`.
+
+    Args:
+        config (dict): Parameters and scenarios, see the module docstring.
+        output_dir (str): Directory for the output files (created if missing).
+        mode (str): "single", "monte_carlo" or "both".
+        plots (bool): Also save single-run diagnostics as PNG (Agg backend).
+
+    Returns:
+        list: Paths of the files written.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    params = {**DEFAULT_CONFIG["params"], **config.get("params", {})}
+    written = []
+    risk_reports = {}
+    histograms = {}
+
+    if plots:
+        # Select the non-interactive backend before pyplot is imported anywhere
+        import matplotlib
+        matplotlib.use("Agg")
+        from src.utils.simulation_helpers import plot_strategy_diagnostics
+
+    for scenario in config.get("scenarios", DEFAULT_CONFIG["scenarios"]):
+        kwargs, merged = _scenario_kwargs(scenario, params)
+        label = _slug(f"{scenario['name']}_{scenario['market']}")
+
+        if mode in ("single", "both"):
+            df = run_strategy(seed=merged["seed"], **kwargs)
+            path = os.path.join(output_dir, f"{label}_single.csv")
+            df.to_csv(path, index=False)
+            written.append(path)
+            if plots:
+                path = os.path.join(output_dir, f"{label}_diagnostics.png")
+                plot_strategy_diagnostics(df, f"{scenario['name']} ({scenario['market']})", show=False, save_path=path)
+                written.append(path)
+
+        if mode in ("monte_carlo", "both"):
+            name = f"{scenario['name']} ({scenario['market']})"
+            risk = RiskAccumulator()
+            histograms[name] = StreamingHistogram()
+            # Paths are folded into the accumulator and histogram; no per-path rows are kept
+            run_monte_carlo(
+                n_simulations=merged["n_simulations"], risk=risk, histogram=histograms[name],
+                qmc_replicates=merged["qmc_replicates"], seed=merged["seed"], **kwargs
+            )
+            risk_reports[name] = risk.report()
+
+    if risk_reports:
+        import pandas as pd
+
+        if plots:
+            import matplotlib.pyplot as plt
+            from src.utils.plotting import plot_pnl_density
+
+            ax = plot_pnl_density(histograms, title="Final PnL Distribution (Monte Carlo)")
+            path = os.path.join(output_dir, "monte_carlo_pnl_density.png")
+            ax.figure.savefig(path)
+            plt.close(ax.figure)
+            written.append(path)
+
+        summary = pd.DataFrame.from_dict(risk_reports, orient="index")
+        summary.index.name = "strategy"
+        path = os.path.join(output_dir, "monte_carlo_summary.csv")
+        summary.to_csv(path)
+        written.append(path)
+
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run simulation scenarios headless and write results to files.")
+    parser.add_argument("--config", help="JSON file with params and scenarios (defaults to the src/main.py setup)")
+    parser.add_argument("--output-dir", default="results", help="directory for the output files")
+    parser.add_argument("--mode", choices=("single", "monte_carlo", "both"), default="both")
+    parser.add_argument("--n-simulations", type=int, help="override the number of Monte Carlo runs")
+    parser.add_argument("--plots", action="store_true", help="also save diagnostics plots as PNG")
+    args = parser.parse_args(argv)
+
+    config = DEFAULT_CONFIG
+    if args.config:
+        with open(args.config) as f:
+            config = json.load(f)
+    if args.n_simulations is not None:
+        config = {**config, "params": {**config.get("params", {}), "n_simulations": args.n_simulations}}
+
+    for path in run_batch(config, args.output_dir, mode=args.mode, plots=args.plots):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
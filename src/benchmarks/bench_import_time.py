@@ -0,0 +1,73 @@
+"""
+Cold-start import-time benchmark for simulation worker processes.
+
+Every worker-facing module is imported in a fresh interpreter; the best of a
+few runs is compared against IMPORT_BUDGET_MS, and the plotting/dataframe
+stack must not be loaded as a side effect.
+
+Run with: python -m src.benchmarks.bench_import_time
+"""
+import json
+import subprocess
+import sys
+
+# Modules a simulation worker imports; none of them may pull in plotting or pandas
+WORKER_MODULES = (
+    "src.core.simulation_runner",
+    "src.core.multi_asset_runner",
+    "src.core.multi_agent_runner",
+    "src.simulations.arithmetic_brownian",
+    "src.simulations.geometric_brownian",
+    "src.simulations.heston",
+    "src.simulations.merton_jump_diffusion",
+    "src.strategies.avellaneda_stoikov_abm",
+    "src.strategies.hjb_avellaneda_stoikov",
+    "src.executions.poisson_execution_abm",
+    "src.calibration.intensity",
+    "src.utils.simulation_helpers",
+    "src.batch",
+)
+
+HEAVY_MODULES = ("matplotlib", "pandas", "seaborn")
+
+# numpy alone accounts for most of this; the project's own modules add a few ms
+IMPORT_BUDGET_MS = 150.0
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = sorted(name for name in {heavy!r} if name in sys.modules)
+print(json.dumps({{"ms": elapsed * 1e3, "heavy": heavy}}))
+"""
+
+
+def measure_import(module: str, repeats: int = 3) -> dict:
+    """Imports `module` in fresh interpreters; returns the best time and any heavy modules loaded."""
+    best = None
+    for _ in range(repeats):
+        out = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            check=True, capture_output=True, text=True
+        )
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        if best is None or result["ms"] < best["ms"]:
+            best = result
+    return best
+
+
+def main() -> int:
+    ok = True
+    for module in WORKER_MODULES:
+        result = measure_import(module)
+        passed = result["ms"] <= IMPORT_BUDGET_MS and not result["heavy"]
+        ok &= passed
+        note = f" loads {', '.join(result['heavy'])}" if result["heavy"] else ""
+        print(f"{module:45} {result['ms']:8.1f} ms {'OK' if passed else 'FAIL'}{note}")
+    print(f"budget: {IMPORT_BUDGET_MS:.0f} ms per module, no {', '.join(HEAVY_MODULES)}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""
+Rendering-time benchmark for the diagnostics plots on very large runs.
+
+Renders `plot_strategy_diagnostics` for a synthetic 10^7-step trace and a PnL
+density for 10^6 paths with the Agg backend and checks each against the
+one-second budget.
+
+Run with: python -m src.benchmarks.bench_plotting
+"""
+import os
+import sys
+import tempfile
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+import numpy as np
+from src.utils.plotting import StreamingHistogram, plot_pnl_density
+from src.utils.simulation_helpers import plot_strategy_diagnostics
+
+RENDER_BUDGET_S = 1.0
+
+
+def synthetic_trace(n_steps: int, seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+    mid = 100 + np.cumsum(0.01 * rng.standard_normal(n_steps))
+    inventory = np.cumsum(rng.integers(-1, 2, n_steps))
+    cash = -np.cumsum(np.diff(inventory, prepend=0) * mid)
+    return {
+        "mid_prices": mid,
+        "reservation_prices": mid - 0.01 * inventory,
+        "bid_prices": mid - 0.5,
+        "ask_prices": mid + 0.5,
+        "inventory": inventory,
+        "cash": cash,
+        "pnl": cash + inventory * mid,
+    }
+
+
+def main(n_steps: int = 10_000_000, n_paths: int = 1_000_000) -> int:
+    import matplotlib.pyplot as plt
+
+    trace = synthetic_trace(n_steps)
+    pnl = np.random.default_rng(1).normal(50, 10, n_paths)
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        plot_strategy_diagnostics(trace, "Benchmark", show=False, save_path=os.path.join(tmp, "diagnostics.png"))
+        elapsed = time.perf_counter() - start
+        ok &= elapsed <= RENDER_BUDGET_S
+        print(f"diagnostics, {n_steps:,} steps: {elapsed:.2f} s")
+
+        start = time.perf_counter()
+        ax = plot_pnl_density({"benchmark": StreamingHistogram().update(pnl)})
+        ax.figure.savefig(os.path.join(tmp, "density.png"))
+        plt.close(ax.figure)
+        elapsed = time.perf_counter() - start
+        ok &= elapsed <= RENDER_BUDGET_S
+        print(f"PnL density, {n_paths:,} paths: {elapsed:.2f} s")
+    print(f"budget: {RENDER_BUDGET_S:.1f} s per plot -> {'OK' if ok else 'FAIL'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
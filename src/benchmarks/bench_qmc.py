@@ -0,0 +1,61 @@
+"""
+Error of the expected-PnL estimate with randomized QMC against plain Monte Carlo.
+
+For several path counts, `n_replicates` independent estimates of the mean PnL
+of the ABM Avellaneda-Stoikov market maker (`BatchSimulationRunner`, per-side
+Poisson fills) are computed with pseudo-random paths and with scrambled Sobol
+paths (Brownian bridge, quasi-random fill draws). The spread of each set of
+estimates is its standard error, and the squared ratio is the factor by which
+QMC reduces the number of paths needed for the same error.
+
+Run with: python -m src.benchmarks.bench_qmc
+"""
+import sys
+
+import numpy as np
+from src.core.batch_runner import BatchSimulationRunner
+from src.executions.batch_poisson_execution import BatchPoissonExecution
+from src.simulations.arithmetic_brownian import ArithmeticBrownianMotion
+from src.simulations.quasi_random import SobolNormalSource
+from src.strategies.avellaneda_stoikov_abm import AvellanedaStoikovStrategyAbm
+
+PARAMS = dict(S0=100.0, sigma=2.0, gamma=0.1, k=1.5, A=140.0, dt=0.005, T=1.0)
+MC_REFERENCE_PATHS = 1000
+
+
+def mean_pnl(n_paths: int, qmc: bool, seed) -> float:
+    market_seed, fill_seed = seed.spawn(2)
+    source = SobolNormalSource(seed=market_seed, uniform_streams=2) if qmc else None
+    runner = BatchSimulationRunner(
+        market=ArithmeticBrownianMotion(S0=PARAMS["S0"], sigma=PARAMS["sigma"], seed=market_seed,
+                                        normal_source=source),
+        pricing_strategy=AvellanedaStoikovStrategyAbm(PARAMS["gamma"], PARAMS["sigma"], PARAMS["k"]),
+        order_execution=BatchPoissonExecution(PARAMS["A"], PARAMS["k"], seed=fill_seed, uniform_source=source),
+        n_paths=n_paths, dt=PARAMS["dt"], T=PARAMS["T"]
+    )
+    return runner.run()["pnl"].mean()
+
+
+def main(path_counts=(256, 512, 1024, 2048, 4096), n_replicates: int = 16, seed: int = 0) -> int:
+    seeds = np.random.SeedSequence(seed).spawn(n_replicates)
+    print(f"{'paths':>6} {'MC s.e.':>9} {'RQMC s.e.':>10} {'variance ratio':>15}")
+    mc_error_at_reference = None
+    rqmc_errors = {}
+    for n_paths in path_counts:
+        mc = np.std([mean_pnl(n_paths, False, s) for s in seeds], ddof=1)
+        rqmc = np.std([mean_pnl(n_paths, True, s) for s in seeds], ddof=1)
+        rqmc_errors[n_paths] = rqmc
+        if n_paths >= MC_REFERENCE_PATHS and mc_error_at_reference is None:
+            # Scale to exactly the reference path count with the 1/sqrt(n) MC rate
+            mc_error_at_reference = mc * np.sqrt(n_paths / MC_REFERENCE_PATHS)
+        print(f"{n_paths:>6} {mc:>9.4f} {rqmc:>10.4f} {(mc / rqmc) ** 2:>15.1f}")
+
+    if mc_error_at_reference is not None:
+        enough = [n for n, error in rqmc_errors.items() if error <= mc_error_at_reference]
+        print(f"MC error with {MC_REFERENCE_PATHS} paths: {mc_error_at_reference:.4f}; "
+              f"RQMC reaches it with {min(enough) if enough else 'more than ' + str(max(path_counts))} paths")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
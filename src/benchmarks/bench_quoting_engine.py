@@ -0,0 +1,57 @@
+"""
+Throughput / latency benchmark of the live quoting engine.
+
+Replays a synthetic tick file through `QuotingEngine` with the ABM
+Avellaneda-Stoikov strategy, once quoting every tick and once with stale-tick
+coalescing, and checks both against the 100k ticks/second target.
+
+Run with: python -m src.benchmarks.bench_quoting_engine
+"""
+import asyncio
+import os
+import sys
+import tempfile
+
+import numpy as np
+from src.core.inventory_manager import InventoryManager
+from src.live.quoting_engine import QuotingEngine
+from src.live.tick_sources import FileReplayTickSource
+from src.strategies.avellaneda_stoikov_abm import AvellanedaStoikovStrategyAbm
+
+TARGET_TICKS_PER_SECOND = 100_000
+
+
+def write_tick_file(path: str, n_ticks: int, seed: int = 0) -> None:
+    rng = np.random.default_rng(seed)
+    timestamps = np.arange(n_ticks) * 1e-5
+    mids = 100 + np.cumsum(0.01 * rng.standard_normal(n_ticks))
+    np.savetxt(path, np.column_stack([timestamps, mids]), fmt="%.6f", delimiter=",")
+
+
+def run_engine(path: str, coalesce: bool, batch_bytes: int) -> dict:
+    strategy = AvellanedaStoikovStrategyAbm(gamma=0.1, sigma=2.0, k=1.5)
+    engine = QuotingEngine(strategy, InventoryManager(initial_cash=0, initial_inventory=0),
+                           horizon=1.0, time_scale=0.1, coalesce=coalesce)
+    return asyncio.run(engine.run(FileReplayTickSource(path, batch_bytes=batch_bytes)))
+
+
+def main(n_ticks: int = 1_000_000) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ticks.csv")
+        write_tick_file(path, n_ticks)
+        ok = True
+        # Without coalescing every tick of a read waits for the ticks before it, so
+        # smaller reads keep the tick-to-quote latency down
+        for coalesce, batch_bytes in ((False, 1 << 12), (True, 1 << 16)):
+            stats = run_engine(path, coalesce, batch_bytes)
+            passed = stats["ticks_per_second"] >= TARGET_TICKS_PER_SECOND
+            ok &= passed
+            print(f"coalesce={coalesce!s:5} ticks/s={stats['ticks_per_second']:>12,.0f} "
+                  f"quotes={stats['quotes']:>9,} p50={stats['p50_us']:.1f}us "
+                  f"p99={stats['p99_us']:.1f}us p99.9={stats['p99.9_us']:.1f}us "
+                  f"{'OK' if passed else 'BELOW TARGET'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
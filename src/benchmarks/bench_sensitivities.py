@@ -0,0 +1,108 @@
+"""
+Single-pass sensitivities of expected PnL and inventory variance against
+finite differences.
+
+`BatchSimulationRunner(sensitivities=...)` estimates d/dθ of E[PnL] and
+Var[inventory] for gamma, k and sigma from one run (ABM, Avellaneda-Stoikov),
+under both fill models: per-side `BatchPoissonExecution` and the half-spread
+`BatchPoissonOrderExecution` of the `run_simulations` sweep. The reference is a central finite difference over
+separate runs at θ ± h, with common random numbers and pooled over
+`n_repeats` seeds; its standard error comes from the spread across seeds.
+The single-pass estimate is pooled over `n_repeats` other seeds the same
+way, so a bias would show up against standard errors sqrt(n_repeats) times
+smaller than those of one run.
+
+Run with: python -m src.benchmarks.bench_sensitivities
+"""
+import sys
+import time
+
+import numpy as np
+from src.core.batch_runner import BatchSimulationRunner
+from src.executions.batch_poisson_execution import BatchPoissonExecution
+from src.executions.batch_poisson_order_execution import BatchPoissonOrderExecution
+from src.simulations.arithmetic_brownian import ArithmeticBrownianMotion
+from src.strategies.avellaneda_stoikov_abm import AvellanedaStoikovStrategyAbm
+
+PARAMS = dict(S0=100.0, sigma=2.0, gamma=0.1, k=1.5, A=140.0, dt=0.005, T=1.0)
+STEPS = {"gamma": 0.02, "k": 0.03, "sigma": 0.2}
+EXECUTIONS = (BatchPoissonExecution, BatchPoissonOrderExecution)
+
+
+def make_runner(n_paths: int, seed=0, sensitivities: tuple = (), execution_class=BatchPoissonExecution,
+                **overrides) -> BatchSimulationRunner:
+    """Runner at PARAMS, with any of gamma, k or sigma replaced by `overrides`."""
+    p = {**PARAMS, **overrides}
+    market_seed, fill_seed = np.random.SeedSequence(seed).spawn(2)
+    return BatchSimulationRunner(
+        market=ArithmeticBrownianMotion(S0=p["S0"], sigma=p["sigma"], seed=market_seed),
+        pricing_strategy=AvellanedaStoikovStrategyAbm(p["gamma"], p["sigma"], p["k"]),
+        order_execution=execution_class(p["A"], p["k"], seed=fill_seed),
+        n_paths=n_paths, dt=p["dt"], T=p["T"], sensitivities=sensitivities
+    )
+
+
+def finite_difference(name: str, n_paths: int, n_repeats: int, seed: int = 1,
+                      execution_class=BatchPoissonExecution) -> dict:
+    """Central differences of mean PnL and inventory variance with common random numbers."""
+    h = STEPS[name]
+    pnl, variance = [], []
+    for s in np.random.SeedSequence(seed).generate_state(n_repeats):
+        up = make_runner(n_paths, s, execution_class=execution_class, **{name: PARAMS[name] + h}).run()
+        down = make_runner(n_paths, s, execution_class=execution_class, **{name: PARAMS[name] - h}).run()
+        pnl.append((up["pnl"].mean() - down["pnl"].mean()) / (2 * h))
+        variance.append((up["inventory"].var() - down["inventory"].var()) / (2 * h))
+    return {
+        "pnl": np.mean(pnl), "pnl_se": np.std(pnl, ddof=1) / np.sqrt(n_repeats),
+        "inventory_variance": np.mean(variance),
+        "inventory_variance_se": np.std(variance, ddof=1) / np.sqrt(n_repeats)
+    }
+
+
+def single_pass(n_paths: int, n_repeats: int, seed: int = 2, execution_class=BatchPoissonExecution) -> dict:
+    """Single-pass estimates for all of STEPS, averaged over `n_repeats` independent runs."""
+    runs = [make_runner(n_paths, s, sensitivities=tuple(STEPS), execution_class=execution_class).run()["sensitivities"]
+            for s in np.random.SeedSequence(seed).generate_state(n_repeats)]
+    pooled = {}
+    for name in STEPS:
+        pooled[name] = {}
+        for quantity in ("pnl", "inventory_variance"):
+            values = [run[name][quantity] for run in runs]
+            pooled[name][quantity] = np.mean(values)
+            pooled[name][f"{quantity}_se"] = np.std(values, ddof=1) / np.sqrt(n_repeats)
+    return pooled
+
+
+def main(n_paths: int = 50_000, n_repeats: int = 8) -> int:
+    start = time.perf_counter()
+    make_runner(n_paths).run()
+    plain = time.perf_counter() - start
+    start = time.perf_counter()
+    make_runner(n_paths, sensitivities=tuple(STEPS)).run()
+    one_pass = time.perf_counter() - start
+    print(f"{n_paths} paths: plain run {plain:.2f} s, with sensitivities to {len(STEPS)} parameters "
+          f"{one_pass:.2f} s; a central-difference grid needs {2 * len(STEPS)} extra runs")
+
+    worst = 0.0
+    for execution_class in EXECUTIONS:
+        print(execution_class.__name__)
+        estimates = single_pass(n_paths, n_repeats, execution_class=execution_class)
+        for name in STEPS:
+            reference = finite_difference(name, n_paths, n_repeats, execution_class=execution_class)
+            for quantity in ("pnl", "inventory_variance"):
+                estimate = estimates[name]
+                se = np.hypot(estimate[f"{quantity}_se"], reference[f"{quantity}_se"])
+                z = abs(estimate[quantity] - reference[quantity]) / se
+                worst = max(worst, z)
+                print(f"  d {quantity:<18} / d {name:<5}: single pass (x{n_repeats}) {estimate[quantity]:9.3f} ± "
+                      f"{estimate[f'{quantity}_se']:.3f}, finite difference {reference[quantity]:9.3f} ± "
+                      f"{reference[f'{quantity}_se']:.3f} ({z:.1f} s.e.)")
+
+    # Both sides are pooled over n_repeats seeds, so 3 s.e. is a bias check, not a noise allowance
+    ok = worst < 3
+    print("agreement:", "OK" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""
+Paths spent and quality of the pick of successive halving against a full grid.
+
+Tunes gamma and the quoting-depth offset of the ABM Avellaneda-Stoikov market
+maker (`src.tuning.successive_halving`) for the mean-variance and Sharpe
+objectives. The exhaustive grid with `max_runs` paths in every cell is
+simulated with an independent seed and serves as the reference: the regret is
+how far the grid value of the chosen candidate falls short of the grid
+optimum, and the rank is its position in the grid.
+
+Run with: python -m src.benchmarks.bench_tuning
+"""
+import os
+import sys
+import time
+
+import numpy as np
+from src.strategies.avellaneda_stoikov_abm import AvellanedaStoikovStrategyAbm
+from src.tuning import successive_halving
+
+SEARCH = dict(strategy_class=AvellanedaStoikovStrategyAbm, sigma=2.0, k=1.5,
+              gamma_values=np.geomspace(0.01, 1.0, 9), k_offsets=[-0.5, 0.0, 0.5, 1.0])
+RISK_AVERSION = 0.05
+MAX_RUNS = 1000
+
+
+def main(n_jobs: int = os.cpu_count() or 1) -> int:
+    start = time.perf_counter()
+    # One round at max_runs is the exhaustive grid
+    grid = successive_halving(**SEARCH, min_runs=MAX_RUNS, max_runs=MAX_RUNS, n_jobs=n_jobs, seed=1)['history']
+    grid_time = time.perf_counter() - start
+    grid_values = {
+        "mean_variance": grid['mean_pnl'] - RISK_AVERSION * grid['std_pnl'] ** 2,
+        "sharpe": grid['mean_pnl'] / grid['std_pnl'],
+    }
+    print(f"full grid: {len(grid)} candidates x {MAX_RUNS} paths in {grid_time:.1f} s")
+
+    ok = True
+    for objective, values in grid_values.items():
+        start = time.perf_counter()
+        result = successive_halving(**SEARCH, objective=objective, risk_aversion=RISK_AVERSION,
+                                    max_runs=MAX_RUNS, n_jobs=n_jobs, seed=0)
+        elapsed = time.perf_counter() - start
+        chosen = (grid['gamma'] == result['gamma']) & (grid['k_offset'] == result['k_offset'])
+        regret = values.max() - values[chosen].iloc[0]
+        rank = int((values > values[chosen].iloc[0]).sum()) + 1
+        share = result['total_paths'] / result['grid_paths']
+        print(f"{objective}: gamma={result['gamma']:.4f}, k_offset={result['k_offset']:+.1f} in {elapsed:.1f} s, "
+              f"{result['total_paths']} paths ({share:.0%} of the grid); grid rank {rank} of {len(grid)}, "
+              f"regret {regret:.3f} (grid range {values.max() - values.min():.3f})")
+        ok &= share < 0.25 and rank <= 5
+    print("tuning:", "OK" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,357 @@
+# calibration/intensity.py
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from src.executions.batch_poisson_execution import BatchPoissonExecution
+from src.executions.poisson_execution_abm import PoissonExecutionAbm
+from src.executions.poisson_execution_gbm import PoissonExecutionGbm
+
+# These executions put the full quoted spread (ask - bid) in the exponent, i.e.
+# twice the per-side distance under symmetric quoting.
+FULL_SPREAD_EXECUTIONS = (PoissonExecutionAbm, PoissonExecutionGbm)
+
+
+class IntensityAccumulator:
+    """
+    Binned sufficient statistics of the exponential-intensity fill model for one side.
+
+    Quote exposures are aggregated by quote distance δ (rounded to `resolution`)
+    into total exposure time and fill counts. The Poisson log-likelihood
+    ℓ(A, k) = Σ n (log A - k δ) - A Σ τ exp(-k δ) only depends on these bins, so
+    arbitrarily large logs can be ingested chunk by chunk in bounded memory and
+    accumulators from different workers can be merged.
+
+    Attributes:
+        resolution (float): Bin width for δ; use the tick size for exact results.
+        exposure (np.ndarray): Total quoted time per bin.
+        fills (np.ndarray): Number of fills per bin.
+        offset (int): Integer bin index of the first array element.
+    """
+
+    def __init__(self, resolution: float = 1e-3):
+        self.resolution = resolution
+        self.exposure = np.zeros(0)
+        self.fills = np.zeros(0)
+        self.offset = 0
+
+    @property
+    def deltas(self) -> np.ndarray:
+        return (np.arange(self.exposure.size) + self.offset) * self.resolution
+
+    def _ensure_range(self, lo: int, hi: int) -> None:
+        if self.exposure.size == 0:
+            self.offset = lo
+            self.exposure = np.zeros(hi - lo + 1)
+            self.fills = np.zeros(hi - lo + 1)
+            return
+        new_lo = min(lo, self.offset)
+        new_hi = max(hi, self.offset + self.exposure.size - 1)
+        if new_lo == self.offset and new_hi == self.offset + self.exposure.size - 1:
+            return
+        pad_left = self.offset - new_lo
+        pad_right = new_hi - (self.offset + self.exposure.size - 1)
+        self.exposure = np.pad(self.exposure, (pad_left, pad_right))
+        self.fills = np.pad(self.fills, (pad_left, pad_right))
+        self.offset = new_lo
+
+    def update(self, delta: np.ndarray, duration: np.ndarray, fills: np.ndarray) -> None:
+        """
+        Adds a chunk of quote exposures.
+
+        Args:
+            delta (np.ndarray): Distance of each quote from the mid-price.
+            duration (np.ndarray): Time each quote was resting (e.g. dt per step).
+            fills (np.ndarray): Number of fills received while resting (0/1 per step).
+        """
+        delta = np.asarray(delta, dtype=float)
+        if delta.size == 0:
+            return
+        idx = np.rint(delta / self.resolution).astype(np.int64)
+        lo, hi = int(idx.min()), int(idx.max())
+        self._ensure_range(lo, hi)
+        idx -= self.offset
+        n_bins = self.exposure.size
+        self.exposure += np.bincount(idx, weights=np.broadcast_to(duration, delta.shape), minlength=n_bins)
+        self.fills += np.bincount(idx, weights=np.broadcast_to(fills, delta.shape), minlength=n_bins)
+
+    def merge(self, other: "IntensityAccumulator") -> "IntensityAccumulator":
+        """Adds the statistics of another accumulator with the same resolution in place."""
+        if other.resolution != self.resolution:
+            raise ValueError("cannot merge accumulators with different resolutions")
+        if other.exposure.size == 0:
+            return self
+        self._ensure_range(other.offset, other.offset + other.exposure.size - 1)
+        start = other.offset - self.offset
+        self.exposure[start:start + other.exposure.size] += other.exposure
+        self.fills[start:start + other.fills.size] += other.fills
+        return self
+
+
+@dataclass
+class IntensityEstimate:
+    """Maximum-likelihood estimate of λ(δ) = A * exp(-k * δ) for one side."""
+    A: float
+    k: float
+    A_se: float
+    k_se: float
+    n_fills: float
+    exposure: float
+    log_likelihood: float
+    A_ci: Optional[tuple[float, float]] = None
+    k_ci: Optional[tuple[float, float]] = None
+
+    def intensity(self, delta):
+        return self.A * np.exp(-self.k * np.asarray(delta))
+
+    def to_execution(self, execution_class=PoissonExecutionAbm):
+        """
+        Builds a symmetric execution model from this estimate.
+
+        `PoissonExecutionAbm`/`PoissonExecutionGbm` use the full spread in the
+        exponent, so k is halved for them to keep the per-side intensity.
+        """
+        k = self.k / 2 if execution_class in FULL_SPREAD_EXECUTIONS else self.k
+        return execution_class(A=self.A, k=k)
+
+
+@dataclass
+class AsymmetricIntensityEstimate:
+    """Bid and ask intensity estimates."""
+    bid: IntensityEstimate
+    ask: IntensityEstimate
+
+    def to_execution(self, seed: Optional[int] = None, dtype=np.float64) -> BatchPoissonExecution:
+        """
+        Builds a `BatchPoissonExecution` with separate bid and ask intensities.
+
+        Both use the per-side distance δ from the mid-price, as in the fit, so A
+        and k carry over unchanged.
+        """
+        return BatchPoissonExecution(
+            A=self.bid.A,
+            k=self.bid.k,
+            A_ask=self.ask.A,
+            k_ask=self.ask.k,
+            seed=seed,
+            dtype=dtype
+        )
+
+
+def _log_sum_exp_moments(k: np.ndarray, deltas: np.ndarray, exposure: np.ndarray):
+    """
+    Returns log S0 and the ratios S1 / S0, S2 / S0 with Sj = Σ τ δ^j exp(-k δ).
+
+    `k` has shape (R,) so that R fits (bootstrap replicates) are evaluated at once.
+    """
+    log_terms = -np.outer(k, deltas)
+    log_terms = np.where(exposure > 0, log_terms, -np.inf)
+    shift = log_terms.max(axis=1, keepdims=True)
+    weights = exposure * np.exp(log_terms - shift)
+    s0 = weights.sum(axis=1)
+    m1 = weights @ deltas / s0
+    m2 = weights @ deltas ** 2 / s0
+    return np.log(s0) + shift[:, 0], m1, m2
+
+
+def _fit_profile_newton(
+    deltas: np.ndarray,
+    exposure: np.ndarray,
+    fills: np.ndarray,
+    k0: float = 1.0,
+    tol: float = 1e-10,
+    max_iter: int = 100
+):
+    """
+    Vectorized Newton iterations on the profile log-likelihood in k.
+
+    With A profiled out (A = N / S0(k)) the log-likelihood is concave in k with
+    gradient N * S1 / S0 - Σ n δ and curvature -N * Var_w(δ), so every replicate
+    in `fills` (shape (R, B)) converges in a handful of steps.
+
+    Returns:
+        (A, k, k_curvature, log_likelihood) arrays of shape (R,).
+    """
+    fills = np.atleast_2d(fills)
+    n_total = fills.sum(axis=1)
+    fill_delta = fills @ deltas
+    k = np.full(fills.shape[0], float(k0))
+    for _ in range(max_iter):
+        _, m1, m2 = _log_sum_exp_moments(k, deltas, exposure)
+        grad = n_total * m1 - fill_delta
+        curvature = -n_total * np.maximum(m2 - m1 ** 2, 1e-300)
+        step = grad / curvature
+        k -= step
+        if np.all(np.abs(step) < tol * np.maximum(1.0, np.abs(k))):
+            break
+    log_s0, m1, m2 = _log_sum_exp_moments(k, deltas, exposure)
+    curvature = -n_total * (m2 - m1 ** 2)
+    log_A = np.log(n_total) - log_s0
+    log_likelihood = n_total * log_A - k * fill_delta - n_total
+    return np.exp(log_A), k, curvature, log_likelihood
+
+
+def _bootstrap_chunk(args):
+    deltas, exposure, fills, n_replicates, seed, k0 = args
+    rng = np.random.default_rng(seed)
+    # Poisson bootstrap: resample fill counts per bin given the exposure
+    resampled = rng.poisson(fills, size=(n_replicates, fills.size)).astype(float)
+    A, k, _, _ = _fit_profile_newton(deltas, exposure, resampled, k0=k0)
+    return A, k
+
+
+def fit_intensity(
+    accumulator: IntensityAccumulator,
+    n_bootstrap: int = 0,
+    confidence: float = 0.95,
+    n_jobs: int = 1,
+    seed: Optional[int] = None
+) -> IntensityEstimate:
+    """
+    Fits A and k for one side by maximum likelihood.
+
+    Args:
+        accumulator (IntensityAccumulator): Binned exposures and fills.
+        n_bootstrap (int): Number of Poisson-bootstrap replicates for CIs (0 disables).
+        confidence (float): Confidence level of the percentile intervals.
+        n_jobs (int): Worker processes used for the bootstrap.
+        seed (int, optional): Seed for reproducible bootstrap replicates.
+
+    Returns:
+        IntensityEstimate: Point estimates, asymptotic standard errors and
+        optional bootstrap confidence intervals.
+    Raises:
+        ValueError: Without fills, or when all exposure sits at a single quote
+            distance, where k cannot be identified.
+    """
+    mask = accumulator.exposure > 0
+    deltas = accumulator.deltas[mask]
+    exposure = accumulator.exposure[mask]
+    fills = accumulator.fills[mask]
+    if fills.sum() == 0:
+        raise ValueError("cannot calibrate intensity without any fills")
+    if deltas.size < 2:
+        # One distance only pins down A * exp(-k * δ), not A and k separately
+        raise ValueError("cannot identify k: all quotes rested at a single distance from the mid "
+                         f"({deltas[0]:g}); quotes at two or more distances are needed")
+
+    A, k, curvature, log_likelihood = _fit_profile_newton(deltas, exposure, fills)
+    A, k, curvature, log_likelihood = A[0], k[0], curvature[0], log_likelihood[0]
+    n_fills = fills.sum()
+    k_se = 1 / np.sqrt(-curvature)
+    # Delta method on A = N / S0(k): dA/dk = A * E_w[δ], plus Poisson noise in N
+    m1 = (exposure * np.exp(-k * deltas)) @ deltas / (exposure @ np.exp(-k * deltas))
+    A_se = A * np.sqrt(1 / n_fills + (m1 * k_se) ** 2)
+
+    estimate = IntensityEstimate(
+        A=float(A), k=float(k), A_se=float(A_se), k_se=float(k_se),
+        n_fills=float(n_fills), exposure=float(exposure.sum()), log_likelihood=float(log_likelihood)
+    )
+
+    if n_bootstrap > 0:
+        n_chunks = max(1, min(n_jobs, n_bootstrap))
+        sizes = np.diff(np.linspace(0, n_bootstrap, n_chunks + 1).astype(int))
+        seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+        tasks = [(deltas, exposure, fills, size, s, k) for size, s in zip(sizes, seeds)]
+        if n_jobs > 1:
+            with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+                results = list(pool.map(_bootstrap_chunk, tasks))
+        else:
+            results = [_bootstrap_chunk(task) for task in tasks]
+        A_boot = np.concatenate([r[0] for r in results])
+        k_boot = np.concatenate([r[1] for r in results])
+        tail = 100 * (1 - confidence) / 2
+        estimate.A_ci = tuple(float(x) for x in np.percentile(A_boot, [tail, 100 - tail]))
+        estimate.k_ci = tuple(float(x) for x in np.percentile(k_boot, [tail, 100 - tail]))
+
+    return estimate
+
+
+class IntensityCalibrator:
+    """
+    Streams quote/fill logs and calibrates per-side intensities.
+
+    Each record describes one resting quote: its side, its distance δ from the
+    mid-price, how long it rested and how many fills it received. Records can be
+    fed in chunks with `partial_fit`, read from CSV with `from_csv`, and
+    calibrators built by separate workers can be combined with `merge`.
+    """
+
+    def __init__(self, resolution: float = 1e-3):
+        """
+        Args:
+            resolution (float): Bin width for quote distances (tick size).
+        """
+        self.resolution = resolution
+        self.bid = IntensityAccumulator(resolution)
+        self.ask = IntensityAccumulator(resolution)
+
+    def partial_fit(self, side, delta, duration, fills) -> "IntensityCalibrator":
+        """
+        Args:
+            side (np.ndarray): "bid"/"ask" labels, or +1 for bid and -1 for ask.
+            delta (np.ndarray): Quote distance from the mid-price.
+            duration (np.ndarray or float): Resting time of each quote.
+            fills (np.ndarray): Fills received by each quote.
+        """
+        side = np.asarray(side)
+        delta = np.asarray(delta, dtype=float)
+        duration = np.broadcast_to(np.asarray(duration, dtype=float), delta.shape)
+        fills = np.asarray(fills, dtype=float)
+        is_bid = side == "bid" if side.dtype.kind in "US" else side > 0
+        self.bid.update(delta[is_bid], duration[is_bid], fills[is_bid])
+        self.ask.update(delta[~is_bid], duration[~is_bid], fills[~is_bid])
+        return self
+
+    def merge(self, other: "IntensityCalibrator") -> "IntensityCalibrator":
+        self.bid.merge(other.bid)
+        self.ask.merge(other.ask)
+        return self
+
+    @classmethod
+    def from_csv(
+        cls,
+        path: str,
+        resolution: float = 1e-3,
+        chunksize: int = 1_000_000,
+        columns: Optional[dict] = None
+    ) -> "IntensityCalibrator":
+        """
+        Reads a fill log chunk by chunk.
+
+        Args:
+            path (str): CSV file with one row per resting quote.
+            resolution (float): Bin width for quote distances.
+            chunksize (int): Rows read per chunk.
+            columns (dict, optional): Mapping from "side", "delta", "duration",
+                "fills" to the column names in the file.
+        """
+        import pandas as pd
+
+        names = {"side": "side", "delta": "delta", "duration": "duration", "fills": "fills"}
+        names.update(columns or {})
+        calibrator = cls(resolution)
+        for chunk in pd.read_csv(path, usecols=list(names.values()), chunksize=chunksize):
+            calibrator.partial_fit(
+                chunk[names["side"]].to_numpy(),
+                chunk[names["delta"]].to_numpy(),
+                chunk[names["duration"]].to_numpy(),
+                chunk[names["fills"]].to_numpy()
+            )
+        return calibrator
+
+    def fit(self, n_bootstrap: int = 0, confidence: float = 0.95, n_jobs: int = 1,
+            seed: Optional[int] = None) -> AsymmetricIntensityEstimate:
+        """Fits bid and ask sides separately."""
+        seeds = np.random.SeedSequence(seed).generate_state(2)
+        return AsymmetricIntensityEstimate(
+            bid=fit_intensity(self.bid, n_bootstrap, confidence, n_jobs, int(seeds[0])),
+            ask=fit_intensity(self.ask, n_bootstrap, confidence, n_jobs, int(seeds[1]))
+        )
+
+    def fit_pooled(self, n_bootstrap: int = 0, confidence: float = 0.95, n_jobs: int = 1,
+                   seed: Optional[int] = None) -> IntensityEstimate:
+        """Fits a single (A, k) to both sides, for the symmetric execution models."""
+        pooled = IntensityAccumulator(self.resolution).merge(self.bid).merge(self.ask)
+        return fit_intensity(pooled, n_bootstrap, confidence, n_jobs, seed)
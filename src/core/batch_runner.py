@@ -0,0 +1,232 @@
+# core/batch_runner.py
+import copy
+
+import numpy as np
+
+
+class BatchSimulationRunner:
+    """
+    Batched counterpart of `SimulationRunner` for one asset and many paths.
+
+    The whole price matrix comes from `market.simulate_paths`, and every step
+    quotes, fills and books all paths with array operations, using the same
+    strategy and (batched) execution objects as the other runners, e.g.
+    `BatchPoissonExecution`. With a stochastic-volatility market (one exposing
+    `variance_paths`) every step passes each path's variance and mid-price to
+    `strategy.update_variance`, as `SimulationRunner` does for a single path.
+
+    Precision: with `dtype=np.float32` the price, quote, inventory-as-float and
+    random-number arrays are float32, which halves their memory traffic. Cash is
+    always accumulated in float64, because a float32 running sum of fill prices
+    loses about one unit in the last place (~8e-6 at a price of 100) per fill.
+    Quote rounding itself is unbiased at the float32 level (relative 6e-8).
+    `src.benchmarks.bench_precision` measures throughput and accuracy against
+    the float64 reference.
+
+    Sensitivities: with `sensitivities=("gamma", "k", "sigma")` the same pass
+    also estimates the derivatives of expected PnL and of the terminal
+    inventory variance with respect to those model parameters. A parameter
+    perturbs the strategy attribute of that name, and additionally the
+    execution intensity decay for "k" and the simulated volatility for "sigma",
+    so it moves all quantities that a parameter sweep moves together. The
+    estimator combines two terms:
+
+    - Pathwise: with fills held fixed, the fill prices and (for sigma) the price
+      path move with the parameter. Quote derivatives are central differences
+      of the strategy's own formulas; dS/dsigma comes from the market's
+      `sigma_sensitivity`.
+    - Likelihood ratio: each side is a Bernoulli fill with probability
+      p = lambda * dt, so a path carries the score
+      Σ d log p/dθ over fills minus Σ p/(1 - p) * d log p/dθ over misses.
+
+    d E[PnL]/dθ = E[dPnL/dθ + (PnL - mean PnL) * score], where subtracting the
+    mean (the score has mean zero) removes most of the likelihood-ratio noise.
+    The execution supplies its own fill model through `intensities` and
+    `log_intensity_gradients`, next to `fill_decisions` and `book_fills`:
+    `BatchPoissonExecution` fills each side at A * exp(-k * δ) with δ its
+    distance to the mid, `BatchPoissonOrderExecution` both sides at
+    A * exp(-k * spread / 2) like the `run_simulations` sweep. Executions
+    without them are rejected.
+    """
+
+    def __init__(self, market, pricing_strategy, order_execution, n_paths: int, dt: float, T: float,
+                 initial_cash: float = 0.0, initial_inventory: int = 0, dtype=np.float64,
+                 sensitivities: tuple = ()):
+        """
+        Args:
+            market (MarketSimulator): Simulator providing `simulate_paths`.
+            pricing_strategy (PricingStrategy): Strategy whose formulas accept arrays.
+            order_execution (OrderExecution): Batched execution such as `BatchPoissonExecution`.
+            n_paths (int): Number of simulated paths.
+            dt (float): Time step.
+            T (float): Horizon.
+            initial_cash (float): Cash per path at t = 0 of every run.
+            initial_inventory (int): Inventory per path at t = 0 of every run.
+            dtype (np.dtype): Precision of prices and quotes (np.float64 or np.float32).
+            sensitivities (tuple of str): Parameters ("gamma", "k", "sigma") whose
+                local sensitivities are estimated alongside the run.
+        """
+        unknown = set(sensitivities) - set(getattr(type(pricing_strategy), "vectorized_parameters", ()))
+        if unknown:
+            raise ValueError(f"{type(pricing_strategy).__name__} has no differentiable parameters {sorted(unknown)}")
+        if "sigma" in sensitivities and not hasattr(market, "sigma_sensitivity"):
+            raise ValueError(f"{type(market).__name__} does not provide sigma_sensitivity")
+        if sensitivities and getattr(pricing_strategy, "use_market_variance", False):
+            raise ValueError("sensitivities need a constant-volatility strategy (use_market_variance=False)")
+        if sensitivities and not callable(getattr(order_execution, "log_intensity_gradients", None)):
+            raise ValueError(f"{type(order_execution).__name__} does not provide the fill-model gradients "
+                             f"(intensities and log_intensity_gradients) that sensitivities need")
+        self.market = market
+        self.strategy = pricing_strategy
+        self.execution = order_execution
+        self.n_paths = n_paths
+        self.dt = dt
+        self.T = T
+        self.steps = int(T / dt)
+        self.dtype = np.dtype(dtype)
+        self.initial_cash = initial_cash
+        self.initial_inventory = initial_inventory
+        self.sensitivities = tuple(sensitivities)
+        self.reset()
+
+    def reset(self) -> None:
+        """Restores every path's inventory and cash to their initial values."""
+        self.inventory = np.full(self.n_paths, self.initial_inventory, dtype=np.int64)
+        self.cash = np.full(self.n_paths, self.initial_cash, dtype=np.float64)
+
+    def _perturbed_strategies(self, name: str) -> tuple:
+        """Float64 copies of the strategy with `name` moved by ±h, and h."""
+        value = getattr(self.strategy, name)
+        h = 1e-5 * max(abs(value), 1e-3)
+        shifted = []
+        for sign in (1, -1):
+            strategy = copy.copy(self.strategy)
+            setattr(strategy, name, value + sign * h)
+            if hasattr(strategy, "dtype"):
+                strategy.dtype = np.float64
+            shifted.append(strategy)
+        return shifted[0], shifted[1], h
+
+    @staticmethod
+    def _quotes(strategy, current_price, inventory, time_remaining) -> tuple:
+        reservation_price = strategy.calculate_reservation_price(current_price, inventory, time_remaining)
+        bid_spread, ask_spread = strategy.calculate_spread(current_price, inventory, time_remaining)
+        return reservation_price - bid_spread, reservation_price + ask_spread
+
+    def run(self) -> dict:
+        """
+        Returns:
+            dict: Per-path "inventory", "cash", "pnl" and "final_price" arrays of
+            shape (n_paths,), plus the mean quoted spread per path in "spread".
+            With `sensitivities`, "sensitivities" maps each parameter to the
+            estimates "pnl" and "inventory_variance" (derivatives of E[PnL] and
+            Var[inventory]) and their standard errors "pnl_se" and
+            "inventory_variance_se".
+        """
+        self.reset()
+        mid_prices = self.market.simulate_paths(self.n_paths, self.steps).astype(self.dtype, copy=False)
+        # Stochastic-volatility simulators expose the variance of every path and step
+        variance_paths = getattr(self.market, "variance_paths", None)
+        initial_wealth = self.cash + self.inventory * mid_prices[:, 0].astype(np.float64)
+        spread_sum = np.zeros(self.n_paths, dtype=np.float64)
+
+        if self.sensitivities:
+            perturbed = {name: self._perturbed_strategies(name) for name in self.sensitivities}
+            price_derivative = (self.market.sigma_sensitivity(mid_prices.astype(np.float64))
+                                if "sigma" in self.sensitivities else None)
+            # Pathwise derivative of the booked cash and likelihood-ratio score, per parameter
+            cash_derivative = {name: np.zeros(self.n_paths) for name in self.sensitivities}
+            score = {name: np.zeros(self.n_paths) for name in self.sensitivities}
+
+        for i in range(self.steps):
+            time_remaining = self.T - i * self.dt
+            current_price = mid_prices[:, i]
+            # Inventory is exact in float32 up to 2**24 and keeps the quote arithmetic in dtype
+            inventory_level = self.inventory.astype(self.dtype)
+            if variance_paths is not None:
+                # Strategy formulas are elementwise, so sigma becomes one value per path
+                self.strategy.update_variance(variance_paths[:, i], current_price=current_price)
+
+            reservation_price = self.strategy.calculate_reservation_price(
+                current_price=current_price,
+                inventory=inventory_level,
+                time_remaining=time_remaining
+            )
+            bid_spread, ask_spread = self.strategy.calculate_spread(
+                current_price=current_price,
+                inventory=inventory_level,
+                time_remaining=time_remaining
+            )
+            bid_price = reservation_price - bid_spread
+            ask_price = reservation_price + ask_spread
+            spread_sum += ask_price - bid_price
+
+            if not self.sensitivities:
+                self.inventory, self.cash = self.execution.execute_orders(
+                    bid_price=bid_price,
+                    ask_price=ask_price,
+                    inventory=self.inventory,
+                    cash=self.cash,
+                    dt=self.dt,
+                    mid_price=current_price
+                )
+                continue
+
+            bid_filled, ask_filled = self.execution.fill_decisions(bid_price, ask_price, current_price, self.dt)
+            price = current_price.astype(np.float64)
+            inventory64 = self.inventory.astype(np.float64)
+            bid64, ask64 = bid_price.astype(np.float64), ask_price.astype(np.float64)
+            intensities = self.execution.intensities(bid64, ask64, price)
+            gradients = self.execution.log_intensity_gradients(bid64, ask64, price)
+            for name, (plus, minus, h) in perturbed.items():
+                dS = price_derivative[:, i] if name == "sigma" else 0.0
+                bid_plus, ask_plus = self._quotes(plus, price + h * dS, inventory64, time_remaining)
+                bid_minus, ask_minus = self._quotes(minus, price - h * dS, inventory64, time_remaining)
+                d_bid = (bid_plus - bid_minus) / (2 * h)
+                d_ask = (ask_plus - ask_minus) / (2 * h)
+                cash_derivative[name] += d_ask * ask_filled - d_bid * bid_filled
+
+                # "k" also shifts the decay of the fill intensity
+                dk = 1.0 if name == "k" else 0.0
+                for intensity, gradient, filled in zip(intensities, gradients, (bid_filled, ask_filled)):
+                    p = intensity * self.dt
+                    with np.errstate(divide="ignore", invalid="ignore"):
+                        d_log_p = (gradient["bid"] * d_bid + gradient["ask"] * d_ask
+                                   + gradient["mid"] * dS + gradient["k"] * dk)
+                        miss = np.where(p < 1, -p / (1 - p), 0.0)
+                    # Sides filled with certainty (p >= 1) or never (p = 0) carry no score
+                    scored = (p > 0) & (p < 1)
+                    score[name] += np.where(scored, np.where(filled, d_log_p, miss * d_log_p), 0.0)
+
+            self.inventory, self.cash = self.execution.book_fills(
+                bid_price, ask_price, bid_filled, ask_filled, self.inventory, self.cash
+            )
+
+        final_price = mid_prices[:, -1].astype(np.float64)
+        wealth = self.cash + self.inventory * final_price
+        pnl = wealth - initial_wealth
+        result = {
+            "inventory": self.inventory,
+            "cash": self.cash,
+            "pnl": pnl,
+            "final_price": final_price,
+            "spread": spread_sum / max(self.steps, 1)
+        }
+        if self.sensitivities:
+            result["sensitivities"] = {}
+            inventory = self.inventory.astype(np.float64)
+            for name in self.sensitivities:
+                pathwise = cash_derivative[name]
+                if name == "sigma":
+                    pathwise = pathwise + inventory * price_derivative[:, -1]
+                pnl_terms = pathwise + (pnl - pnl.mean()) * score[name]
+                # Var(q) = E[q²] - E[q]²; fills do not move q pathwise, so only the score contributes
+                q_centred = inventory - inventory.mean()
+                variance_terms = (q_centred ** 2 - q_centred.var()) * score[name]
+                result["sensitivities"][name] = {
+                    "pnl": pnl_terms.mean(),
+                    "pnl_se": pnl_terms.std(ddof=1) / np.sqrt(self.n_paths),
+                    "inventory_variance": variance_terms.mean(),
+                    "inventory_variance_se": variance_terms.std(ddof=1) / np.sqrt(self.n_paths)
+                }
+        return result
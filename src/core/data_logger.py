@@ -1,7 +1,20 @@
 # core/data_logger.py
-import pandas as pd
+import numpy as np
+
+# Columns kept in float64 whatever the logger precision: cash and wealth are
+# running sums, where float32 rounding would accumulate
+ACCUMULATED_COLUMNS = ('cash', 'wealth')
+
+
 class DataLogger:
-    def __init__(self):
+    def __init__(self, dtype=np.float64):
+        """
+        Args:
+            dtype (np.dtype): Floating-point type of the price and quote columns
+                of `get_dataframe` (np.float32 halves the DataFrame's memory; values
+                are collected as Python floats until then); cash and wealth stay float64.
+        """
+        self.dtype = np.dtype(dtype)
         self.data = {
             'mid_prices': [],
             'bid_prices': [],
@@ -16,4 +29,16 @@ class DataLogger:
         self.data[key].append(value)
 
     def get_dataframe(self):
-        return pd.DataFrame(self.data)
+        # pandas is only needed once results are collected, not by simulation workers
+        import pandas as pd
+        if self.dtype == np.float64:
+            return pd.DataFrame(self.data)
+        columns = {}
+        for key, values in self.data.items():
+            if key == 'inventory':
+                columns[key] = np.asarray(values, dtype=np.int64)
+            elif key in ACCUMULATED_COLUMNS:
+                columns[key] = np.asarray(values, dtype=np.float64)
+            else:
+                columns[key] = np.asarray(values, dtype=self.dtype)
+        return pd.DataFrame(columns)
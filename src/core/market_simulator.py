@@ -7,3 +7,15 @@ class MarketSimulator(ABC):
     def simulate(self, steps: int) -> np.ndarray:
         """Simulate mid-prices and return an array of prices."""
         pass
+
+    def simulate_paths(self, n_paths: int, steps: int) -> np.ndarray:
+        """
+        Simulate several independent mid-price paths.
+
+        Subclasses with a vectorized generator should override this; the default
+        simply stacks repeated calls to `simulate`.
+
+        Returns:
+            np.ndarray: Price matrix of shape (n_paths, steps + 1).
+        """
+        return np.vstack([self.simulate(steps) for _ in range(n_paths)])
@@ -0,0 +1,140 @@
+# core/multi_agent_runner.py
+import copy
+
+import numpy as np
+
+
+class _QuoteGroup:
+    """
+    Agents whose quotes are evaluated in a single vectorized call.
+
+    Strategies that declare `vectorized_parameters` have quote formulas that are
+    elementwise in those parameters. Agents of the same class that only differ in
+    them are merged into one strategy instance holding parameter arrays of shape
+    (n_group,), which broadcasts against prices of shape (n_paths, 1) and
+    inventory of shape (n_paths, n_group). Every other agent forms its own group.
+    """
+
+    def __init__(self, strategies: list, columns: list):
+        # Contiguous agents are addressed with a slice to avoid fancy-indexing copies
+        contiguous = list(columns) == list(range(columns[0], columns[0] + len(columns)))
+        self.columns = slice(columns[0], columns[0] + len(columns)) if contiguous else np.asarray(columns)
+        if len(strategies) == 1:
+            self.strategy = strategies[0]
+            return
+        self.strategy = copy.copy(strategies[0])
+        for name in type(self.strategy).vectorized_parameters:
+            setattr(self.strategy, name, np.array([getattr(s, name) for s in strategies], dtype=float))
+
+    def quotes(self, current_price: np.ndarray, inventory: np.ndarray, time_remaining: float):
+        price = current_price[:, None]
+        q = inventory[:, self.columns]
+        reservation_price = self.strategy.calculate_reservation_price(price, q, time_remaining)
+        bid_spread, ask_spread = self.strategy.calculate_spread(price, q, time_remaining)
+        return (np.broadcast_to(reservation_price - bid_spread, q.shape),
+                np.broadcast_to(reservation_price + ask_spread, q.shape))
+
+
+def _group_strategies(strategies: list) -> list:
+    groups = {}
+    singles = []
+    for column, strategy in enumerate(strategies):
+        params = getattr(type(strategy), "vectorized_parameters", None)
+        if not params:
+            singles.append(_QuoteGroup([strategy], [column]))
+            continue
+        # Agents are only merged when all non-vectorized attributes agree
+        shared = tuple(sorted((name, repr(value)) for name, value in vars(strategy).items() if name not in params))
+        groups.setdefault((type(strategy), shared), []).append(column)
+    merged = [_QuoteGroup([strategies[c] for c in columns], columns) for columns in groups.values()]
+    return merged + singles
+
+
+class MultiAgentSimulationRunner:
+    """
+    Runs N competing market makers against one shared stream of market orders.
+
+    All agents observe the same mid-price path and quote simultaneously; the
+    order flow (`CompetitiveOrderFlow`, or anything with the same `allocate` and
+    `apply_fills` methods) routes each market order to the best quote. Per-agent inventory and cash are kept in (n_paths, n_agents)
+    arrays, and agents with vectorizable strategies are quoted in one call per
+    group, so the cost per step does not grow with a Python loop over agents.
+    As in `SimulationRunner`, the price path comes from `market.simulate_paths`.
+    Strategies must quote with a constant sigma: `use_market_variance=True` is
+    rejected, since merged groups cannot hold a per-path volatility. Every
+    `run` starts from `initial_cash` and `initial_inventory` again, so an
+    instance can be run repeatedly.
+    """
+
+    def __init__(self, market, strategies: list, order_flow, n_paths: int, dt: float, T: float,
+                 initial_cash: float = 0.0, initial_inventory: int = 0):
+        if any(getattr(strategy, "use_market_variance", False) for strategy in strategies):
+            # Merged quote groups hold one sigma per agent, not one per path and agent
+            raise ValueError("MultiAgentSimulationRunner does not feed market variance to strategies; "
+                             "use use_market_variance=False")
+        self.market = market
+        self.strategies = list(strategies)
+        self.order_flow = order_flow
+        self.n_paths = n_paths
+        self.dt = dt
+        self.T = T
+        self.steps = int(T / dt)
+        self.initial_cash = initial_cash
+        self.initial_inventory = initial_inventory
+        self.reset()
+        self._groups = _group_strategies(self.strategies)
+
+    def reset(self) -> None:
+        """Restores every agent's inventory and cash to their initial values."""
+        self.inventory = np.full((self.n_paths, len(self.strategies)), self.initial_inventory, dtype=np.int64)
+        self.cash = np.full((self.n_paths, len(self.strategies)), self.initial_cash, dtype=np.float64)
+
+    def quotes(self, current_price: np.ndarray, time_remaining: float) -> tuple[np.ndarray, np.ndarray]:
+        """Return (bid_prices, ask_prices) of shape (n_paths, n_agents)."""
+        # Quotes follow the precision of the simulated prices; cash stays float64
+        bid_price = np.empty(self.inventory.shape, dtype=current_price.dtype)
+        ask_price = np.empty(self.inventory.shape, dtype=current_price.dtype)
+        for group in self._groups:
+            bid_price[:, group.columns], ask_price[:, group.columns] = group.quotes(
+                current_price, self.inventory, time_remaining
+            )
+        return bid_price, ask_price
+
+    def run(self) -> dict:
+        """
+        Returns:
+            dict: Per-agent "inventory", "cash" and "pnl" arrays of shape
+            (n_paths, n_agents), the "bid_fills"/"ask_fills" counts won by each
+            agent, and each agent's "market_share" of all fills.
+        """
+        self.reset()
+        mid_prices = self.market.simulate_paths(self.n_paths, self.steps)
+        initial_wealth = self.cash + self.inventory * mid_prices[:, :1]
+        bid_fills = np.zeros(self.inventory.shape, dtype=np.int64)
+        ask_fills = np.zeros(self.inventory.shape, dtype=np.int64)
+
+        for i in range(self.steps):
+            time_remaining = self.T - i * self.dt
+            current_price = mid_prices[:, i]
+            bid_price, ask_price = self.quotes(current_price, time_remaining)
+
+            allocation = self.order_flow.allocate(bid_price, ask_price, current_price, self.dt)
+            self.order_flow.apply_fills(allocation, bid_price, ask_price, self.inventory, self.cash)
+
+            # Each path has at most one winner per side, so fancy += is safe
+            bid_winner, bid_filled, ask_winner, ask_filled = allocation
+            rows = np.flatnonzero(bid_filled)
+            bid_fills[rows, bid_winner[rows]] += 1
+            rows = np.flatnonzero(ask_filled)
+            ask_fills[rows, ask_winner[rows]] += 1
+
+        wealth = self.cash + self.inventory * mid_prices[:, -1:]
+        total_fills = bid_fills + ask_fills
+        return {
+            "inventory": self.inventory,
+            "cash": self.cash,
+            "pnl": wealth - initial_wealth,
+            "bid_fills": bid_fills,
+            "ask_fills": ask_fills,
+            "market_share": total_fills.sum(axis=0) / max(total_fills.sum(), 1)
+        }
@@ -0,0 +1,90 @@
+# core/multi_asset_runner.py
+import numpy as np
+
+from src.core.portfolio_state import PortfolioState
+
+
+class MultiAssetSimulationRunner:
+    """
+    Batched counterpart of `SimulationRunner` for many assets and paths.
+
+    Every step evaluates the strategy, the fills and the portfolio update for all
+    (path, asset) pairs with array operations, and advances the correlated market
+    with `market.step`, so no price matrix of size paths x steps x assets is ever
+    materialised. Unlike the single-asset simulators, which normalise their
+    horizon to one, prices are advanced with the runner's own `dt`.
+    A market and a strategy that both state the units of their covariance
+    (`log_returns`) must agree on them.
+    """
+
+    def __init__(self, market, pricing_strategy, order_execution, portfolio: PortfolioState,
+                 dt: float, T: float, record_wealth: bool = False):
+        market_units = getattr(market, "log_returns", None)
+        strategy_units = getattr(pricing_strategy, "log_returns", None)
+        if None not in (market_units, strategy_units) and market_units != strategy_units:
+            units = {True: "log-return", False: "mid-price"}
+            raise ValueError(f"{type(market).__name__} has a {units[market_units]} covariance but the strategy "
+                             f"expects a {units[strategy_units]} covariance; set log_returns={market_units}")
+        self.market = market
+        self.strategy = pricing_strategy
+        self.execution = order_execution
+        self.portfolio = portfolio
+        self.dt = dt
+        self.T = T
+        self.steps = int(T / dt)
+        self.record_wealth = record_wealth
+
+    def run(self) -> dict:
+        """
+        Returns:
+            dict: Terminal "prices", "inventory", "cash", "wealth" and "pnl" arrays,
+            plus "wealth_paths" of shape (n_paths, steps + 1) if record_wealth is set.
+        """
+        portfolio = self.portfolio
+        S = self.market.initial_prices(portfolio.n_paths)
+        initial_wealth = portfolio.wealth(S)
+        wealth_paths = np.empty((portfolio.n_paths, self.steps + 1)) if self.record_wealth else None
+
+        for i in range(self.steps):
+            time_remaining = self.T - i * self.dt
+            inventory_level = portfolio.inventory
+            cash = portfolio.cash
+            if wealth_paths is not None:
+                wealth_paths[:, i] = portfolio.wealth(S)
+
+            reservation_price = self.strategy.calculate_reservation_price(
+                current_price=S,
+                inventory=inventory_level,
+                time_remaining=time_remaining
+            )
+            bid_spread, ask_spread = self.strategy.calculate_spread(
+                current_price=S,
+                inventory=inventory_level,
+                time_remaining=time_remaining
+            )
+            bid_price = reservation_price - bid_spread
+            ask_price = reservation_price + ask_spread
+
+            new_inventory, new_cash = self.execution.execute_orders(
+                bid_price=bid_price,
+                ask_price=ask_price,
+                inventory=inventory_level,
+                cash=cash,
+                dt=self.dt,
+                mid_price=S
+            )
+            portfolio.update(new_inventory - inventory_level, new_cash - cash)
+
+            S = self.market.step(S, self.dt)
+
+        wealth = portfolio.wealth(S)
+        if wealth_paths is not None:
+            wealth_paths[:, -1] = wealth
+        return {
+            "prices": S,
+            "inventory": portfolio.inventory.copy(),
+            "cash": portfolio.cash.copy(),
+            "wealth": wealth,
+            "pnl": wealth - initial_wealth,
+            "wealth_paths": wealth_paths
+        }
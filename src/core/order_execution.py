@@ -1,6 +1,29 @@
 # core/order_execution.py
 from abc import ABC, abstractmethod
 
+import numpy as np
+
+
+def quoted_spreads(bid_price: float, ask_price: float, mid_price=None) -> tuple[float, float]:
+    """
+    Spread that drives the fill intensity of each side in the spread-based executions.
+
+    With both sides quoted this is ask - bid for both. A side quoted at an
+    infinite distance (e.g. at an inventory bound) gets an infinite spread, so
+    it is never filled; the other side is then priced like a symmetric book at
+    its own distance from the mid-price, 2 * |quote - mid|.
+    """
+    bid_quoted, ask_quoted = np.isfinite(bid_price), np.isfinite(ask_price)
+    if bid_quoted and ask_quoted:
+        spread = ask_price - bid_price
+        return spread, spread
+    if (bid_quoted or ask_quoted) and mid_price is None:
+        raise ValueError("a one-sided quote needs the mid-price to set the quoted side's fill intensity")
+    bid_spread = 2 * (mid_price - bid_price) if bid_quoted else np.inf
+    ask_spread = 2 * (ask_price - mid_price) if ask_quoted else np.inf
+    return bid_spread, ask_spread
+
+
 class OrderExecution(ABC):
     @abstractmethod
     def execute_orders(
@@ -9,7 +32,8 @@ class OrderExecution(ABC):
         ask_price: float,
         inventory: int,
         cash: float,
-        dt: float
+        dt: float,
+        mid_price=None
     ) -> tuple[int, float]:
         """Return updated (inventory, cash) after order execution."""
         pass
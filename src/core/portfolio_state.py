@@ -0,0 +1,33 @@
+# core/portfolio_state.py
+import numpy as np
+
+
+class PortfolioState:
+    """
+    Struct-of-arrays counterpart of `InventoryManager` for batched multi-asset runs.
+
+    Attributes:
+        inventory (np.ndarray): Integer holdings of shape (n_paths, n_assets).
+        cash (np.ndarray): Cash per path of shape (n_paths,), kept in float64.
+    """
+
+    def __init__(self, n_paths: int, n_assets: int, initial_cash: float = 0.0, initial_inventory=0):
+        self.inventory = np.empty((n_paths, n_assets), dtype=np.int64)
+        self.inventory[:] = initial_inventory
+        self.cash = np.full(n_paths, initial_cash, dtype=np.float64)
+
+    @property
+    def n_paths(self) -> int:
+        return self.inventory.shape[0]
+
+    @property
+    def n_assets(self) -> int:
+        return self.inventory.shape[1]
+
+    def update(self, delta_inventory: np.ndarray, delta_cash: np.ndarray):
+        self.inventory += delta_inventory
+        self.cash += delta_cash
+
+    def wealth(self, prices: np.ndarray) -> np.ndarray:
+        """Mark-to-market value per path for prices of shape (n_paths, n_assets)."""
+        return self.cash + np.einsum("pa,pa->p", self.inventory, prices)
@@ -11,3 +11,10 @@ class PricingStrategy(ABC):
     def calculate_spread(self, current_price: float, inventory: int, time_remaining: float) -> tuple[float, float]:
         """Return (bid_spread, ask_spread) relative to reservation price."""
         pass
+
+    def update_variance(self, variance: float, current_price=None) -> None:
+        """
+        Receive the market's instantaneous variance of log returns, and the mid-price
+        it applies to. Constant-volatility strategies ignore it.
+        """
+        pass
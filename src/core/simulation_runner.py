@@ -5,7 +5,6 @@ from src.core.inventory_manager import InventoryManager
 from src.core.market_simulator import MarketSimulator
 from src.core.order_execution import OrderExecution
 from src.core.pricing_strategy import PricingStrategy
-import matplotlib.pyplot as plt
 
 # core/simulation_runner.py
 
@@ -23,6 +22,8 @@ class SimulationRunner:
     def run(self):
 
         mid_prices = self.market.simulate(self.steps)
+        # Stochastic-volatility simulators expose the variance used at each step
+        variance_path = getattr(self.market, "variance_path", None)
 
 
         for i in range(self.steps):
@@ -31,7 +32,8 @@ class SimulationRunner:
             current_price = mid_prices[i]
             inventory_level = self.inventory.inventory
             cash = self.inventory.cash
-
+            if variance_path is not None:
+                self.strategy.update_variance(variance_path[i], current_price=current_price)
 
             # Get pricing from strategy
             reservation_price = self.strategy.calculate_reservation_price(
@@ -57,7 +59,8 @@ class SimulationRunner:
                 ask_price=ask_price,
                 inventory=inventory_level,
                 cash=cash,
-                dt=self.dt
+                dt=self.dt,
+                mid_price=current_price
             )
             self.inventory.update(new_inventory - inventory_level, new_cash - cash)
 
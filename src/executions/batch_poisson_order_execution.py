@@ -0,0 +1,64 @@
+import numpy as np
+from typing import Optional
+from src.executions.batch_poisson_execution import BatchPoissonExecution
+
+
+class BatchPoissonOrderExecution(BatchPoissonExecution):
+    """
+    Vectorized counterpart of `PoissonOrderExecution` for many paths at once.
+
+    Both sides are filled with probability A * exp(-k * spread / 2) * dt, where
+    spread = ask - bid, so the intensity does not depend on where the quotes
+    sit around the mid. As in `quoted_spreads`, a side quoted at an infinite
+    distance is never filled and the other side is then priced at twice its
+    own distance from the mid. This is the fill model of the
+    `main_loops.run_simulations` sweep.
+    """
+
+    def __init__(self, A, k, seed: Optional[int] = None, dtype=np.float64, uniform_source=None):
+        """
+        Args:
+            A (float or array-like): Base intensity (per asset if an array).
+            k (float or array-like): Intensity decay (per asset if an array).
+            seed (int, optional): Seed for the random generator.
+            dtype (np.dtype): Floating-point type of the intensities and uniform
+                draws. Cash is always accumulated in float64.
+            uniform_source (SobolNormalSource, optional): Quasi-random fill draws,
+                with one bid and one ask stream per asset.
+        """
+        super().__init__(A, k, seed=seed, dtype=dtype, uniform_source=uniform_source)
+
+    @staticmethod
+    def _spreads(bid_price, ask_price, mid_price):
+        # Infinite quotes make ask - bid infinite for the quoted side too, so that side falls back to its depth
+        with np.errstate(invalid="ignore"):
+            bid_spread = np.where(np.isfinite(ask_price), ask_price - bid_price, 2 * (mid_price - bid_price))
+            ask_spread = np.where(np.isfinite(bid_price), ask_price - bid_price, 2 * (ask_price - mid_price))
+        return bid_spread, ask_spread
+
+    def intensities(self, bid_price, ask_price, mid_price):
+        """Return the fill intensities (lambda_bid, lambda_ask) of the quotes."""
+        bid_spread, ask_spread = self._spreads(bid_price, ask_price, mid_price)
+        return self.A * np.exp(-self.k * bid_spread / 2), self.A * np.exp(-self.k * ask_spread / 2)
+
+    def log_intensity_gradients(self, bid_price, ask_price, mid_price):
+        """
+        Partial derivatives of log lambda_bid and log lambda_ask, keyed as in
+        `BatchPoissonExecution.log_intensity_gradients`.
+        """
+        bid_spread, ask_spread = self._spreads(bid_price, ask_price, mid_price)
+        half_k = self.k / 2
+        ask_quoted, bid_quoted = np.isfinite(ask_price), np.isfinite(bid_price)
+        bid = {
+            "bid": np.where(ask_quoted, half_k, self.k),
+            "ask": np.where(ask_quoted, -half_k, 0.0),
+            "mid": np.where(ask_quoted, 0.0, -self.k),
+            "k": -bid_spread / 2
+        }
+        ask = {
+            "bid": np.where(bid_quoted, half_k, 0.0),
+            "ask": np.where(bid_quoted, -half_k, -self.k),
+            "mid": np.where(bid_quoted, 0.0, self.k),
+            "k": -ask_spread / 2
+        }
+        return bid, ask
@@ -0,0 +1,74 @@
+import numpy as np
+from typing import Optional
+from src.core.order_execution import OrderExecution
+
+
+class CompetitiveOrderFlow(OrderExecution):
+    """
+    One stream of market orders shared by several competing market makers.
+
+    In each step and path a market sell arrives and trades with the best bid with
+    probability A * exp(-k * δ_bid) * dt, where δ_bid is the distance of the best
+    bid from the mid-price (likewise market buys against the best ask). The whole
+    unit goes to the agent quoting the best price; ties are broken uniformly at
+    random. Quotes, inventory and cash have shape (n_paths, n_agents).
+    """
+
+    def __init__(self, A: float, k: float, seed: Optional[int] = None, dtype=np.float64):
+        """
+        Args:
+            A (float): Base arrival intensity of market orders.
+            k (float): Decay of the intensity with the distance of the best quote.
+            seed (int, optional): Seed for the random generator.
+            dtype (np.dtype): Floating-point type of the uniform fill draws.
+        """
+        self.A = A
+        self.k = k
+        self.dtype = np.dtype(dtype)
+        self.rng = np.random.default_rng(seed)
+
+    def _best_quote_winner(self, quotes: np.ndarray, best: np.ndarray) -> np.ndarray:
+        at_best = quotes == best[:, None]
+        winner = at_best.argmax(axis=1)
+        # Random priority among the agents tied at the best price, only where needed
+        tied = np.flatnonzero(at_best.sum(axis=1) > 1)
+        if tied.size:
+            priority = np.where(at_best[tied], self.rng.random((tied.size, quotes.shape[1])), -1.0)
+            winner[tied] = priority.argmax(axis=1)
+        return winner
+
+    def allocate(self, bid_price: np.ndarray, ask_price: np.ndarray, mid_price: np.ndarray, dt: float):
+        """
+        Returns:
+            (bid_winner, bid_filled, ask_winner, ask_filled): per-path index of the
+            agent holding the best quote and whether a market order traded with it.
+        """
+        best_bid = bid_price.max(axis=1)
+        best_ask = ask_price.min(axis=1)
+        n_paths = bid_price.shape[0]
+        bid_filled = self.rng.random(n_paths, dtype=self.dtype) < self.A * np.exp(-self.k * (mid_price - best_bid)) * dt
+        ask_filled = self.rng.random(n_paths, dtype=self.dtype) < self.A * np.exp(-self.k * (best_ask - mid_price)) * dt
+        # Ranking by -ask turns the best (lowest) ask into a maximum as well
+        return (self._best_quote_winner(bid_price, best_bid), bid_filled,
+                self._best_quote_winner(-ask_price, -best_ask), ask_filled)
+
+    @staticmethod
+    def apply_fills(allocation, bid_price, ask_price, inventory, cash) -> None:
+        """Books the fills returned by `allocate` into inventory and cash in place."""
+        bid_winner, bid_filled, ask_winner, ask_filled = allocation
+        rows = np.flatnonzero(bid_filled)
+        inventory[rows, bid_winner[rows]] += 1
+        cash[rows, bid_winner[rows]] -= bid_price[rows, bid_winner[rows]]
+
+        rows = np.flatnonzero(ask_filled)
+        inventory[rows, ask_winner[rows]] -= 1
+        cash[rows, ask_winner[rows]] += ask_price[rows, ask_winner[rows]]
+
+    def execute_orders(self, bid_price, ask_price, inventory, cash, dt: float, mid_price=None):
+        if mid_price is None:
+            mid_price = (bid_price.max(axis=1) + ask_price.min(axis=1)) / 2
+        allocation = self.allocate(bid_price, ask_price, mid_price, dt)
+        inventory = inventory.copy()
+        cash = cash.copy()
+        self.apply_fills(allocation, bid_price, ask_price, inventory, cash)
+        return inventory, cash
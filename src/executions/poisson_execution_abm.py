@@ -1,10 +1,12 @@
 import numpy as np
-from src.core.order_execution import OrderExecution
+from src.core.order_execution import OrderExecution, quoted_spreads
 
 class PoissonExecutionAbm(OrderExecution):
-    def __init__(self, A: float, k: float):
+    def __init__(self, A: float, k: float, uniform_source=None):
         self.A = A
         self.k = k
+        # Optional quasi-random fill draws (SobolNormalSource with uniform_streams=2)
+        self.uniform_source = uniform_source
 
     def execute_orders(
         self,
@@ -12,17 +14,24 @@ class PoissonExecutionAbm(OrderExecution):
         ask_price: float,
         inventory: int,
         cash: float,
-        dt: float
+        dt: float,
+        mid_price=None
     ) -> tuple[int, float]:
-        spread = ask_price - bid_price
-        lambda_bid = self.A * np.exp(-self.k * spread)
-        lambda_ask = self.A * np.exp(-self.k * spread)
+        # An unquoted (infinite) side is never filled
+        spread_bid, spread_ask = quoted_spreads(bid_price, ask_price, mid_price)
+        lambda_bid = self.A * np.exp(-self.k * spread_bid)
+        lambda_ask = self.A * np.exp(-self.k * spread_ask)
 
-        if np.random.rand() < lambda_bid * dt:
+        if self.uniform_source is None:
+            u_bid, u_ask = np.random.rand(), np.random.rand()
+        else:
+            u_bid, u_ask = self.uniform_source.next_uniforms()[0]
+
+        if u_bid < lambda_bid * dt:
             cash -= bid_price
             inventory += 1
 
-        if np.random.rand() < lambda_ask * dt:
+        if u_ask < lambda_ask * dt:
             cash += ask_price
             inventory -= 1
 
@@ -0,0 +1,79 @@
+# live/latency.py
+
+
+class LatencyHistogram:
+    """
+    Log-linear latency histogram with bounded memory (HDR-histogram style).
+
+    Values below 2^significant_bits nanoseconds get their own bucket; above
+    that, each power of two is split into 2^(significant_bits - 1) buckets, so
+    every recorded value is known to within a relative error of about
+    2^-(significant_bits - 1) (under 1.6% with the default of 7 bits).
+    Recording is a few integer operations, cheap enough for the per-tick path.
+    """
+
+    def __init__(self, significant_bits: int = 7, max_value_ns: int = 60 * 10 ** 9):
+        self.significant_bits = significant_bits
+        self.half = 1 << (significant_bits - 1)
+        self.max_value_ns = max_value_ns
+        self.counts = [0] * (self._index(max_value_ns) + 1)
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def _index(self, value: int) -> int:
+        shift = value.bit_length() - self.significant_bits
+        if shift <= 0:
+            return value
+        return (1 << self.significant_bits) + (shift - 1) * self.half + ((value >> shift) - self.half)
+
+    def _bucket_value(self, index: int) -> float:
+        """Midpoint of a bucket in nanoseconds."""
+        first_scaled = 1 << self.significant_bits
+        if index < first_scaled:
+            return float(index)
+        shift, offset = divmod(index - first_scaled, self.half)
+        shift += 1
+        return float(((self.half + offset) << shift) + (1 << (shift - 1)))
+
+    def record(self, value_ns: int) -> None:
+        value_ns = min(max(int(value_ns), 0), self.max_value_ns)
+        self.counts[self._index(value_ns)] += 1
+        self.count += 1
+        self.total_ns += value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        if other.significant_bits != self.significant_bits or len(other.counts) != len(self.counts):
+            raise ValueError("cannot merge histograms with different layouts")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total_ns += other.total_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+        return self
+
+    def percentile(self, p: float) -> float:
+        """Latency in nanoseconds below which p percent of the records fall."""
+        if self.count == 0:
+            return float("nan")
+        target = max(1, int(round(p / 100 * self.count)))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= target:
+                return min(self._bucket_value(index), float(self.max_ns))
+        return float(self.max_ns)
+
+    def summary(self) -> dict:
+        """p50 / p99 / p99.9 / max / mean latency in microseconds."""
+        if self.count == 0:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean_us": self.total_ns / self.count / 1e3,
+            "p50_us": self.percentile(50) / 1e3,
+            "p99_us": self.percentile(99) / 1e3,
+            "p99.9_us": self.percentile(99.9) / 1e3,
+            "max_us": self.max_ns / 1e3
+        }
@@ -0,0 +1,170 @@
+# live/quoting_engine.py
+import asyncio
+import time
+from typing import Callable, NamedTuple
+
+from src.core.inventory_manager import InventoryManager
+from src.core.pricing_strategy import PricingStrategy
+from src.live.latency import LatencyHistogram
+
+
+class Quote(NamedTuple):
+    timestamp: float
+    mid: float
+    bid: float
+    ask: float
+    inventory: int
+
+
+class QuotingEngine:
+    """
+    Drives a `PricingStrategy` from a live stream of mid-price ticks.
+
+    A producer task reads tick batches from a source (`FileReplayTickSource`,
+    `SocketTickSource`, ...) and the quoting loop answers with bid/ask quotes
+    using the same strategy objects as `SimulationRunner`. With `coalesce`
+    enabled only the newest unquoted tick is priced: ticks that were superseded
+    before the loop got to them are stale and skipped, so a burst never builds
+    a backlog. Fills reported through `on_fill` update the `InventoryManager`
+    and trigger an immediate re-quote at the last known mid.
+
+    Tick-to-quote latency runs from the tick's own arrival, as stamped by the
+    source, until all listeners were called, so time a tick spent waiting
+    behind earlier ticks of its batch is included. A coalesced quote answers
+    every tick it superseded and is timed from the oldest of them; a re-quote
+    after a fill is timed from the fill. The histogram is kept in `latency`.
+    """
+
+    def __init__(
+        self,
+        strategy: PricingStrategy,
+        inventory: InventoryManager,
+        horizon: float,
+        time_scale: float = 1.0,
+        coalesce: bool = True
+    ):
+        """
+        Args:
+            strategy (PricingStrategy): Quoting strategy.
+            inventory (InventoryManager): Position and cash updated by fills.
+            horizon (float): Session length T in strategy time units.
+            time_scale (float): Strategy time units per unit of tick timestamp.
+            coalesce (bool): Quote only the newest pending tick instead of every tick.
+        """
+        self.strategy = strategy
+        self.inventory = inventory
+        self.horizon = horizon
+        self.time_scale = time_scale
+        self.coalesce = coalesce
+        self.latency = LatencyHistogram()
+        self.ticks_received = 0
+        self.quotes_published = 0
+        self.last_quote = None
+        self._listeners = []
+        self._session_start = None
+        self._pending = None
+        self._last_tick = None
+        self._wakeup = None
+        self._source_done = False
+
+    def add_listener(self, callback: Callable[[Quote], None]) -> None:
+        """Registers a callback receiving every published `Quote`."""
+        self._listeners.append(callback)
+
+    def on_fill(self, side: str, price: float, quantity: int = 1) -> None:
+        """Books a fill of our "bid" or "ask" and re-quotes with the new inventory."""
+        if side == "bid":
+            self.inventory.update(quantity, -price * quantity)
+        elif side == "ask":
+            self.inventory.update(-quantity, price * quantity)
+        else:
+            raise ValueError(f"side must be 'bid' or 'ask', got {side!r}")
+
+        if self._last_tick is not None and self._pending is None:
+            timestamp, mid, _ = self._last_tick
+            self._pending = (timestamp, mid, time.perf_counter_ns())
+            if self._wakeup is not None:
+                self._wakeup.set()
+
+    def quote(self, timestamp: float, mid: float) -> Quote:
+        if self._session_start is None:
+            self._session_start = timestamp
+        time_remaining = self.horizon - (timestamp - self._session_start) * self.time_scale
+        if time_remaining < 0.0:
+            time_remaining = 0.0
+        inventory_level = self.inventory.inventory
+
+        reservation_price = self.strategy.calculate_reservation_price(
+            current_price=mid,
+            inventory=inventory_level,
+            time_remaining=time_remaining
+        )
+        bid_spread, ask_spread = self.strategy.calculate_spread(
+            current_price=mid,
+            inventory=inventory_level,
+            time_remaining=time_remaining
+        )
+        return Quote(timestamp, mid, reservation_price - bid_spread, reservation_price + ask_spread, inventory_level)
+
+    def _process(self, timestamp: float, mid: float, arrival_ns: int) -> None:
+        self._last_tick = (timestamp, mid, arrival_ns)
+        quote = self.quote(timestamp, mid)
+        self.last_quote = quote
+        for callback in self._listeners:
+            callback(quote)
+        self.quotes_published += 1
+        self.latency.record(time.perf_counter_ns() - arrival_ns)
+
+    async def _ingest(self, source) -> None:
+        try:
+            async for timestamps, mids, arrivals in source.batches():
+                self.ticks_received += len(timestamps)
+                if self.coalesce:
+                    # The quote also answers the unquoted ticks it supersedes
+                    oldest = int(arrivals[0])
+                    if self._pending is not None:
+                        oldest = min(oldest, self._pending[2])
+                    self._pending = (float(timestamps[-1]), float(mids[-1]), oldest)
+                    self._wakeup.set()
+                else:
+                    for timestamp, mid, arrival in zip(timestamps.tolist(), mids.tolist(), arrivals.tolist()):
+                        self._process(timestamp, mid, arrival)
+                    # Fills booked by listeners may still ask for a re-quote
+                    if self._pending is not None:
+                        self._wakeup.set()
+        finally:
+            self._source_done = True
+            self._wakeup.set()
+
+    async def run(self, source) -> dict:
+        """
+        Consumes `source` until it is exhausted.
+
+        Returns:
+            dict: Tick and quote counts, throughput and latency percentiles.
+        """
+        self._wakeup = asyncio.Event()
+        self._source_done = False
+        start = time.perf_counter()
+        producer = asyncio.create_task(self._ingest(source))
+
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            pending, self._pending = self._pending, None
+            if pending is not None:
+                self._process(*pending)
+            if self._source_done and self._pending is None:
+                break
+
+        await producer
+        return self.stats(time.perf_counter() - start)
+
+    def stats(self, elapsed: float) -> dict:
+        return {
+            "ticks": self.ticks_received,
+            "quotes": self.quotes_published,
+            "elapsed_s": elapsed,
+            "ticks_per_second": self.ticks_received / elapsed if elapsed > 0 else float("inf"),
+            **self.latency.summary()
+        }
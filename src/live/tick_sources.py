@@ -0,0 +1,116 @@
+# live/tick_sources.py
+import asyncio
+import time
+from typing import Optional
+
+import numpy as np
+
+
+def parse_ticks(data: bytes) -> tuple[np.ndarray, np.ndarray]:
+    """Parses complete "timestamp,mid" lines into (timestamps, mids) arrays."""
+    values = np.array(data.replace(b",", b" ").split(), dtype=float)
+    values = values.reshape(-1, 2)
+    return values[:, 0], values[:, 1]
+
+
+def _arrivals(n_ticks: int, read_ns: int) -> np.ndarray:
+    """Arrival stamps of `n_ticks` ticks that all became available at `read_ns`."""
+    return np.full(n_ticks, read_ns, dtype=np.int64)
+
+
+class FileReplayTickSource:
+    """
+    Replays "timestamp,mid" lines from a file as batches of ticks.
+
+    With speed=None the file is replayed as fast as it can be read, which is
+    what throughput benchmarks use, and every tick of a read arrives when the
+    read completes; otherwise ticks are released in real time scaled by
+    `speed` (2.0 replays twice as fast as recorded) and each tick arrives at
+    its scheduled replay time, even when it is yielded late in a batch.
+    """
+
+    def __init__(self, path: str, batch_bytes: int = 1 << 16, speed: Optional[float] = None):
+        self.path = path
+        self.batch_bytes = batch_bytes
+        self.speed = speed
+
+    async def batches(self):
+        """Yields (timestamps, mids, arrivals) arrays, arrivals in `time.perf_counter_ns()`."""
+        replay_start = None
+        with open(self.path, "rb") as f:
+            remainder = b""
+            while True:
+                chunk = f.read(self.batch_bytes)
+                read_ns = time.perf_counter_ns()
+                if not chunk:
+                    break
+                chunk = remainder + chunk
+                cut = chunk.rfind(b"\n") + 1
+                remainder = chunk[cut:]
+                if cut == 0:
+                    continue
+                timestamps, mids = parse_ticks(chunk[:cut])
+                if self.speed is None:
+                    yield timestamps, mids, _arrivals(timestamps.size, read_ns)
+                    # Let the quoting task run between batches
+                    await asyncio.sleep(0)
+                    continue
+                if replay_start is None:
+                    replay_start = (time.perf_counter_ns(), timestamps[0])
+                async for batch in self._paced(timestamps, mids, replay_start):
+                    yield batch
+            if remainder.strip():
+                timestamps, mids = parse_ticks(remainder)
+                yield timestamps, mids, _arrivals(timestamps.size, read_ns)
+
+    async def _paced(self, timestamps, mids, replay_start):
+        wall_start, tick_start = replay_start
+        due = (timestamps - tick_start) / self.speed
+        arrivals = wall_start + (due * 1e9).astype(np.int64)
+        i = 0
+        while i < timestamps.size:
+            elapsed = (time.perf_counter_ns() - wall_start) * 1e-9
+            j = int(np.searchsorted(due, elapsed, side="right"))
+            if j > i:
+                yield timestamps[i:j], mids[i:j], arrivals[i:j]
+                i = j
+            else:
+                await asyncio.sleep(due[i] - elapsed)
+
+
+class SocketTickSource:
+    """
+    Reads newline-delimited "timestamp,mid" ticks from a TCP socket.
+
+    Everything that arrived since the previous read forms one batch, so a slow
+    consumer naturally sees several ticks at once and can coalesce them. The
+    ticks of a batch are stamped with the time of the read that returned them.
+    """
+
+    def __init__(self, host: str, port: int, read_bytes: int = 1 << 16):
+        self.host = host
+        self.port = port
+        self.read_bytes = read_bytes
+
+    async def batches(self):
+        """Yields (timestamps, mids, arrivals) arrays, arrivals in `time.perf_counter_ns()`."""
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        remainder = b""
+        try:
+            while True:
+                chunk = await reader.read(self.read_bytes)
+                read_ns = time.perf_counter_ns()
+                if not chunk:
+                    break
+                chunk = remainder + chunk
+                cut = chunk.rfind(b"\n") + 1
+                remainder = chunk[cut:]
+                if cut:
+                    timestamps, mids = parse_ticks(chunk[:cut])
+                    yield timestamps, mids, _arrivals(timestamps.size, read_ns)
+            if remainder.strip():
+                timestamps, mids = parse_ticks(remainder)
+                yield timestamps, mids, _arrivals(timestamps.size, read_ns)
+        finally:
+            writer.close()
+            await writer.wait_closed()
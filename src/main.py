@@ -1,6 +1,3 @@
-import matplotlib.pyplot as plt
-import pandas as pd
-import seaborn as sns
 from src.strategies.avellaneda_stoikov_abm import AvellanedaStoikovStrategyAbm
 from src.strategies.avellaneda_stoikov_gbm import AvellanedaStoikovStrategyGbm
 from src.strategies.symmetric_strategy import SymmetricStrategy
@@ -75,10 +72,22 @@ def main():
     # MONTE CARLO SIMULATION
     # ----------------------
     if run_mc:
-        mc_results = []
+        # Plotting and pandas are only loaded when this interactive report is produced;
+        # use `python -m src.batch` for headless runs that only write files.
+        import matplotlib.pyplot as plt
+        import pandas as pd
+        from src.utils.plotting import StreamingHistogram, plot_pnl_density
+        from src.utils.risk_metrics import RiskAccumulator
+
+        risk_reports = {}
+        histograms = {}
         for config in strategy_configs:
-            # Run N simulations and collect final PnL statistics
-            df_mc = run_monte_carlo(
+            label = f"{config['name']} ({config['market']})"
+            risk = RiskAccumulator()
+            histograms[label] = StreamingHistogram()
+            # Run N simulations; every path is folded into the risk accumulator and
+            # the PnL histogram, so no per-path rows are kept
+            run_monte_carlo(
                 simulator=config["simulator"],
                 strategy_class=config["strategy_class"],
                 execution_class=config["execution_class"],
@@ -89,38 +98,24 @@ def main():
                 gamma=gamma,
                 k=k,
                 sigma=sigma,
-                n_simulations=n_simulations
-            )
-            mc_results.append(df_mc)
-        # Combine results from all strategy configurations
-        df_all = pd.concat(mc_results, ignore_index=True)
-        # Save the full simulation results (optional)
-        df_all.to_csv("Monte_Carlo_Simulation.csv")
-        # Plot density curves of final PnLs (one per strategy)
-        plt.figure(figsize=(10, 6))
-        for label, group in df_all.groupby("strategy"):
-            sns.kdeplot(
-                group["pnl"],
-                label=label,
-                fill=False,
-                linewidth=2.0,
-                alpha=0.4,
-                bw_adjust=0.5
+                n_simulations=n_simulations,
+                risk=risk,
+                histogram=histograms[label]
             )
-        plt.title("Final PnL Distribution (Monte Carlo)")
-        plt.xlabel("PnL")
-        plt.ylabel("Density")
-        plt.legend()
-        plt.grid(True)
+            risk_reports[label] = risk.report()
+        # Plot density curves of final PnLs (one per strategy) from the binned
+        # histograms, which costs the same for a thousand or a million paths
+        plot_pnl_density(histograms, title="Final PnL Distribution (Monte Carlo)")
         plt.tight_layout()
         plt.show()
 
 
-        # Print summary statistics (mean, std, Sharpe ratio)
-        summary = df_all.groupby("strategy")["pnl"].agg(["mean", "std"])
-        summary["sharpe"] = summary["mean"] / summary["std"]
-        print("\nSummary Statistics (Final PnL):")
-        print(summary)
+        # Print summary statistics (moments, Sharpe ratio, tail quantiles, VaR/CVaR,
+        # inventory excursion and drawdown) from the streaming risk accumulators
+        summary = pd.DataFrame.from_dict(risk_reports, orient="index")
+        summary.to_csv("Monte_Carlo_Summary.csv")
+        print("\nSummary Statistics (Final PnL and path risk):")
+        print(summary.T)
 
 # Entry point of the script
 if __name__ == "__main__":
@@ -1,60 +1,168 @@
 import itertools
-import matplotlib.pyplot as plt
-import pandas as pd
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.simulations.arithmetic_brownian import ArithmeticBrownianMotion
+from src.strategies.avellaneda_stoikov_abm import AvellanedaStoikovStrategyAbm
+from src.strategies.symmetric_strategy import SymmetricStrategy
+from src.executions.poisson_execution import PoissonOrderExecution
+from src.executions.batch_poisson_order_execution import BatchPoissonOrderExecution
+from src.core.batch_runner import BatchSimulationRunner
+from src.core.inventory_manager import InventoryManager
+from src.core.data_logger import DataLogger
+from src.core.simulation_runner import SimulationRunner
+from src.utils.risk_metrics import RiskAccumulator
+
+# Fixed parameters per paper
+S0 = 100
+A = 140
+DT = 0.005
+T = 1.0
+# Local derivatives reported next to every cell of the sweep
+SENSITIVITIES = ("gamma", "k", "sigma")
+
+
+def run_chunk(args):
+    """
+    Runs `num_runs` simulations of one parameter cell in a worker.
 
-from simulations.arithmetic_brownian import ArithmeticBrownianMotion
-from strategies.avellaneda_stoikov_for_gbm import AvellanedaStoikovGBM
-from strategies.symmetric_strategy import SymmetricStrategy
-from executions.poisson_execution import PoissonOrderExecution
-from core.inventory_manager import InventoryManager
-from core.data_logger import DataLogger
-from core.simulation_runner import SimulationRunner
+    `args` is the tuple (strategy_class, sigma, gamma, k, num_runs, seed, qmc,
+    k_offset), with `seed` a SeedSequence, so that chunks can be mapped over a
+    process pool by `run_simulations` and `src.tuning`.
 
+    Only the mergeable risk accumulator and the quoted-spread sum are returned,
+    never the paths. With `qmc` the chunk is one randomized QMC replicate: price
+    paths and fill draws come from its own scrambled Sobol sequence. The
+    strategy quotes with depth k + k_offset while fills decay with k; both
+    sides are filled by `PoissonOrderExecution` at intensity A*exp(-k*spread/2).
+    """
+    strategy_class, sigma, gamma, k, num_runs, seed, qmc, k_offset = args
+    np.random.seed(seed.generate_state(1)[0])
+    source = None
+    if qmc:
+        from src.simulations.quasi_random import SobolNormalSource
+        source = SobolNormalSource(seed=seed, uniform_streams=2)
+    risk = RiskAccumulator()
+    spread_sum = 0.0
+    for _ in range(num_runs):
+        # Initialize components
+        market = ArithmeticBrownianMotion(S0=S0, sigma=sigma, normal_source=source)
+        strategy = strategy_class(gamma=gamma, sigma=sigma, k=k + k_offset)
+        execution = PoissonOrderExecution(A=A, k=k, uniform_source=source)
+        inventory = InventoryManager(initial_cash=0, initial_inventory=0)
+        logger = DataLogger()
+
+        # Configure and run
+        runner = SimulationRunner(
+            market=market,
+            pricing_strategy=strategy,
+            order_execution=execution,
+            inventory=inventory,
+            logger=logger,
+            dt=DT,
+            T=T
+        )
+        runner.run()
+
+        # Compute metrics from the logged path
+        inventory_path = np.asarray(logger.data['inventory'])
+        pnl_path = np.asarray(logger.data['cash']) + inventory_path * np.asarray(logger.data['mid_prices'])
+        risk.update_paths(pnl_path, inventory_path)
+        spread_sum += np.mean(np.asarray(logger.data['ask_prices']) - np.asarray(logger.data['bid_prices']))
+    return risk, spread_sum
+
+
+def run_sensitivity_cell(args):
+    """
+    Estimates the local sensitivities of one parameter cell in a worker.
 
-def run_simulations(strategy_class, strategy_name, sigma_values, gamma_values, k_values, num_runs=1000):
+    `args` is the tuple (strategy_class, sigma, gamma, k, num_runs, seed,
+    names). The cell is simulated once more with `BatchSimulationRunner` and
+    `BatchPoissonOrderExecution`, the batched form of the sweep's fill model,
+    and the "sensitivities" of that run are returned.
+    """
+    strategy_class, sigma, gamma, k, num_runs, seed, names = args
+    market_seed, fill_seed = seed.spawn(2)
+    runner = BatchSimulationRunner(
+        market=ArithmeticBrownianMotion(S0=S0, sigma=sigma, seed=market_seed),
+        pricing_strategy=strategy_class(gamma=gamma, sigma=sigma, k=k),
+        order_execution=BatchPoissonOrderExecution(A=A, k=k, seed=fill_seed),
+        n_paths=num_runs,
+        dt=DT,
+        T=T,
+        sensitivities=names
+    )
+    return runner.run()["sensitivities"]
+
+
+def run_simulations(strategy_class, strategy_name, sigma_values, gamma_values, k_values, num_runs=1000,
+                    n_jobs=1, seed=None, levels=(0.01, 0.05), qmc_replicates=0, sensitivities=()):
     """
     Runs num_runs simulations for each combination of sigma, gamma, and k using the given strategy_class.
-    Returns a DataFrame with summary metrics.
+
+    The runs of each cell are split across `n_jobs` worker processes; every
+    worker fills its own RiskAccumulator and the accumulators are merged, so
+    memory does not grow with num_runs. Seeds are spawned from one
+    SeedSequence per cell and chunk, which makes results reproducible for a
+    given `seed` and `n_jobs`.
+
+    With `qmc_replicates` > 0 every cell is instead split into that many
+    randomized QMC replicates (scrambled Sobol with a Brownian bridge, see
+    `SobolNormalSource`); `se_profit` then comes from the spread of the
+    replicate means. Use a power of two for num_runs / qmc_replicates.
+
+    With `sensitivities` (any of "sigma", "gamma", "k") every cell also
+    reports the local derivatives of its mean profit and of the variance of
+    its final inventory, estimated from one extra batched run of num_runs
+    paths under the same half-spread fill model (see `run_sensitivity_cell`),
+    instead of differencing neighbouring cells of a finer grid.
+
+    Returns a DataFrame with summary metrics: mean quoted spread, PnL moments
+    and the standard error of the mean, PnL quantiles, VaR and CVaR at
+    `levels`, final inventory, maximum inventory excursion and drawdown, plus
+    "dprofit_d<name>" and "dinventory_var_d<name>" with their "se_" standard
+    errors for each of `sensitivities`.
     """
+    import pandas as pd
+
+    cells = list(itertools.product(sigma_values, gamma_values, k_values))
+    n_chunks = qmc_replicates if qmc_replicates > 0 else max(1, min(n_jobs, num_runs))
+    sizes = np.diff(np.linspace(0, num_runs, n_chunks + 1).astype(int))
+    cell_seeds = np.random.SeedSequence(seed).spawn(len(cells))
+    tasks = [
+        (strategy_class, sigma, gamma, k, size, chunk_seed, qmc_replicates > 0, 0.0)
+        for (sigma, gamma, k), cell_seed in zip(cells, cell_seeds)
+        for size, chunk_seed in zip(sizes, cell_seed.spawn(n_chunks))
+    ]
+    # Spawned after the chunk seeds, so adding sensitivities leaves the sweep itself unchanged
+    sensitivity_tasks = [
+        (strategy_class, sigma, gamma, k, num_runs, cell_seed.spawn(1)[0], tuple(sensitivities))
+        for (sigma, gamma, k), cell_seed in zip(cells, cell_seeds)
+    ] if sensitivities else []
+    if n_jobs > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            chunks = list(pool.map(run_chunk, tasks))
+            cell_sensitivities = list(pool.map(run_sensitivity_cell, sensitivity_tasks))
+    else:
+        chunks = [run_chunk(task) for task in tasks]
+        cell_sensitivities = [run_sensitivity_cell(task) for task in sensitivity_tasks]
+
     results = []
-    # Fixed parameters per paper
-    S0 = 100
-    A = 140
-    dt = 0.005
-    T = 1.0
-
-    for sigma, gamma, k in itertools.product(sigma_values, gamma_values, k_values):
-        profits = []
-        final_qs = []
-        spreads = []
-        for _ in range(num_runs):
-            # Initialize components
-            market = ArithmeticBrownianMotion(S0=S0, sigma=sigma)
-            strategy = SymmetricStrategy(gamma=gamma, sigma=sigma, k=k)
-            execution = PoissonOrderExecution(A=A, k=k)
-            inventory = InventoryManager(initial_cash=0, initial_inventory=0)
-            logger = DataLogger()
-
-            # Configure and run
-            runner = SimulationRunner(
-                market=market,
-                pricing_strategy=strategy,
-                order_execution=execution,
-                inventory=inventory,
-                logger=logger,
-                dt=dt,
-                T=T
-            )
-            runner.run()
-            df = logger.get_dataframe()
-
-            # Compute metrics
-            mid_price = df['mid_prices'].iloc[-1]
-            pnl = inventory.cash + inventory.inventory * mid_price
-            profits.append(pnl)
-            final_qs.append(inventory.inventory)
-            spread = (df['ask_prices'] - df['bid_prices']).mean()
-            spreads.append(spread)
+    for index, (sigma, gamma, k) in enumerate(cells):
+        risk = RiskAccumulator()
+        spread_sum = 0.0
+        replicate_means = []
+        for chunk_risk, chunk_spread in chunks[index * n_chunks:(index + 1) * n_chunks]:
+            replicate_means.append(chunk_risk.pnl.mean)
+            risk.merge(chunk_risk)
+            spread_sum += chunk_spread
+        report = risk.report(levels)
+        if qmc_replicates > 1:
+            se_profit = np.std(replicate_means, ddof=1) / np.sqrt(qmc_replicates)
+        else:
+            se_profit = report['std_pnl'] / np.sqrt(num_runs)
 
         # summarize per parameter tuple
         results.append({
@@ -62,12 +170,19 @@ def run_simulations(strategy_class, strategy_name, sigma_values, gamma_values, k
             'sigma': sigma,
             'gamma': gamma,
             'k': k,
-            'spread': sum(spreads) / len(spreads),
-            'mean_profit': pd.Series(profits).mean(),
-            'std_profit': pd.Series(profits).std(),
-            'mean_q': pd.Series(final_qs).mean(),
-            'std_q': pd.Series(final_qs).std()
+            'spread': spread_sum / num_runs,
+            'mean_profit': report.pop('mean_pnl'),
+            'std_profit': report.pop('std_pnl'),
+            'se_profit': se_profit,
+            **report
         })
+        for name, estimate in (cell_sensitivities[index] if sensitivities else {}).items():
+            results[-1].update({
+                f'dprofit_d{name}': estimate['pnl'],
+                f'se_dprofit_d{name}': estimate['pnl_se'],
+                f'dinventory_var_d{name}': estimate['inventory_variance'],
+                f'se_dinventory_var_d{name}': estimate['inventory_variance_se']
+            })
 
     return pd.DataFrame(results)
 
@@ -76,6 +191,8 @@ def plot_strategy(df, strategy_name, sigma_values, k_values):
     """
     Plots mean profit vs gamma for a given strategy DataFrame.
     """
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(8, 5))
     subset_df = df[df['strategy'] == strategy_name]
     for sigma in sigma_values:
@@ -97,13 +214,16 @@ def main():
     gamma_values = [0.05, 0.1, 0.5]
     k_values = [1.0, 1.5, 2.0]
     num_runs = 1000
+    n_jobs = os.cpu_count() or 1
 
     # Run Avellaneda-Stoikov Strategy
-    inv_df = run_simulations(AvellanedaStoikovGBM, 'Inventory', sigma_values, gamma_values, k_values, num_runs)
+    inv_df = run_simulations(AvellanedaStoikovStrategyAbm, 'Inventory', sigma_values, gamma_values, k_values, num_runs, n_jobs=n_jobs, seed=0,
+                             sensitivities=SENSITIVITIES)
     inv_df.to_csv('inventory_results.csv', index=False)
 
     # Run Symmetric Strategy
-    sym_df = run_simulations(SymmetricStategy, 'Symmetric', sigma_values, gamma_values, k_values, num_runs)
+    sym_df = run_simulations(SymmetricStrategy, 'Symmetric', sigma_values, gamma_values, k_values, num_runs, n_jobs=n_jobs, seed=0,
+                             sensitivities=SENSITIVITIES)
     sym_df.to_csv('symmetric_results.csv', index=False)
 
     # Plot results separately
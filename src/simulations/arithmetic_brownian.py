@@ -16,9 +16,11 @@ class ArithmeticBrownianMotion(MarketSimulator):
         NoOfSteps (int): Number of time steps in the simulation.
         S0 (float): Initial asset price.
         sigma (float): Volatility coefficient (standard deviation).
+        dtype (np.dtype): Floating-point type of the simulated prices.
     """
 
-    def __init__(self, S0: float, sigma: float, NoOfSteps: Optional[int] = None):
+    def __init__(self, S0: float, sigma: float, NoOfSteps: Optional[int] = None,
+                 dtype=np.float64, seed: Optional[int] = None, normal_source=None):
         """
         Initializes the ABM simulator with the given parameters.
 
@@ -26,10 +28,19 @@ class ArithmeticBrownianMotion(MarketSimulator):
             NoOfSteps (int): Number of steps in the simulation.
             S0 (float): Initial price level.
             sigma (float): Volatility of the price process.
+            dtype (np.dtype): np.float64 (default) or np.float32 for batched runs
+                where memory bandwidth dominates.
+            seed (int, optional): Seed for the generator used by `simulate_paths`.
+            normal_source (SobolNormalSource, optional): Quasi-random source of the
+                normal increments (e.g. scrambled Sobol with a Brownian bridge);
+                pseudo-random normals are used when omitted.
         """
         self.S0 = S0
         self.sigma = sigma
         self.NoOfSteps = NoOfSteps
+        self.dtype = np.dtype(dtype)
+        self.rng = np.random.default_rng(seed)
+        self.normal_source = normal_source
 
     def simulate(self) -> np.ndarray:
         """
@@ -49,6 +60,11 @@ class ArithmeticBrownianMotion(MarketSimulator):
 
         return S
 
+    def _normals(self, n_paths: int, steps: int) -> np.ndarray:
+        if self.normal_source is not None:
+            return self.normal_source.normals(n_paths, steps).astype(self.dtype, copy=False)
+        return self.rng.standard_normal((n_paths, steps), dtype=self.dtype)
+
     def simulate(self, steps: int) -> np.ndarray:
         """
         Runs the simulation of Arithmetic Brownian Motion.
@@ -57,12 +73,41 @@ class ArithmeticBrownianMotion(MarketSimulator):
             np.ndarray: Simulated path of asset prices as a NumPy array.
         """
         dt = 1 / steps
-        S = np.zeros(steps + 1)  # Initialize price array
+        S = np.zeros(steps + 1, dtype=self.dtype)  # Initialize price array
         S[0] = self.S0  # Set initial price
-        Z = np.random.normal(0, 1, steps)  # Generate standard normal random variables
+        if self.normal_source is None:
+            Z = np.random.normal(0, 1, steps)  # Generate standard normal random variables
+        else:
+            Z = self.normal_source.normals(1, steps)[0]  # Next quasi-random path
 
         # Generate the price path
         for i in range(1, steps + 1):
             S[i] = S[i - 1] + self.sigma * np.sqrt(dt) * Z[i - 1]
 
         return S
+
+    def simulate_paths(self, n_paths: int, steps: int) -> np.ndarray:
+        """
+        Vectorized simulation of independent paths, with normals drawn directly in `dtype`.
+
+        Increments are accumulated before S0 is added, so in float32 the rounding
+        error scales with the size of the price move rather than with the price level.
+
+        Returns:
+            np.ndarray: Price matrix of shape (n_paths, steps + 1).
+        """
+        dt = 1 / steps
+        S = np.empty((n_paths, steps + 1), dtype=self.dtype)
+        S[:, 0] = self.S0
+        increments = self._normals(n_paths, steps)
+        increments *= self.dtype.type(self.sigma * np.sqrt(dt))
+        np.cumsum(increments, axis=1, out=S[:, 1:])
+        S[:, 1:] += self.dtype.type(self.S0)
+        return S
+
+    def sigma_sensitivity(self, paths: np.ndarray) -> np.ndarray:
+        """
+        Pathwise derivative dS/dsigma of paths from `simulate_paths`, holding the
+        normal draws fixed: S - S0 is proportional to sigma.
+        """
+        return (paths - self.S0) / self.sigma
@@ -0,0 +1,109 @@
+# simulations/correlated_brownian.py
+
+from src.core.market_simulator import MarketSimulator
+import numpy as np
+from typing import Optional
+
+
+class CorrelatedArithmeticBrownianMotion(MarketSimulator):
+    """
+    A class to simulate several correlated assets with Arithmetic Brownian Motion.
+
+    S(t+1) = S(t) + sqrt(dt) * L @ Z, with L L^T = Σ = diag(σ) C diag(σ).
+    The Cholesky factor L is computed once at construction. Paths can either be
+    generated in full with `simulate_paths`, or advanced one step at a time with
+    `step`, which keeps memory at O(n_paths * n_assets) for large batch runs.
+
+    Attributes:
+        S0 (np.ndarray): Initial prices, shape (n_assets,).
+        sigma (np.ndarray): Volatilities, shape (n_assets,).
+        correlation (np.ndarray): Correlation matrix C, shape (n_assets, n_assets).
+        covariance (np.ndarray): Covariance matrix Σ of the price changes per unit time.
+        cholesky (np.ndarray): Lower Cholesky factor of Σ.
+        log_returns (bool): Whether Σ is a log-return covariance (False here).
+    """
+
+    log_returns = False
+
+    def __init__(self, S0, sigma, correlation, seed: Optional[int] = None):
+        """
+        Args:
+            S0 (array-like): Initial price of each asset.
+            sigma (array-like): Volatility of each asset.
+            correlation (array-like): Positive definite correlation matrix.
+            seed (int, optional): Seed for the random generator.
+        """
+        self.S0 = np.asarray(S0, dtype=float)
+        self.sigma = np.asarray(sigma, dtype=float)
+        self.correlation = np.asarray(correlation, dtype=float)
+        self.n_assets = self.S0.size
+        if self.sigma.shape != self.S0.shape or self.correlation.shape != (self.n_assets, self.n_assets):
+            raise ValueError("S0, sigma and correlation dimensions do not match")
+        self.covariance = self.sigma[:, None] * self.correlation * self.sigma[None, :]
+        self.cholesky = np.linalg.cholesky(self.covariance)
+        self.rng = np.random.default_rng(seed)
+
+    def price_covariance(self, S: np.ndarray) -> np.ndarray:
+        """Covariance of mid-price changes, Σ at any prices S."""
+        return np.broadcast_to(self.covariance, np.shape(S)[:-1] + self.covariance.shape)
+
+    def correlated_normals(self, size: tuple) -> np.ndarray:
+        """Draws shocks of shape size + (n_assets,) with covariance L L^T."""
+        Z = self.rng.standard_normal(size + (self.n_assets,))
+        return Z @ self.cholesky.T
+
+    def initial_prices(self, n_paths: int) -> np.ndarray:
+        return np.tile(self.S0, (n_paths, 1))
+
+    def step(self, S: np.ndarray, dt: float) -> np.ndarray:
+        """Advances prices of shape (n_paths, n_assets) by dt."""
+        return S + np.sqrt(dt) * self.correlated_normals(S.shape[:-1])
+
+    def simulate(self, steps: int) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: Price path of shape (steps + 1, n_assets) with dt = 1 / steps.
+        """
+        return self.simulate_paths(1, steps)[0]
+
+    def simulate_paths(self, n_paths: int, steps: int) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: Prices of shape (n_paths, steps + 1, n_assets) with dt = 1 / steps.
+        """
+        dt = 1 / steps
+        S = np.empty((n_paths, steps + 1, self.n_assets))
+        S[:, 0] = self.S0
+        np.cumsum(np.sqrt(dt) * self.correlated_normals((n_paths, steps)), axis=1, out=S[:, 1:])
+        S[:, 1:] += self.S0
+        return S
+
+
+class CorrelatedGeometricBrownianMotion(CorrelatedArithmeticBrownianMotion):
+    """
+    A class to simulate several correlated assets with Geometric Brownian Motion.
+
+    S(t+1) = S(t) * exp(-0.5 * σ² * dt + sqrt(dt) * L @ Z), with L the Cholesky
+    factor of the log-return covariance Σ = diag(σ) C diag(σ). `covariance` is
+    that log-return covariance; the mid-price covariance at prices S is
+    diag(S) Σ diag(S), see `price_covariance`.
+    """
+
+    log_returns = True
+
+    def price_covariance(self, S: np.ndarray) -> np.ndarray:
+        """Instantaneous covariance of mid-price changes at prices S of shape (..., n_assets)."""
+        S = np.asarray(S, dtype=float)
+        return S[..., :, None] * self.covariance * S[..., None, :]
+
+    def step(self, S: np.ndarray, dt: float) -> np.ndarray:
+        drift = -0.5 * self.sigma ** 2 * dt
+        return S * np.exp(drift + np.sqrt(dt) * self.correlated_normals(S.shape[:-1]))
+
+    def simulate_paths(self, n_paths: int, steps: int) -> np.ndarray:
+        dt = 1 / steps
+        log_returns = -0.5 * self.sigma ** 2 * dt + np.sqrt(dt) * self.correlated_normals((n_paths, steps))
+        S = np.empty((n_paths, steps + 1, self.n_assets))
+        S[:, 0] = self.S0
+        S[:, 1:] = self.S0 * np.exp(np.cumsum(log_returns, axis=1))
+        return S
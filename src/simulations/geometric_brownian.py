@@ -11,18 +11,27 @@ class GeometricBrownianMotion(MarketSimulator):
         NoOfSteps (int): Number of time steps in the simulation.
     S0 (float): Initial asset price.
     sigma (float): Volatility of the asset.
+    dtype (np.dtype): Floating-point type of the simulated prices.
     """
-    def __init__(self, S0: float, sigma: float, NoOfSteps: Optional[int] = None):
+    def __init__(self, S0: float, sigma: float, NoOfSteps: Optional[int] = None,
+                 dtype=np.float64, seed: Optional[int] = None, normal_source=None):
         """
         Initializes the GBM simulator with the provided parameters.
         Args : 
         NoOfSteps (int): Number of discrete time steps.
         S0 (float): Initial price of the asset.
         sigma (float): Volatility (standard deviation of returns).
+        dtype (np.dtype): np.float64 (default) or np.float32 for batched runs.
+        seed (int, optional): Seed for the generator used by `simulate_paths`.
+        normal_source (SobolNormalSource, optional): Quasi-random source of the
+            normal increments; pseudo-random normals are used when omitted.
         """ 
         self.NoOfStep = NoOfSteps
         self.S0 = S0
         self.sigma = sigma
+        self.dtype = np.dtype(dtype)
+        self.rng = np.random.default_rng(seed)
+        self.normal_source = normal_source
         
     def simulate(self) -> np.ndarray:
         """
@@ -41,22 +50,60 @@ class GeometricBrownianMotion(MarketSimulator):
             S[i] = S[i - 1] * np.exp((-0.5 * self.sigma**2) * dt + self.sigma * Z[i - 1] * np.sqrt(dt))
         return S
 
+    def _normals(self, n_paths: int, steps: int) -> np.ndarray:
+        if self.normal_source is not None:
+            return self.normal_source.normals(n_paths, steps).astype(self.dtype, copy=False)
+        return self.rng.standard_normal((n_paths, steps), dtype=self.dtype)
+
     def simulate(self, steps: int) -> np.ndarray:
         """
         Runs the Geometric Brownian Motion simulation.
         Returns:
         np.ndarray: Simulated price path as a NumPy array.
         """
-        S = np.zeros(steps + 1) # Array to store simulated prices
+        S = np.zeros(steps + 1, dtype=self.dtype) # Array to store simulated prices
         S[0] = self.S0 # Set initial price
         dt = 1 / steps # Time step size
-        Z = np.random.normal(0, 1, steps) # Standard normal random variables
+        if self.normal_source is None:
+            Z = np.random.normal(0, 1, steps) # Standard normal random variables
+        else:
+            Z = self.normal_source.normals(1, steps)[0] # Next quasi-random path
 
         # Generate price path
         for i in range(1, steps + 1):
             # GBM price update formula
             S[i] = S[i - 1] * np.exp((-0.5 * self.sigma**2) * dt + self.sigma * Z[i - 1] * np.sqrt(dt))
         return S
+
+    def simulate_paths(self, n_paths: int, steps: int) -> np.ndarray:
+        """
+        Vectorized simulation of independent paths, with normals drawn directly in `dtype`.
+
+        Log-returns are accumulated before exponentiation, which keeps float32
+        rounding error proportional to the log-price move.
+
+        Returns:
+            np.ndarray: Price matrix of shape (n_paths, steps + 1).
+        """
+        dt = 1 / steps
+        S = np.empty((n_paths, steps + 1), dtype=self.dtype)
+        S[:, 0] = self.S0
+        log_returns = self._normals(n_paths, steps)
+        log_returns *= self.dtype.type(self.sigma * np.sqrt(dt))
+        log_returns += self.dtype.type(-0.5 * self.sigma ** 2 * dt)
+        np.cumsum(log_returns, axis=1, out=S[:, 1:])
+        np.exp(S[:, 1:], out=S[:, 1:])
+        S[:, 1:] *= self.dtype.type(self.S0)
+        return S
+
+    def sigma_sensitivity(self, paths: np.ndarray) -> np.ndarray:
+        """
+        Pathwise derivative dS/dsigma of paths from `simulate_paths`, holding the
+        normal draws fixed: log(S/S0) = -0.5*sigma²*t + sigma*W(t) with t = j / steps,
+        so dS/dsigma = S * (log(S/S0) - 0.5*sigma²*t) / sigma.
+        """
+        t = np.arange(paths.shape[-1]) / (paths.shape[-1] - 1)
+        return paths * (np.log(paths / self.S0) - 0.5 * self.sigma ** 2 * t) / self.sigma
     
 
 
@@ -0,0 +1,158 @@
+# simulations/heston.py
+
+from src.core.market_simulator import MarketSimulator
+import numpy as np
+from typing import Optional
+
+
+class HestonStochasticVolatility(MarketSimulator):
+    """
+    A class to simulate asset prices under the Heston stochastic volatility model.
+
+    The log-price and the variance follow
+    dS(t) = sqrt(v(t)) * S(t) * dW_S(t),
+    dv(t) = kappa * (theta - v(t)) * dt + xi * sqrt(v(t)) * dW_v(t),
+    with corr(dW_S, dW_v) = rho. As in the other simulators, the horizon is
+    normalised to one so that dt = 1 / steps.
+
+    Two discretisations are available:
+        "qe": Andersen's quadratic-exponential scheme for the variance with the
+              matching central log-price update (accurate at coarse steps).
+        "full_truncation": Euler scheme where negative variance is floored at
+              zero inside drift and diffusion terms.
+
+    After every call the instantaneous variance used for each step is exposed
+    through `variance_path` (single path) and `variance_paths` (batch) so that
+    strategies can consume it via `PricingStrategy.update_variance`.
+
+    Attributes:
+        S0 (float): Initial asset price.
+        v0 (float): Initial variance.
+        kappa (float): Mean-reversion speed of the variance.
+        theta (float): Long-run variance.
+        xi (float): Volatility of variance.
+        rho (float): Correlation between price and variance shocks.
+        scheme (str): Discretisation scheme, "qe" or "full_truncation".
+    """
+
+    SCHEMES = ("qe", "full_truncation")
+
+    def __init__(
+        self,
+        S0: float,
+        v0: float,
+        kappa: float,
+        theta: float,
+        xi: float,
+        rho: float,
+        scheme: str = "qe",
+        seed: Optional[int] = None
+    ):
+        """
+        Initializes the Heston simulator with the given parameters.
+
+        Args:
+            S0 (float): Initial price level.
+            v0 (float): Initial variance.
+            kappa (float): Mean-reversion speed of the variance.
+            theta (float): Long-run variance.
+            xi (float): Volatility of variance.
+            rho (float): Price/variance correlation in [-1, 1].
+            scheme (str): "qe" or "full_truncation".
+            seed (int, optional): Seed for the random generator.
+        """
+        if scheme not in self.SCHEMES:
+            raise ValueError(f"scheme must be one of {self.SCHEMES}, got {scheme!r}")
+        if scheme == "qe" and xi <= 0:
+            raise ValueError("the QE scheme requires xi > 0; use scheme='full_truncation' for xi = 0")
+        self.S0 = S0
+        self.v0 = v0
+        self.kappa = kappa
+        self.theta = theta
+        self.xi = xi
+        self.rho = rho
+        self.scheme = scheme
+        self.rng = np.random.default_rng(seed)
+        self.variance_path = None
+        self.variance_paths = None
+
+    def simulate(self, steps: int) -> np.ndarray:
+        """
+        Runs a single Heston path.
+
+        Returns:
+            np.ndarray: Simulated path of asset prices of length steps + 1.
+        """
+        S = self.simulate_paths(1, steps)[0]
+        self.variance_path = self.variance_paths[0]
+        return S
+
+    def simulate_paths(self, n_paths: int, steps: int) -> np.ndarray:
+        """
+        Runs n_paths Heston paths at once, vectorized across paths.
+
+        Returns:
+            np.ndarray: Price matrix of shape (n_paths, steps + 1). The matching
+            variance matrix is stored in `variance_paths`.
+        """
+        dt = 1 / steps
+        log_S = np.empty((n_paths, steps + 1))
+        v = np.empty((n_paths, steps + 1))
+        log_S[:, 0] = np.log(self.S0)
+        v[:, 0] = self.v0
+
+        step = self._qe_step if self.scheme == "qe" else self._full_truncation_step
+        for i in range(steps):
+            log_S[:, i + 1], v[:, i + 1] = step(log_S[:, i], v[:, i], dt)
+
+        if self.scheme == "full_truncation":
+            np.maximum(v, 0.0, out=v)
+        self.variance_paths = v
+        S = np.exp(log_S)
+        S[:, 0] = self.S0
+        return S
+
+    def _full_truncation_step(self, log_S: np.ndarray, v: np.ndarray, dt: float) -> tuple[np.ndarray, np.ndarray]:
+        Z_v = self.rng.standard_normal(v.shape)
+        Z_s = self.rho * Z_v + np.sqrt(1 - self.rho ** 2) * self.rng.standard_normal(v.shape)
+        v_pos = np.maximum(v, 0.0)
+        sqrt_v_dt = np.sqrt(v_pos * dt)
+
+        v_next = v + self.kappa * (self.theta - v_pos) * dt + self.xi * sqrt_v_dt * Z_v
+        log_S_next = log_S - 0.5 * v_pos * dt + sqrt_v_dt * Z_s
+        return log_S_next, v_next
+
+    def _qe_step(self, log_S: np.ndarray, v: np.ndarray, dt: float, psi_c: float = 1.5) -> tuple[np.ndarray, np.ndarray]:
+        # Moments of v(t + dt) given v(t)
+        e = np.exp(-self.kappa * dt)
+        m = self.theta + (v - self.theta) * e
+        s2 = (v * self.xi ** 2 * e * (1 - e) / self.kappa
+              + self.theta * self.xi ** 2 * (1 - e) ** 2 / (2 * self.kappa))
+        psi = np.maximum(s2 / np.maximum(m, 1e-300) ** 2, 1e-12)
+
+        Z = self.rng.standard_normal(v.shape)
+        U = self.rng.random(v.shape)
+        v_next = np.empty_like(v)
+
+        # Quadratic branch: v' = a * (b + Z)^2
+        quad = psi <= psi_c
+        inv_psi = 2 / psi[quad]
+        b2 = inv_psi - 1 + np.sqrt(inv_psi) * np.sqrt(inv_psi - 1)
+        a = m[quad] / (1 + b2)
+        v_next[quad] = a * (np.sqrt(b2) + Z[quad]) ** 2
+
+        # Exponential branch: point mass at zero plus exponential tail
+        expo = ~quad
+        p = (psi[expo] - 1) / (psi[expo] + 1)
+        beta = (1 - p) / m[expo]
+        u = U[expo]
+        v_next[expo] = np.where(u <= p, 0.0, np.log((1 - p) / np.maximum(1 - u, 1e-300)) / beta)
+
+        # Central discretisation of the log-price (gamma1 = gamma2 = 1/2)
+        k0 = -self.rho * self.kappa * self.theta / self.xi * dt
+        k1 = 0.5 * dt * (self.kappa * self.rho / self.xi - 0.5) - self.rho / self.xi
+        k2 = 0.5 * dt * (self.kappa * self.rho / self.xi - 0.5) + self.rho / self.xi
+        k3 = 0.5 * dt * (1 - self.rho ** 2)
+        Z_s = self.rng.standard_normal(v.shape)
+        log_S_next = log_S + k0 + k1 * v + k2 * v_next + np.sqrt(k3 * (v + v_next)) * Z_s
+        return log_S_next, v_next
@@ -0,0 +1,100 @@
+# simulations/merton_jump_diffusion.py
+
+from src.core.market_simulator import MarketSimulator
+import numpy as np
+from typing import Optional
+
+
+class MertonJumpDiffusion(MarketSimulator):
+    """
+    A class to simulate asset prices using Merton's jump-diffusion model.
+
+    The price follows a GBM with compound Poisson jumps in the log-price:
+    S(t+1) = S(t) * exp((-0.5 * σ² - λ * m) * dt + σ * sqrt(dt) * Z + Σ J),
+    where the number of jumps per step is Poisson(λ * dt), each log-jump J is
+    Normal(mu_j, sigma_j²) and m = exp(mu_j + 0.5 * sigma_j²) - 1 keeps the
+    price a martingale. As in the other simulators dt = 1 / steps.
+
+    The instantaneous variance of log-returns, σ² + λ * (mu_j² + sigma_j²),
+    is exposed through `variance_path` / `variance_paths` so that strategies
+    can consume it via `PricingStrategy.update_variance`.
+
+    Attributes:
+        S0 (float): Initial asset price.
+        sigma (float): Diffusive volatility.
+        lam (float): Jump intensity (expected jumps per unit time).
+        mu_j (float): Mean of the log-jump size.
+        sigma_j (float): Standard deviation of the log-jump size.
+    """
+
+    def __init__(
+        self,
+        S0: float,
+        sigma: float,
+        lam: float,
+        mu_j: float,
+        sigma_j: float,
+        seed: Optional[int] = None
+    ):
+        """
+        Initializes the jump-diffusion simulator with the given parameters.
+
+        Args:
+            S0 (float): Initial price level.
+            sigma (float): Diffusive volatility.
+            lam (float): Jump intensity.
+            mu_j (float): Mean log-jump size.
+            sigma_j (float): Standard deviation of the log-jump size.
+            seed (int, optional): Seed for the random generator.
+        """
+        self.S0 = S0
+        self.sigma = sigma
+        self.lam = lam
+        self.mu_j = mu_j
+        self.sigma_j = sigma_j
+        self.rng = np.random.default_rng(seed)
+        self.variance_path = None
+        self.variance_paths = None
+
+    @property
+    def instantaneous_variance(self) -> float:
+        """Variance rate of log-returns including the jump component."""
+        return self.sigma ** 2 + self.lam * (self.mu_j ** 2 + self.sigma_j ** 2)
+
+    def simulate(self, steps: int) -> np.ndarray:
+        """
+        Runs a single jump-diffusion path.
+
+        Returns:
+            np.ndarray: Simulated path of asset prices of length steps + 1.
+        """
+        S = self.simulate_paths(1, steps)[0]
+        self.variance_path = self.variance_paths[0]
+        return S
+
+    def simulate_paths(self, n_paths: int, steps: int) -> np.ndarray:
+        """
+        Runs n_paths jump-diffusion paths at once without any time loop.
+
+        Returns:
+            np.ndarray: Price matrix of shape (n_paths, steps + 1). The matching
+            variance matrix is stored in `variance_paths`.
+        """
+        dt = 1 / steps
+        jump_compensator = np.exp(self.mu_j + 0.5 * self.sigma_j ** 2) - 1
+        drift = (-0.5 * self.sigma ** 2 - self.lam * jump_compensator) * dt
+
+        Z = self.rng.standard_normal((n_paths, steps))
+        n_jumps = self.rng.poisson(self.lam * dt, (n_paths, steps))
+        # Sum of n i.i.d. normal jumps is Normal(n * mu_j, n * sigma_j²)
+        jumps = n_jumps * self.mu_j + np.sqrt(n_jumps) * self.sigma_j * self.rng.standard_normal((n_paths, steps))
+
+        log_S = np.empty((n_paths, steps + 1))
+        log_S[:, 0] = np.log(self.S0)
+        np.cumsum(drift + self.sigma * np.sqrt(dt) * Z + jumps, axis=1, out=log_S[:, 1:])
+        log_S[:, 1:] += log_S[:, :1]
+
+        self.variance_paths = np.full((n_paths, steps + 1), self.instantaneous_variance)
+        S = np.exp(log_S)
+        S[:, 0] = self.S0
+        return S
@@ -0,0 +1,151 @@
+# simulations/quasi_random.py
+import numpy as np
+from typing import Optional
+
+
+def brownian_bridge_order(steps: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Construction order of a Brownian bridge on the grid 0, 1, ..., steps.
+
+    The terminal point comes first, then the midpoints of the remaining
+    intervals breadth-first, so the leading input dimensions carry the
+    large-scale shape of the path.
+
+    Returns:
+        (points, left, right): Grid index built by each input dimension and
+        the already-built neighbours it is interpolated between.
+    """
+    points, left, right = [steps], [0], [steps]
+    intervals = [(0, steps)]
+    while intervals:
+        refined = []
+        for lo, hi in intervals:
+            if hi - lo < 2:
+                continue
+            mid = (lo + hi) // 2
+            points.append(mid)
+            left.append(lo)
+            right.append(hi)
+            refined += [(lo, mid), (mid, hi)]
+        intervals = refined
+    return np.array(points), np.array(left), np.array(right)
+
+
+def brownian_bridge(Z: np.ndarray) -> np.ndarray:
+    """
+    Turns normals of shape (n_paths, steps), ordered by importance, into
+    standard normal increments of a Brownian path in time order.
+
+    The result has the same distribution as i.i.d. normals, so it can replace
+    them wherever a simulator scales increments by sigma * sqrt(dt).
+    """
+    n_paths, steps = Z.shape
+    points, left, right = brownian_bridge_order(steps)
+    # Grid in units of one step; built row by row with contiguous (n_paths,) rows
+    W = np.zeros((steps + 1, n_paths))
+    W[steps] = np.sqrt(steps) * Z[:, 0]
+    for d in range(1, steps):
+        j, lo, hi = points[d], left[d], right[d]
+        W[j] = ((hi - j) * W[lo] + (j - lo) * W[hi]) / (hi - lo) + np.sqrt((j - lo) * (hi - j) / (hi - lo)) * Z[:, d]
+    return np.diff(W, axis=0).T
+
+
+class SobolNormalSource:
+    """
+    Scrambled-Sobol source of standard normal path increments.
+
+    Each simulated path consumes one point of a `steps`-dimensional Sobol
+    sequence, mapped to normals with the inverse normal CDF and, by default,
+    arranged into a path with a Brownian bridge so the low-discrepancy leading
+    dimensions drive the terminal value and coarse shape of the path. The
+    sequence continues across calls, so paths drawn one at a time (as in
+    `run_monte_carlo`) and in batches are equally well stratified; drawing
+    powers of two in total keeps the balance properties of the sequence.
+
+    With `uniform_streams` > 0 every Sobol point also carries that many
+    uniforms per step after the price dimensions; executions given the source
+    as `uniform_source` take their fill draws from it with `next_uniforms`.
+    PnL variance in this model is mostly fill noise, so quasi-random price
+    paths alone barely reduce it, while quasi-random fills do.
+
+    Independent scramblings (different `seed`) are randomized QMC replicates:
+    each gives an unbiased estimate, and the spread of the replicate estimates
+    measures the QMC error.
+
+    Requires scipy (scipy.stats.qmc).
+    """
+
+    def __init__(self, steps: Optional[int] = None, scramble: bool = True, seed: Optional[int] = None,
+                 bridge: bool = True, uniform_streams: int = 0):
+        """
+        Args:
+            steps (int, optional): Number of increments per path; taken from the
+                first `normals` call when omitted.
+            scramble (bool): Owen-scramble the sequence (needed for replicates).
+            seed (int or np.random.SeedSequence, optional): Seed of the scrambling.
+            bridge (bool): Build paths with a Brownian bridge instead of in time order.
+            uniform_streams (int): Uniforms per step reserved for the executions
+                (2 for one bid and one ask draw).
+        """
+        try:
+            from scipy.stats import qmc
+            from scipy.special import ndtri
+        except ImportError as exc:
+            raise ImportError(
+                "SobolNormalSource requires scipy (scipy.stats.qmc); install it with `pip install scipy`"
+            ) from exc
+        self.steps = steps
+        self.scramble = scramble
+        self.bridge = bridge
+        self.uniform_streams = uniform_streams
+        self._qmc = qmc
+        self._ndtri = ndtri
+        self._rng = np.random.default_rng(seed)
+        self._engine = None
+        self._bridge_matrix = None
+        self._uniforms = None
+        self._step = 0
+
+    def _build_engine(self, steps: int) -> None:
+        self.steps = steps
+        self._engine = self._qmc.Sobol(d=steps * (1 + self.uniform_streams), scramble=self.scramble, seed=self._rng)
+        if not self.scramble:
+            # The unscrambled sequence starts at the origin, where the inverse CDF is -inf
+            self._engine.fast_forward(1)
+
+    def normals(self, n_paths: int, steps: int) -> np.ndarray:
+        """Return the next `n_paths` paths of standard normal increments, shape (n_paths, steps)."""
+        if self._engine is None:
+            self._build_engine(self.steps or steps)
+        if steps != self.steps:
+            raise ValueError(f"source was built for {self.steps} steps, got {steps}")
+        U = self._engine.random(n_paths)
+        if self.uniform_streams:
+            self._uniforms = U[:, steps:].reshape(n_paths, self.uniform_streams, steps)
+            self._step = 0
+        Z = self._ndtri(U[:, :steps])
+        if not self.bridge:
+            return Z
+        if n_paths < steps:
+            # The bridge is linear; for a few paths at a time (one per call in
+            # run_monte_carlo) one matrix product beats the loop over dimensions
+            if self._bridge_matrix is None:
+                self._bridge_matrix = brownian_bridge(np.eye(steps))
+            return Z @ self._bridge_matrix
+        return brownian_bridge(Z)
+
+    def next_uniforms(self) -> np.ndarray:
+        """
+        Fill uniforms of the next time step for the paths of the last `normals`
+        call, shape (n_paths, uniform_streams).
+        """
+        if self._uniforms is None or self._step >= self._uniforms.shape[2]:
+            raise RuntimeError("no quasi-random uniforms left; draw the next price paths with normals() first")
+        uniforms = self._uniforms[:, :, self._step]
+        self._step += 1
+        return uniforms
+
+    @classmethod
+    def replicates(cls, steps: Optional[int], n_replicates: int, seed: Optional[int] = None, **kwargs) -> list:
+        """Independently scrambled sources for randomized QMC error estimates."""
+        return [cls(steps, seed=s, **kwargs) for s in np.random.SeedSequence(seed).spawn(n_replicates)]
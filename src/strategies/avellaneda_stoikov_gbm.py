@@ -2,21 +2,36 @@ from src.core.pricing_strategy import PricingStrategy
 import numpy as np
 
 class AvellanedaStoikovStrategyGbm(PricingStrategy):
-    def __init__(self, gamma: float, sigma: float, k: float):
+    # Quote formulas are elementwise in these, so instances can be stacked into arrays
+    vectorized_parameters = ("gamma", "sigma", "k")
+
+    def __init__(self, gamma: float, sigma: float, k: float, use_market_variance: bool = False,
+                 dtype=np.float64):
         """
         Args:
             gamma (float): Risk aversion coefficient.
             sigma (float): Volatility.
             k (float): Market depth parameter.
+            use_market_variance (bool): If True, replace sigma with the market's
+                instantaneous volatility whenever the simulator exposes a variance path.
+            dtype (np.dtype): Floating-point type of the quotes; with np.float32
+                batched float32 prices and inventories stay float32.
         """
         self.gamma = gamma
         self.k = k
         self.sigma = sigma
+        self.use_market_variance = use_market_variance
+        self.dtype = np.dtype(dtype).type
+
+    def update_variance(self, variance: float, current_price=None) -> None:
+        if self.use_market_variance:
+            self.sigma = np.sqrt(variance)
 
     def calculate_reservation_price(self, current_price, inventory, time_remaining):
-        return current_price - inventory * self.gamma * self.sigma**2 * time_remaining
+        return current_price - inventory * self.dtype(self.gamma * self.sigma**2 * time_remaining)
 
     def calculate_spread(self, current_price, inventory, time_remaining):
         spread = self.gamma * self.sigma**2 * time_remaining
         spread += (2 / self.gamma) * np.log(1 + self.gamma / self.k)
+        spread = self.dtype(spread)
         return spread / 2, spread / 2
\ No newline at end of file
@@ -0,0 +1,58 @@
+from src.core.pricing_strategy import PricingStrategy
+import numpy as np
+
+
+class MultiAssetAvellanedaStoikovStrategy(PricingStrategy):
+    """
+    Avellaneda-Stoikov quoting for a book of correlated assets.
+
+    The reservation price of asset i penalises the covariance of the whole
+    inventory vector rather than its own position only:
+        r_i = S_i - γ * (Σ q)_i * (T - t),
+    so a long position in one asset also skews the quotes of the assets it is
+    correlated with. Spreads use the per-asset AS formula with σ_i² = Σ_ii.
+    Σ is the covariance of mid-price changes. A log-return covariance (as
+    exposed by `CorrelatedGeometricBrownianMotion`) is accepted with
+    `log_returns=True` and converted to diag(S) Σ diag(S) at the current prices.
+
+    With many correlated positions the skew (Σ q)_i can exceed the half-spread
+    and push a quote through the mid, where it would be filled at every step
+    and at a loss. Quotes are therefore clamped to the mid: the bid never sits
+    above it and the ask never below it.
+
+    All inputs may carry a leading path dimension: prices and inventory of
+    shape (n_paths, n_assets) are handled in one call.
+    """
+
+    def __init__(self, gamma: float, covariance, k, log_returns: bool = False):
+        """
+        Args:
+            gamma (float): Risk aversion coefficient.
+            covariance (array-like): Covariance matrix of the mid-price changes per
+                unit time, or of the log-returns if `log_returns` is set.
+            k (float or array-like): Market depth parameter (per asset if an array).
+            log_returns (bool): Whether `covariance` is a log-return covariance.
+        """
+        self.gamma = gamma
+        self.covariance = np.asarray(covariance, dtype=float)
+        self.k = np.asarray(k, dtype=float)
+        self.log_returns = log_returns
+        self.variance = np.diag(self.covariance).copy()
+        self._static_spread = (2 / self.gamma) * np.log(1 + self.gamma / self.k)
+
+    def _inventory_risk(self, current_price, inventory):
+        """Σ q with Σ the mid-price covariance at `current_price`."""
+        if not self.log_returns:
+            return inventory @ self.covariance
+        # diag(S) Σ diag(S) q without forming a covariance matrix per path
+        return current_price * ((current_price * inventory) @ self.covariance)
+
+    def calculate_reservation_price(self, current_price, inventory, time_remaining):
+        return current_price - self.gamma * self._inventory_risk(current_price, inventory) * time_remaining
+
+    def calculate_spread(self, current_price, inventory, time_remaining):
+        variance = self.variance * current_price ** 2 if self.log_returns else self.variance
+        half_spread = (self.gamma * variance * time_remaining + self._static_spread) / 2
+        # Distance of the reservation price below the mid; the clamp keeps both quotes on their side of it
+        skew = self.gamma * self._inventory_risk(current_price, inventory) * time_remaining
+        return np.maximum(half_spread, -skew), np.maximum(half_spread, skew)
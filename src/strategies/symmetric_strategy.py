@@ -2,10 +2,15 @@
 from src.core.pricing_strategy import PricingStrategy
 import numpy as np
 class SymmetricStrategy(PricingStrategy):
-    def __init__(self, gamma: float, sigma: float, k: float):
+    # Quote formulas are elementwise in these, so instances can be stacked into arrays
+    vectorized_parameters = ("gamma", "sigma", "k")
+
+    def __init__(self, gamma: float, sigma: float, k: float, dtype=np.float64):
         self.gamma = gamma
         self.sigma = sigma
         self.k = k
+        # Floating-point type of the spreads (np.float32 for float32 batches)
+        self.dtype = np.dtype(dtype).type
 
     def calculate_reservation_price(self, current_price: float, inventory: int, time_remaining: float) -> float:
         # Ignores inventory: just returns the mid-price because the 
@@ -15,4 +20,5 @@ class SymmetricStrategy(PricingStrategy):
     def calculate_spread(self, current_price: float, inventory: int, time_remaining: float) -> tuple[float, float]:
         # Uses the same spread formula as Avellaneda-Stoikov
         spread = self.gamma * (self.sigma ** 2) * time_remaining + (2 / self.gamma) * np.log(1 + self.gamma / self.k)
+        spread = self.dtype(spread)
         return (spread / 2, spread / 2)
@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from src.batch import run_batch
+
+WORKER_MODULES = (
+    "src.core.simulation_runner",
+    "src.core.multi_asset_runner",
+    "src.core.multi_agent_runner",
+    "src.simulations.arithmetic_brownian",
+    "src.simulations.geometric_brownian",
+    "src.simulations.heston",
+    "src.simulations.merton_jump_diffusion",
+    "src.strategies.avellaneda_stoikov_abm",
+    "src.strategies.hjb_avellaneda_stoikov",
+    "src.executions.poisson_execution_abm",
+    "src.calibration.intensity",
+    "src.utils.simulation_helpers",
+    "src.batch",
+)
+HEAVY_MODULES = ("matplotlib", "pandas", "seaborn")
+
+
+class TestHeadless(unittest.TestCase):
+    def test_worker_modules_do_not_load_plotting_stack(self):
+        for module in WORKER_MODULES:
+            with self.subTest(module=module):
+                # A fresh interpreter, since this process may already have pandas loaded
+                probe = f"import sys, {module}; print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+                out = subprocess.run([sys.executable, "-c", probe], check=True, capture_output=True, text=True)
+                self.assertEqual(out.stdout.strip().splitlines()[-1], "[]")
+
+    def test_batch_writes_files_only(self):
+        config = {
+            "params": {"steps": 20, "dt": 0.005, "gamma": 1.5, "k": 1.0, "sigma": 0.2, "n_simulations": 3},
+            "scenarios": [{"name": "Symmetric", "market": "ABM",
+                           "strategy": "SymmetricStrategy", "execution": "PoissonExecutionAbm"}],
+        }
+        with tempfile.TemporaryDirectory() as output_dir:
+            written = run_batch(config, output_dir)
+            names = sorted(os.path.basename(path) for path in written)
+            self.assertEqual(names, ["monte_carlo_summary.csv", "symmetric_abm_single.csv"])
+            self.assertTrue(all(os.path.getsize(path) > 0 for path in written))
+
+
+if __name__ == "__main__":
+    unittest.main()
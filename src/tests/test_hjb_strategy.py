@@ -0,0 +1,101 @@
+import tempfile
+import unittest
+import numpy as np
+from src.core.data_logger import DataLogger
+from src.core.inventory_manager import InventoryManager
+from src.core.simulation_runner import SimulationRunner
+from src.executions.poisson_execution import PoissonOrderExecution
+from src.executions.poisson_execution_abm import PoissonExecutionAbm
+from src.executions.poisson_execution_gbm import PoissonExecutionGbm
+from src.simulations.arithmetic_brownian import ArithmeticBrownianMotion
+from src.strategies.hjb_avellaneda_stoikov import HJBAvellanedaStoikovStrategy, solve_hjb_quote_tables
+
+
+class TestHJBStrategy(unittest.TestCase):
+    def setUp(self):
+        self.params = dict(gamma=0.1, sigma=2.0, k=1.5, A=140.0, T=1.0, Q=5)
+
+    def test_matches_matrix_exponential_solution(self):
+        tables = solve_hjb_quote_tables(n_time=2000, **self.params)
+        gamma, sigma, k, A, T, Q = (self.params[name] for name in ("gamma", "sigma", "k", "A", "T", "Q"))
+
+        # Closed-form w(0) = exp(-M T) 1 via the symmetric eigendecomposition of M
+        q = np.arange(-Q, Q + 1)
+        eta = A * (1 + gamma / k) ** (-(1 + k / gamma))
+        M = np.diag(0.5 * k * gamma * sigma ** 2 * q ** 2) - eta * (np.eye(q.size, k=1) + np.eye(q.size, k=-1))
+        eigval, eigvec = np.linalg.eigh(M)
+        w = eigvec @ (np.exp(-eigval * T) * (eigvec.T @ np.ones(q.size)))
+        expected_bid = np.log(w[:-1] / w[1:]) / k + np.log(1 + gamma / k) / gamma
+
+        np.testing.assert_allclose(tables["bid_spread"][-1, :-1], expected_bid, atol=5e-3)
+
+    def test_bounds_and_symmetry(self):
+        strategy = HJBAvellanedaStoikovStrategy(n_time=200, **self.params)
+        delta_bid, delta_ask = strategy.calculate_quote_distances(5, 0.5)
+        self.assertTrue(np.isinf(delta_bid))
+        self.assertTrue(np.isfinite(delta_ask))
+
+        for inventory in range(-4, 5):
+            bid, _ = strategy.calculate_quote_distances(inventory, 0.5)
+            _, ask = strategy.calculate_quote_distances(-inventory, 0.5)
+            self.assertAlmostEqual(bid, ask)
+
+        # Long inventory lowers both quotes relative to the flat book
+        mid = 100.0
+        r_flat = strategy.calculate_reservation_price(mid, 0, 0.5)
+        r_long = strategy.calculate_reservation_price(mid, 3, 0.5)
+        self.assertAlmostEqual(r_flat, mid)
+        self.assertLess(r_long, mid)
+
+        bid_spread, ask_spread = strategy.calculate_spread(mid, 3, 0.5)
+        d_bid, d_ask = strategy.calculate_quote_distances(3, 0.5)
+        self.assertAlmostEqual(r_long - bid_spread, mid - d_bid)
+        self.assertAlmostEqual(r_long + ask_spread, mid + d_ask)
+
+    def test_disk_cache_roundtrip(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            first = HJBAvellanedaStoikovStrategy(n_time=100, cache_dir=cache_dir, **self.params)
+            second = HJBAvellanedaStoikovStrategy(n_time=100, cache_dir=cache_dir, interpolate=True, **self.params)
+            np.testing.assert_array_equal(first.bid_table, second.bid_table)
+            inventory = np.array([-5, 0, 2])
+            bid, ask = second.calculate_quote_distances(inventory, np.array([0.3, 0.305, 1.0]))
+            self.assertEqual(bid.shape, (3,))
+            self.assertTrue(np.isinf(ask[0]))
+
+
+    def test_runner_leaves_the_inventory_bound(self):
+        # Regression: the spread-based executions used ask - bid, which is infinite
+        # at the bound, so neither side filled and the agent stayed at q = ±Q
+        strategy = HJBAvellanedaStoikovStrategy(gamma=0.1, sigma=2.0, k=0.75, A=140.0, T=1.0, Q=2, n_time=200)
+        for execution_class in (PoissonExecutionAbm, PoissonExecutionGbm, PoissonOrderExecution):
+            with self.subTest(execution=execution_class.__name__):
+                np.random.seed(0)
+                logger = DataLogger()
+                SimulationRunner(
+                    market=ArithmeticBrownianMotion(S0=100.0, sigma=2.0),
+                    pricing_strategy=strategy,
+                    order_execution=execution_class(A=140.0, k=0.75),
+                    inventory=InventoryManager(initial_cash=0, initial_inventory=0),
+                    logger=logger,
+                    dt=0.005,
+                    T=1.0
+                ).run()
+                inventory = np.asarray(logger.data['inventory'])
+                self.assertLessEqual(np.abs(inventory).max(), 2)
+                at_bound = np.abs(inventory) == 2
+                self.assertTrue(at_bound.any())
+                self.assertLess(at_bound.mean(), 0.5)
+                # Trades continue after the first time the bound is reached
+                first = np.argmax(at_bound)
+                self.assertGreater(np.abs(np.diff(inventory[first:])).sum(), 5)
+
+    def test_one_sided_quote_fills_only_the_quoted_side(self):
+        execution = PoissonExecutionAbm(A=1e9, k=1.0)
+        self.assertEqual(execution.execute_orders(-np.inf, 101.0, 2, 0.0, dt=1.0, mid_price=100.0), (1, 101.0))
+        self.assertEqual(execution.execute_orders(99.0, np.inf, -2, 0.0, dt=1.0, mid_price=100.0), (-1, -99.0))
+        with self.assertRaises(ValueError):
+            execution.execute_orders(-np.inf, 101.0, 2, 0.0, dt=1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
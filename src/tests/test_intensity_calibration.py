@@ -0,0 +1,85 @@
+import unittest
+import numpy as np
+from src.calibration.intensity import IntensityCalibrator
+from src.executions.batch_poisson_execution import BatchPoissonExecution
+from src.executions.poisson_execution_abm import PoissonExecutionAbm
+
+
+def synthetic_log(n, A_bid, k_bid, A_ask, k_ask, dt, seed):
+    rng = np.random.default_rng(seed)
+    side = np.where(rng.random(n) < 0.5, "bid", "ask")
+    delta = np.round(rng.uniform(0.2, 2.5, n), 2)
+    A = np.where(side == "bid", A_bid, A_ask)
+    k = np.where(side == "bid", k_bid, k_ask)
+    fills = rng.poisson(A * np.exp(-k * delta) * dt)
+    return side, delta, fills
+
+
+class TestIntensityCalibration(unittest.TestCase):
+    def setUp(self):
+        self.dt = 0.005
+        self.side, self.delta, self.fills = synthetic_log(400_000, 140.0, 1.5, 100.0, 2.0, self.dt, seed=7)
+
+    def test_recovers_parameters_per_side(self):
+        calibrator = IntensityCalibrator(resolution=0.01)
+        calibrator.partial_fit(self.side, self.delta, self.dt, self.fills)
+        estimate = calibrator.fit()
+        self.assertAlmostEqual(estimate.bid.A, 140.0, delta=4 * estimate.bid.A_se)
+        self.assertAlmostEqual(estimate.bid.k, 1.5, delta=4 * estimate.bid.k_se)
+        self.assertAlmostEqual(estimate.ask.A, 100.0, delta=4 * estimate.ask.A_se)
+        self.assertAlmostEqual(estimate.ask.k, 2.0, delta=4 * estimate.ask.k_se)
+
+    def test_chunked_merge_matches_single_pass(self):
+        single = IntensityCalibrator(resolution=0.01).partial_fit(self.side, self.delta, self.dt, self.fills)
+        merged = IntensityCalibrator(resolution=0.01)
+        for chunk in np.array_split(np.arange(self.delta.size), 4):
+            worker = IntensityCalibrator(resolution=0.01)
+            worker.partial_fit(self.side[chunk], self.delta[chunk], self.dt, self.fills[chunk])
+            merged.merge(worker)
+        self.assertAlmostEqual(single.fit().bid.k, merged.fit().bid.k, places=10)
+
+    def test_bootstrap_and_execution_construction(self):
+        calibrator = IntensityCalibrator(resolution=0.01)
+        calibrator.partial_fit(self.side, self.delta, self.dt, self.fills)
+        pooled = calibrator.fit_pooled(n_bootstrap=200, seed=0)
+        self.assertLess(pooled.k_ci[0], pooled.k)
+        self.assertGreater(pooled.k_ci[1], pooled.k)
+
+        execution = pooled.to_execution(PoissonExecutionAbm)
+        self.assertIsInstance(execution, PoissonExecutionAbm)
+        self.assertAlmostEqual(execution.k, pooled.k / 2)
+
+    def test_single_quote_distance_is_rejected(self):
+        # A constant half-spread identifies A * exp(-k * δ) but not k
+        calibrator = IntensityCalibrator(resolution=0.01)
+        delta = np.full(self.delta.size, 0.75)
+        calibrator.partial_fit(self.side, delta, self.dt, np.random.default_rng(0).poisson(0.2, delta.size))
+        with self.assertRaises(ValueError):
+            calibrator.fit()
+        with self.assertRaises(ValueError):
+            calibrator.fit_pooled()
+
+        # A second distance on each side is enough
+        calibrator.partial_fit(["bid", "ask"], [1.5, 1.5], 100 * self.dt, [3, 3])
+        with np.errstate(all="raise"):
+            estimate = calibrator.fit()
+        self.assertTrue(np.isfinite(estimate.bid.k_se) and np.isfinite(estimate.ask.k_se))
+
+    def test_asymmetric_estimate_drives_batched_fills(self):
+        calibrator = IntensityCalibrator(resolution=0.01)
+        calibrator.partial_fit(self.side, self.delta, self.dt, self.fills)
+        estimate = calibrator.fit()
+        execution = estimate.to_execution(seed=0)
+        self.assertIsInstance(execution, BatchPoissonExecution)
+
+        # Quotes one unit from the mid fill at each side's own calibrated rate
+        n = 200_000
+        mid = np.full(n, 100.0)
+        bid_filled, ask_filled = execution.fill_decisions(mid - 1.0, mid + 1.0, mid, self.dt)
+        for filled, side in ((bid_filled, estimate.bid), (ask_filled, estimate.ask)):
+            p = side.intensity(1.0) * self.dt
+            self.assertAlmostEqual(filled.mean(), p, delta=4 * np.sqrt(p / n))
+
+
+if __name__ == "__main__":
+    unittest.main()
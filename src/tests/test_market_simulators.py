@@ -0,0 +1,75 @@
+import unittest
+import numpy as np
+from src.core.batch_runner import BatchSimulationRunner
+from src.core.multi_agent_runner import MultiAgentSimulationRunner
+from src.executions.batch_poisson_execution import BatchPoissonExecution
+from src.executions.competitive_order_flow import CompetitiveOrderFlow
+from src.simulations.heston import HestonStochasticVolatility
+from src.simulations.merton_jump_diffusion import MertonJumpDiffusion
+from src.strategies.avellaneda_stoikov_abm import AvellanedaStoikovStrategyAbm
+from src.strategies.avellaneda_stoikov_gbm import AvellanedaStoikovStrategyGbm
+
+
+class TestStochasticSimulators(unittest.TestCase):
+    def setUp(self):
+        self.S0 = 100.0
+        self.steps = 50
+        self.n_paths = 20000
+
+    def test_heston_paths_shape_and_variance(self):
+        for scheme in HestonStochasticVolatility.SCHEMES:
+            market = HestonStochasticVolatility(
+                S0=self.S0, v0=0.04, kappa=2.0, theta=0.09, xi=0.5, rho=-0.7, scheme=scheme, seed=1
+            )
+            S = market.simulate_paths(self.n_paths, self.steps)
+            self.assertEqual(S.shape, (self.n_paths, self.steps + 1))
+            self.assertEqual(market.variance_paths.shape, S.shape)
+            self.assertTrue(np.all(S[:, 0] == self.S0))
+            self.assertTrue(np.all(market.variance_paths >= 0))
+
+            # Price is a martingale and the variance mean-reverts towards theta
+            expected_v = 0.09 + (0.04 - 0.09) * np.exp(-2.0)
+            self.assertAlmostEqual(S[:, -1].mean() / self.S0, 1.0, delta=0.01)
+            self.assertAlmostEqual(market.variance_paths[:, -1].mean(), expected_v, delta=0.005)
+
+    def test_merton_martingale_and_variance(self):
+        market = MertonJumpDiffusion(S0=self.S0, sigma=0.2, lam=3.0, mu_j=-0.05, sigma_j=0.1, seed=2)
+        S = market.simulate_paths(self.n_paths, self.steps)
+        self.assertEqual(S.shape, (self.n_paths, self.steps + 1))
+        self.assertAlmostEqual(S[:, -1].mean() / self.S0, 1.0, delta=0.01)
+        log_returns = np.diff(np.log(S), axis=1)
+        self.assertAlmostEqual(log_returns.var() * self.steps, market.instantaneous_variance, delta=0.005)
+
+    def test_single_path_exposes_variance_to_strategy(self):
+        market = HestonStochasticVolatility(S0=self.S0, v0=0.04, kappa=2.0, theta=0.09, xi=0.5, rho=-0.7, seed=3)
+        S = market.simulate(self.steps)
+        self.assertEqual(S.shape, (self.steps + 1,))
+        strategy = AvellanedaStoikovStrategyAbm(gamma=0.1, sigma=0.2, k=1.5, use_market_variance=True)
+        strategy.update_variance(market.variance_path[10], current_price=S[10])
+        # v is a log-return variance; the ABM formulas take an absolute price volatility
+        self.assertAlmostEqual(strategy.sigma, S[10] * np.sqrt(market.variance_path[10]))
+        with self.assertRaises(ValueError):
+            strategy.update_variance(market.variance_path[10])
+
+        gbm_strategy = AvellanedaStoikovStrategyGbm(gamma=0.1, sigma=0.2, k=1.5, use_market_variance=True)
+        gbm_strategy.update_variance(market.variance_path[10], current_price=S[10])
+        self.assertAlmostEqual(gbm_strategy.sigma, np.sqrt(market.variance_path[10]))
+
+    def test_batched_runners_and_market_variance(self):
+        params = dict(S0=self.S0, v0=0.04, kappa=2.0, theta=0.09, xi=0.5, rho=-0.7, seed=4)
+        strategy = AvellanedaStoikovStrategyAbm(gamma=0.1, sigma=0.2, k=1.5, use_market_variance=True)
+        runner = BatchSimulationRunner(HestonStochasticVolatility(**params), strategy,
+                                       BatchPoissonExecution(A=140.0, k=1.5, seed=0), n_paths=50, dt=0.01, T=1.0)
+        runner.run()
+        # The same seed rebuilds the paths; the last quote used each path's own price and variance
+        replay = HestonStochasticVolatility(**params)
+        S = replay.simulate_paths(50, runner.steps)
+        last = runner.steps - 1
+        np.testing.assert_allclose(strategy.sigma, S[:, last] * np.sqrt(replay.variance_paths[:, last]))
+
+        with self.assertRaises(ValueError):
+            MultiAgentSimulationRunner(replay, [strategy], CompetitiveOrderFlow(A=140.0, k=1.5),
+                                       n_paths=10, dt=0.01, T=1.0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import numpy as np
+from src.core.multi_agent_runner import MultiAgentSimulationRunner
+from src.executions.competitive_order_flow import CompetitiveOrderFlow
+from src.simulations.merton_jump_diffusion import MertonJumpDiffusion
+from src.strategies.avellaneda_stoikov_abm import AvellanedaStoikovStrategyAbm
+from src.strategies.hjb_avellaneda_stoikov import HJBAvellanedaStoikovStrategy
+from src.strategies.symmetric_strategy import SymmetricStrategy
+
+
+class TestMultiAgent(unittest.TestCase):
+    def setUp(self):
+        self.market = MertonJumpDiffusion(S0=100.0, sigma=0.02, lam=0.0, mu_j=0.0, sigma_j=0.0, seed=0)
+
+    def make_runner(self, strategies, n_paths=2000):
+        return MultiAgentSimulationRunner(
+            market=self.market,
+            strategies=strategies,
+            order_flow=CompetitiveOrderFlow(A=140, k=1.5, seed=1),
+            n_paths=n_paths,
+            dt=0.005,
+            T=1.0
+        )
+
+    def test_grouped_quotes_match_individual_strategies(self):
+        strategies = [
+            AvellanedaStoikovStrategyAbm(gamma=0.1, sigma=2.0, k=1.5),
+            SymmetricStrategy(gamma=0.5, sigma=2.0, k=1.5),
+            AvellanedaStoikovStrategyAbm(gamma=0.5, sigma=1.0, k=2.0),
+            HJBAvellanedaStoikovStrategy(gamma=0.1, sigma=2.0, k=1.5, A=140, T=1.0, Q=10, n_time=100),
+        ]
+        runner = self.make_runner(strategies, n_paths=3)
+        runner.inventory[:] = [[1, -2, 3, 0], [0, 0, 0, 10], [-4, 5, -1, -3]]
+        mid = np.array([100.0, 101.0, 99.0])
+        bids, asks = runner.quotes(mid, 0.4)
+        for p in range(3):
+            for a, strategy in enumerate(strategies):
+                q = runner.inventory[p, a]
+                r = strategy.calculate_reservation_price(mid[p], q, 0.4)
+                bid_spread, ask_spread = strategy.calculate_spread(mid[p], q, 0.4)
+                self.assertAlmostEqual(bids[p, a], r - bid_spread)
+                self.assertAlmostEqual(asks[p, a], r + ask_spread)
+
+    def test_best_quote_wins_and_ties_split(self):
+        strategies = [
+            SymmetricStrategy(gamma=0.1, sigma=2.0, k=1.5),
+            SymmetricStrategy(gamma=0.1, sigma=2.0, k=1.5),
+            SymmetricStrategy(gamma=0.1, sigma=2.0, k=0.5),
+        ]
+        result = self.make_runner(strategies).run()
+        share = result["market_share"]
+        self.assertAlmostEqual(share.sum(), 1.0)
+        # The third agent quotes wider and never holds the best price
+        self.assertEqual(share[2], 0.0)
+        self.assertAlmostEqual(share[0], share[1], delta=0.02)
+        self.assertTrue(np.all(result["bid_fills"] - result["ask_fills"] == result["inventory"]))
+
+    def test_repeated_runs_start_from_initial_state(self):
+        strategies = [AvellanedaStoikovStrategyAbm(gamma=0.1, sigma=2.0, k=1.5),
+                      SymmetricStrategy(gamma=0.1, sigma=2.0, k=1.5)]
+        runner = MultiAgentSimulationRunner(self.market, strategies, CompetitiveOrderFlow(A=140, k=1.5, seed=1),
+                                            n_paths=500, dt=0.005, T=1.0, initial_cash=10.0, initial_inventory=2)
+        for _ in range(2):
+            result = runner.run()
+            self.assertTrue(np.all(2 + result["bid_fills"] - result["ask_fills"] == result["inventory"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
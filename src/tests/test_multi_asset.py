@@ -0,0 +1,101 @@
+import unittest
+import numpy as np
+from src.core.multi_asset_runner import MultiAssetSimulationRunner
+from src.core.portfolio_state import PortfolioState
+from src.executions.batch_poisson_execution import BatchPoissonExecution
+from src.simulations.correlated_brownian import CorrelatedArithmeticBrownianMotion, CorrelatedGeometricBrownianMotion
+from src.strategies.avellaneda_stoikov_abm import AvellanedaStoikovStrategyAbm
+from src.strategies.multi_asset_avellaneda_stoikov import MultiAssetAvellanedaStoikovStrategy
+
+
+class TestMultiAsset(unittest.TestCase):
+    def setUp(self):
+        self.S0 = [100.0, 50.0, 20.0]
+        self.sigma = [2.0, 1.0, 0.5]
+        self.correlation = np.array([[1.0, 0.6, 0.2], [0.6, 1.0, 0.3], [0.2, 0.3, 1.0]])
+
+    def test_correlated_paths_recover_covariance(self):
+        for cls in (CorrelatedArithmeticBrownianMotion, CorrelatedGeometricBrownianMotion):
+            market = cls(self.S0, [0.2, 0.3, 0.1] if cls is CorrelatedGeometricBrownianMotion else self.sigma,
+                         self.correlation, seed=0)
+            S = market.simulate_paths(20000, 10)
+            self.assertEqual(S.shape, (20000, 11, 3))
+            increments = np.diff(np.log(S) if cls is CorrelatedGeometricBrownianMotion else S, axis=1)
+            sample_corr = np.corrcoef(increments.reshape(-1, 3).T)
+            np.testing.assert_allclose(sample_corr, self.correlation, atol=0.02)
+
+    def test_reservation_price_uses_covariance(self):
+        market = CorrelatedArithmeticBrownianMotion(self.S0, self.sigma, self.correlation)
+        strategy = MultiAssetAvellanedaStoikovStrategy(gamma=0.1, covariance=market.covariance, k=1.5)
+        inventory = np.array([[2, 0, 0], [0, 0, 0]])
+        r = strategy.calculate_reservation_price(np.array([self.S0, self.S0]), inventory, 0.5)
+        # A long position in asset 0 also lowers the reservation price of asset 1
+        self.assertLess(r[0, 1], self.S0[1])
+        np.testing.assert_allclose(r[1], self.S0)
+
+        # Single-asset case reduces to the scalar AS strategy
+        single = MultiAssetAvellanedaStoikovStrategy(gamma=0.1, covariance=[[4.0]], k=1.5)
+        scalar = AvellanedaStoikovStrategyAbm(gamma=0.1, sigma=2.0, k=1.5)
+        self.assertAlmostEqual(single.calculate_reservation_price(np.array([100.0]), np.array([3]), 0.4)[0],
+                               scalar.calculate_reservation_price(100.0, 3, 0.4))
+        self.assertAlmostEqual(single.calculate_spread(100.0, np.array([3]), 0.4)[0][0],
+                               scalar.calculate_spread(100.0, 3, 0.4)[0])
+
+    def test_batched_run(self):
+        n_paths = 500
+        market = CorrelatedArithmeticBrownianMotion(self.S0, self.sigma, self.correlation, seed=1)
+        strategy = MultiAssetAvellanedaStoikovStrategy(gamma=0.1, covariance=market.covariance, k=1.5)
+        execution = BatchPoissonExecution(A=140, k=1.5, seed=2)
+        portfolio = PortfolioState(n_paths, 3)
+        runner = MultiAssetSimulationRunner(market, strategy, execution, portfolio, dt=0.005, T=1.0,
+                                            record_wealth=True)
+        result = runner.run()
+        self.assertEqual(result["pnl"].shape, (n_paths,))
+        self.assertEqual(result["inventory"].shape, (n_paths, 3))
+        self.assertEqual(result["wealth_paths"].shape, (n_paths, 201))
+        np.testing.assert_allclose(result["wealth_paths"][:, -1], result["wealth"])
+        # The market maker earns the spread on average
+        self.assertGreater(result["pnl"].mean(), 0)
+
+    def test_log_return_covariance_is_converted_to_prices(self):
+        market = CorrelatedGeometricBrownianMotion(self.S0, [0.02, 0.03, 0.01], self.correlation)
+        S = np.array(self.S0)
+        inventory = np.array([3, -1, 2])
+        converted = MultiAssetAvellanedaStoikovStrategy(gamma=0.1, covariance=market.covariance, k=1.5,
+                                                        log_returns=True)
+        reference = MultiAssetAvellanedaStoikovStrategy(gamma=0.1, covariance=market.price_covariance(S), k=1.5)
+        np.testing.assert_allclose(converted.calculate_reservation_price(S, inventory, 0.5),
+                                   reference.calculate_reservation_price(S, inventory, 0.5))
+        np.testing.assert_allclose(converted.calculate_spread(S, inventory, 0.5),
+                                   reference.calculate_spread(S, inventory, 0.5))
+
+        # A log-return covariance read as price units is rejected
+        strategy = MultiAssetAvellanedaStoikovStrategy(gamma=0.1, covariance=market.covariance, k=1.5)
+        with self.assertRaises(ValueError):
+            MultiAssetSimulationRunner(market, strategy, BatchPoissonExecution(A=140, k=1.5), PortfolioState(10, 3),
+                                       dt=0.005, T=1.0)
+
+    def test_fifty_correlated_assets(self):
+        n_assets, n_paths = 50, 1000
+        correlation = np.full((n_assets, n_assets), 0.3)
+        np.fill_diagonal(correlation, 1.0)
+        market = CorrelatedArithmeticBrownianMotion([100.0] * n_assets, [2.0] * n_assets, correlation, seed=3)
+        strategy = MultiAssetAvellanedaStoikovStrategy(gamma=0.1, covariance=market.covariance, k=1.5)
+
+        # The aggregate skew of a few correlated positions exceeds the half-spread; quotes stop at the mid
+        S = market.initial_prices(1)
+        inventory = np.full((1, n_assets), 2)
+        reservation = strategy.calculate_reservation_price(S, inventory, 1.0)
+        bid_spread, ask_spread = strategy.calculate_spread(S, inventory, 1.0)
+        np.testing.assert_allclose(reservation + ask_spread, S)
+        self.assertTrue(np.all(reservation - bid_spread <= S))
+
+        runner = MultiAssetSimulationRunner(market, strategy, BatchPoissonExecution(A=140, k=1.5, seed=4),
+                                            PortfolioState(n_paths, n_assets), dt=0.005, T=1.0)
+        result = runner.run()
+        # Crossed quotes would fill at a loss every step and drive the mean PnL negative
+        self.assertGreater(result["pnl"].mean() / n_assets, 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import numpy as np
+from src.utils.plotting import StreamingHistogram, lttb_downsample, minmax_downsample
+
+
+class TestDownsampling(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.y = np.cumsum(rng.standard_normal(100_000))
+        self.y[12_345] += 500.0
+        self.y[67_890] -= 500.0
+
+    def test_minmax_keeps_extremes_and_endpoints(self):
+        indices, values = minmax_downsample(self.y, 500)
+        self.assertLessEqual(values.size, 1002)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+        self.assertEqual(values.max(), self.y.max())
+        self.assertEqual(values.min(), self.y.min())
+        self.assertIn(12_345, indices)
+        self.assertIn(67_890, indices)
+        self.assertEqual(indices[0], 0)
+        self.assertEqual(indices[-1], self.y.size - 1)
+
+    def test_minmax_short_series_unchanged(self):
+        indices, values = minmax_downsample(np.arange(10.0), 500)
+        np.testing.assert_array_equal(values, np.arange(10.0))
+
+    def test_lttb_point_count_and_endpoints(self):
+        x, values = lttb_downsample(self.y, 1000)
+        self.assertEqual(values.size, 1000)
+        self.assertEqual(x[0], 0)
+        self.assertEqual(x[-1], self.y.size - 1)
+        self.assertTrue(np.all(np.diff(x) > 0))
+        # A 500-wide spike is the largest triangle in its bucket
+        self.assertIn(12_345, x)
+        self.assertIn(67_890, x)
+
+
+class TestStreamingHistogram(unittest.TestCase):
+    def test_density_matches_normal(self):
+        values = np.random.default_rng(1).normal(50, 10, 200_000)
+        histogram = StreamingHistogram().update(values)
+        centres, density = histogram.density(smooth_bins=2.0)
+        self.assertEqual(histogram.total, values.size)
+        self.assertAlmostEqual(np.sum(density) * histogram.width, 1.0, places=6)
+        self.assertAlmostEqual(centres[density.argmax()], 50, delta=1.5)
+        self.assertAlmostEqual(density.max(), 1 / (10 * np.sqrt(2 * np.pi)), delta=0.002)
+
+    def test_streaming_extends_range(self):
+        histogram = StreamingHistogram(n_bins=64)
+        histogram.update(np.linspace(0, 1, 1000))
+        histogram.update([-10.0, 25.0])
+        self.assertEqual(histogram.total, 1002)
+        self.assertLessEqual(histogram.edges[0], -10.0)
+        self.assertGreater(histogram.edges[-1], 25.0)
+
+    def test_merge_equals_single_pass(self):
+        rng = np.random.default_rng(2)
+        chunks = [rng.normal(loc, 5, 20_000) for loc in (0, 10, 20)]
+        merged = StreamingHistogram()
+        for chunk in chunks:
+            merged.merge(StreamingHistogram().update(chunk))
+        single = StreamingHistogram().update(np.concatenate(chunks))
+        self.assertEqual(merged.total, single.total)
+        mean = lambda h: np.sum(h.density()[0] * h.counts) / h.total
+        self.assertAlmostEqual(mean(merged), mean(single), delta=merged.width)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+import numpy as np
+from src.core.batch_runner import BatchSimulationRunner
+from src.core.data_logger import DataLogger
+from src.executions.batch_poisson_execution import BatchPoissonExecution
+from src.simulations.arithmetic_brownian import ArithmeticBrownianMotion
+from src.simulations.geometric_brownian import GeometricBrownianMotion
+from src.strategies.avellaneda_stoikov_abm import AvellanedaStoikovStrategyAbm
+from src.strategies.symmetric_strategy import SymmetricStrategy
+
+PARAMS = dict(S0=100.0, sigma=2.0, gamma=0.1, k=1.5, A=140.0, dt=0.005, T=1.0)
+
+
+def make_runner(n_paths: int, dtype, sampling_dtype=None, seed: int = 0) -> BatchSimulationRunner:
+    """`sampling_dtype` sets the precision of the random numbers (defaults to `dtype`)."""
+    sampling_dtype = dtype if sampling_dtype is None else sampling_dtype
+    seeds = np.random.SeedSequence(seed).generate_state(2)
+    return BatchSimulationRunner(
+        market=ArithmeticBrownianMotion(S0=PARAMS["S0"], sigma=PARAMS["sigma"], dtype=sampling_dtype, seed=seeds[0]),
+        pricing_strategy=AvellanedaStoikovStrategyAbm(PARAMS["gamma"], PARAMS["sigma"], PARAMS["k"], dtype=dtype),
+        order_execution=BatchPoissonExecution(PARAMS["A"], PARAMS["k"], seed=seeds[1], dtype=sampling_dtype),
+        n_paths=n_paths, dt=PARAMS["dt"], T=PARAMS["T"], dtype=dtype
+    )
+
+
+class TestFloat32Mode(unittest.TestCase):
+    def test_simulators_generate_requested_dtype(self):
+        for simulator in (ArithmeticBrownianMotion, GeometricBrownianMotion):
+            paths = simulator(S0=100, sigma=0.2, dtype=np.float32, seed=0).simulate_paths(1000, 250)
+            self.assertEqual(paths.dtype, np.float32)
+            self.assertEqual(paths.shape, (1000, 251))
+            np.testing.assert_array_equal(paths[:, 0], 100)
+            # dt = 1 / steps, so terminal moves (ABM) or log-returns (GBM) have std sigma
+            moves = np.log(paths[:, -1] / 100) if simulator is GeometricBrownianMotion else paths[:, -1] - 100
+            self.assertAlmostEqual(moves.std(), 0.2, delta=0.02)
+
+    def test_quotes_stay_float32(self):
+        price = np.full(10, 100.0, dtype=np.float32)
+        inventory = np.arange(10, dtype=np.float32)
+        for strategy in (AvellanedaStoikovStrategyAbm(0.1, 2.0, 1.5, dtype=np.float32),
+                         SymmetricStrategy(0.1, 2.0, 1.5, dtype=np.float32)):
+            reservation = strategy.calculate_reservation_price(price, inventory, 0.5)
+            bid_spread, _ = strategy.calculate_spread(price, inventory, 0.5)
+            self.assertEqual((reservation - bid_spread).dtype, np.float32)
+
+    def test_cash_accumulates_in_float64(self):
+        execution = BatchPoissonExecution(A=140, k=1.5, seed=0, dtype=np.float32)
+        mid = np.full(1000, 100.0, dtype=np.float32)
+        inventory, cash = execution.execute_orders(mid - 0.5, mid + 0.5, np.zeros(1000, dtype=np.int64),
+                                                   np.zeros(1000), dt=0.005, mid_price=mid)
+        self.assertEqual(cash.dtype, np.float64)
+        self.assertEqual(inventory.dtype, np.int64)
+
+        result = make_runner(1000, np.float32).run()
+        self.assertEqual(result["cash"].dtype, np.float64)
+
+    def test_accuracy_against_float64_reference(self):
+        n_paths = 20_000
+        reference = make_runner(n_paths, np.float64).run()
+        single = make_runner(n_paths, np.float32).run()
+        paired = make_runner(n_paths, np.float32, sampling_dtype=np.float64).run()
+
+        se = np.sqrt((reference["pnl"].var() + single["pnl"].var()) / n_paths)
+        self.assertLess(abs(single["pnl"].mean() - reference["pnl"].mean()), 4 * se)
+
+        # Same prices and draws, only rounded: fills agree except on a handful of paths
+        error = np.abs(paired["pnl"] - reference["pnl"])
+        self.assertLess(np.mean(error > 1e-3), 2e-3)
+        self.assertLess(np.median(error), 1e-4)
+
+    def test_repeated_runs_start_from_initial_state(self):
+        runner = make_runner(1000, np.float32)
+        for _ in range(2):
+            result = runner.run()
+            # Both runs book their PnL against the initial position, not the previous run's
+            wealth = result["cash"] + result["inventory"] * result["final_price"].astype(np.float64)
+            initial_wealth = runner.initial_cash + runner.initial_inventory * PARAMS["S0"]
+            np.testing.assert_allclose(wealth - initial_wealth, result["pnl"], atol=1e-6)
+
+    def test_logger_keeps_cash_in_float64(self):
+        logger = DataLogger(dtype=np.float32)
+        for key in logger.data:
+            logger.log(key, 1)
+        dtypes = logger.get_dataframe().dtypes
+        self.assertEqual(dtypes["mid_prices"], np.float32)
+        self.assertEqual(dtypes["cash"], np.float64)
+        self.assertEqual(dtypes["inventory"], np.int64)
+
+
+if __name__ == "__main__":
+    unittest.main()
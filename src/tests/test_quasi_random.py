@@ -0,0 +1,88 @@
+import sys
+import unittest
+from unittest import mock
+import numpy as np
+from src.executions.poisson_execution_abm import PoissonExecutionAbm
+from src.simulations.arithmetic_brownian import ArithmeticBrownianMotion
+from src.simulations.geometric_brownian import GeometricBrownianMotion
+from src.simulations.quasi_random import SobolNormalSource, brownian_bridge, brownian_bridge_order
+from src.strategies.avellaneda_stoikov_abm import AvellanedaStoikovStrategyAbm
+from src.utils.risk_metrics import RiskAccumulator
+from src.utils.simulation_helpers import rqmc_estimate, run_monte_carlo
+
+
+class TestBrownianBridge(unittest.TestCase):
+    def test_order_builds_every_point_once(self):
+        for steps in (1, 7, 64, 300):
+            points, left, right = brownian_bridge_order(steps)
+            self.assertEqual(sorted(points), list(range(1, steps + 1)))
+            self.assertTrue(np.all((left < points) & (points <= right)))
+
+    def test_increments_are_standard_normal(self):
+        Z = np.random.default_rng(0).standard_normal((200_000, 10))
+        increments = brownian_bridge(Z)
+        np.testing.assert_allclose(np.cov(increments.T), np.eye(10), atol=0.01)
+        # The first input alone fixes the terminal value
+        np.testing.assert_allclose(increments.sum(axis=1), np.sqrt(10) * Z[:, 0])
+
+
+class TestSobolNormalSource(unittest.TestCase):
+    def test_single_draws_continue_the_sequence(self):
+        one_by_one = SobolNormalSource(seed=3)
+        batch = SobolNormalSource(seed=3).normals(16, 50)
+        stacked = np.vstack([one_by_one.normals(1, 50) for _ in range(16)])
+        np.testing.assert_allclose(stacked, batch, atol=1e-12)
+        with self.assertRaises(ValueError):
+            one_by_one.normals(1, 40)
+
+    def test_terminal_price_moments_are_nearly_exact(self):
+        for simulator in (ArithmeticBrownianMotion, GeometricBrownianMotion):
+            market = simulator(S0=100, sigma=0.2, normal_source=SobolNormalSource(seed=1))
+            final = market.simulate_paths(1024, 64)[:, -1]
+            expected_std = 0.2 if simulator is ArithmeticBrownianMotion else 100 * np.sqrt(np.exp(0.04) - 1)
+            # Pseudo-random paths would miss the mean by about expected_std / sqrt(1024) = 3%
+            self.assertAlmostEqual(final.mean(), 100, delta=0.005 * expected_std)
+            self.assertAlmostEqual(final.std(), expected_std, delta=0.01 * expected_std)
+
+    def test_fill_uniforms_follow_the_price_draw(self):
+        source = SobolNormalSource(seed=0, uniform_streams=2)
+        with self.assertRaises(RuntimeError):
+            source.next_uniforms()
+        source.normals(8, 5)
+        uniforms = [source.next_uniforms() for _ in range(5)]
+        self.assertEqual(uniforms[0].shape, (8, 2))
+        self.assertTrue(all(((u > 0) & (u < 1)).all() for u in uniforms))
+        with self.assertRaises(RuntimeError):
+            source.next_uniforms()
+
+    def test_scalar_execution_uses_source_draws(self):
+        source = SobolNormalSource(seed=0, uniform_streams=2)
+        source.normals(1, 3)
+        execution = PoissonExecutionAbm(A=1e9, k=1.0, uniform_source=source)
+        inventory, cash = execution.execute_orders(99.0, 101.0, 0, 0.0, dt=1.0)
+        self.assertEqual((inventory, cash), (0, 2.0))
+
+    def test_missing_scipy_raises_clear_import_error(self):
+        with mock.patch.dict(sys.modules, {"scipy.stats": None}):
+            with self.assertRaisesRegex(ImportError, "requires scipy"):
+                SobolNormalSource()
+
+
+class TestRqmcMonteCarlo(unittest.TestCase):
+    def test_run_monte_carlo_replicates(self):
+        risk = RiskAccumulator()
+        replicates = run_monte_carlo(
+            simulator=ArithmeticBrownianMotion, strategy_class=AvellanedaStoikovStrategyAbm,
+            execution_class=PoissonExecutionAbm, strategy_name="Avellaneda", market_name="ABM",
+            steps=50, dt=0.02, gamma=0.1, k=1.5, sigma=2.0, n_simulations=32, qmc_replicates=4, seed=0,
+            risk=risk
+        )
+        self.assertEqual([r.count for r in replicates], [8, 8, 8, 8])
+        self.assertEqual(risk.count, 32)
+        mean, error = rqmc_estimate(replicates)
+        self.assertAlmostEqual(mean, risk.pnl.mean)
+        self.assertTrue(np.isfinite(error) and error > 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
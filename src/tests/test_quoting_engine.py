@@ -0,0 +1,124 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+import numpy as np
+from src.core.inventory_manager import InventoryManager
+from src.live.latency import LatencyHistogram
+from src.live.quoting_engine import QuotingEngine
+from src.live.tick_sources import FileReplayTickSource, SocketTickSource
+from src.strategies.avellaneda_stoikov_abm import AvellanedaStoikovStrategyAbm
+
+
+class TestQuotingEngine(unittest.TestCase):
+    def setUp(self):
+        self.strategy = AvellanedaStoikovStrategyAbm(gamma=0.1, sigma=2.0, k=1.5)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "ticks.csv")
+        self.mids = 100 + np.arange(1000) * 0.01
+        with open(self.path, "w") as f:
+            for i, mid in enumerate(self.mids):
+                f.write(f"{i * 0.001:.3f},{mid:.2f}\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make_engine(self, coalesce):
+        return QuotingEngine(self.strategy, InventoryManager(initial_cash=0, initial_inventory=0),
+                             horizon=1.0, coalesce=coalesce)
+
+    def test_every_tick_quoted_with_strategy_prices(self):
+        engine = self.make_engine(coalesce=False)
+        quotes = []
+        engine.add_listener(quotes.append)
+        stats = asyncio.run(engine.run(FileReplayTickSource(self.path, batch_bytes=512)))
+        self.assertEqual(stats["ticks"], 1000)
+        self.assertEqual(len(quotes), 1000)
+
+        quote = quotes[500]
+        time_remaining = 1.0 - quote.timestamp
+        r = self.strategy.calculate_reservation_price(quote.mid, 0, time_remaining)
+        bid_spread, ask_spread = self.strategy.calculate_spread(quote.mid, 0, time_remaining)
+        self.assertAlmostEqual(quote.bid, r - bid_spread)
+        self.assertAlmostEqual(quote.ask, r + ask_spread)
+        self.assertEqual(engine.latency.count, 1000)
+
+    def test_coalescing_quotes_latest_tick_and_fills_requote(self):
+        engine = self.make_engine(coalesce=True)
+        quotes = []
+
+        def fill_first_bid(quote):
+            quotes.append(quote)
+            if len(quotes) == 1:
+                engine.on_fill("bid", quote.bid)
+
+        engine.add_listener(fill_first_bid)
+        stats = asyncio.run(engine.run(FileReplayTickSource(self.path, batch_bytes=4096)))
+        self.assertEqual(stats["ticks"], 1000)
+        self.assertLess(stats["quotes"], 1000)
+        self.assertAlmostEqual(quotes[-1].mid, self.mids[-1])
+        # The fill is booked and the re-quote at the same mid carries the new inventory
+        self.assertEqual(engine.inventory.inventory, 1)
+        self.assertEqual(quotes[1].mid, quotes[0].mid)
+        self.assertEqual(quotes[1].inventory, 1)
+        self.assertLess(quotes[1].bid, quotes[0].bid)
+
+    def test_socket_source(self):
+        payload = open(self.path, "rb").read()
+
+        async def scenario():
+            async def serve(reader, writer):
+                writer.write(payload)
+                await writer.drain()
+                writer.close()
+
+            server = await asyncio.start_server(serve, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                engine = self.make_engine(coalesce=False)
+                return await engine.run(SocketTickSource("127.0.0.1", port))
+
+        stats = asyncio.run(scenario())
+        self.assertEqual(stats["ticks"], 1000)
+        self.assertEqual(stats["quotes"], 1000)
+
+    def test_coalesced_latency_timed_from_oldest_tick(self):
+        class BurstSource:
+            async def batches(self):
+                now = time.perf_counter_ns()
+                # Two batches in a row: the second supersedes the first before it is quoted
+                yield np.array([0.0]), np.array([100.0]), np.array([now - 5_000_000])
+                yield np.array([0.001]), np.array([100.01]), np.array([now])
+
+        engine = self.make_engine(coalesce=True)
+        stats = asyncio.run(engine.run(BurstSource()))
+        self.assertEqual(stats["ticks"], 2)
+        self.assertEqual(stats["quotes"], 1)
+        self.assertAlmostEqual(engine.last_quote.mid, 100.01)
+        self.assertGreaterEqual(engine.latency.max_ns, 5_000_000)
+
+    def test_paced_replay_stamps_scheduled_arrivals(self):
+        async def collect():
+            return [batch async for batch in FileReplayTickSource(self.path, speed=10.0).batches()]
+
+        start = time.perf_counter_ns()
+        batches = asyncio.run(collect())
+        arrivals = np.concatenate([arrival for _, _, arrival in batches])
+        self.assertEqual(arrivals.size, 1000)
+        self.assertTrue(np.all(np.diff(arrivals) >= 0))
+        # Ticks 1ms apart replayed at 10x arrive 0.1ms apart, whatever the batching
+        self.assertAlmostEqual((arrivals[-1] - arrivals[0]) * 1e-9, 0.0999, delta=1e-6)
+        self.assertGreaterEqual(arrivals[0], start)
+
+    def test_latency_histogram_percentiles(self):
+        histogram = LatencyHistogram()
+        values = np.random.default_rng(0).integers(1_000, 5_000_000, 20_000)
+        for value in values:
+            histogram.record(int(value))
+        for p in (50, 99, 99.9):
+            self.assertAlmostEqual(histogram.percentile(p) / np.percentile(values, p), 1.0, delta=0.02)
+
+
+if __name__ == "__main__":
+    unittest.main()
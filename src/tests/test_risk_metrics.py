@@ -0,0 +1,75 @@
+import unittest
+import numpy as np
+from src.main_loops import run_simulations
+from src.strategies.symmetric_strategy import SymmetricStrategy
+from src.utils.risk_metrics import (
+    MomentAccumulator, RiskAccumulator, TDigest, max_drawdown, max_inventory_excursion
+)
+
+
+class TestStreamingSketches(unittest.TestCase):
+    def setUp(self):
+        self.values = np.random.default_rng(0).standard_t(4, size=1_000_000)
+
+    def test_merged_moments_match_numpy(self):
+        sample = self.values[:10_000]
+        parts = [MomentAccumulator().update(chunk) for chunk in np.array_split(sample, 7)]
+        moments = parts[0]
+        for part in parts[1:]:
+            moments.merge(part)
+        centred = sample - sample.mean()
+        self.assertEqual(moments.count, sample.size)
+        self.assertAlmostEqual(moments.mean, sample.mean(), places=12)
+        self.assertAlmostEqual(moments.std, sample.std(ddof=1), places=10)
+        self.assertAlmostEqual(moments.skewness, np.mean(centred ** 3) / np.mean(centred ** 2) ** 1.5, places=8)
+        self.assertAlmostEqual(moments.kurtosis, np.mean(centred ** 4) / np.mean(centred ** 2) ** 2 - 3, places=8)
+        self.assertEqual(moments.min, sample.min())
+
+    def test_digest_tail_quantiles_and_cvar(self):
+        digests = [TDigest().update(chunk) for chunk in np.array_split(self.values, 8)]
+        digest = digests[0]
+        for other in digests[1:]:
+            digest.merge(other)
+        self.assertEqual(digest.count, self.values.size)
+        self.assertLess(digest.means.size, 300)
+        for q in (0.01, 0.05, 0.5, 0.95, 0.99):
+            exact = np.quantile(self.values, q)
+            self.assertAlmostEqual(digest.quantile(q), exact, delta=0.01 * max(1.0, abs(exact)))
+        for q in (0.01, 0.05):
+            exact = self.values[self.values <= np.quantile(self.values, q)].mean()
+            self.assertAlmostEqual(digest.lower_tail_mean(q) / exact, 1.0, delta=0.02)
+        self.assertEqual(digest.quantile(0.0), self.values.min())
+        self.assertEqual(digest.quantile(1.0), self.values.max())
+
+
+class TestRiskAccumulator(unittest.TestCase):
+    def test_path_metrics(self):
+        pnl = np.array([[0.0, 2.0, -1.0, 3.0, 1.0], [0.0, -1.0, -2.0, -3.0, 4.0]])
+        inventory = np.array([[0, 1, -3, 2, 0], [0, 1, 2, 1, 0]])
+        np.testing.assert_allclose(max_drawdown(pnl), [3.0, 3.0])
+        np.testing.assert_array_equal(max_inventory_excursion(inventory), [3, 2])
+
+        risk = RiskAccumulator().update_paths(pnl[0], inventory[0])
+        risk.merge(RiskAccumulator().update_paths(pnl[1:], inventory[1:]))
+        report = risk.report(levels=(0.05,))
+        self.assertEqual(report["n_paths"], 2)
+        self.assertAlmostEqual(report["mean_pnl"], 2.5)
+        self.assertEqual(report["max_inventory"], 3)
+        self.assertEqual(report["max_drawdown"], 3.0)
+        self.assertAlmostEqual(report["var_5%"], -report["pnl_q5%"])
+        self.assertGreaterEqual(report["cvar_5%"], report["var_5%"])
+
+    def test_sweep_reports_tail_risk_reproducibly(self):
+        kwargs = dict(sigma_values=[2.0], gamma_values=[0.1], k_values=[1.5], num_runs=20, seed=3)
+        df = run_simulations(SymmetricStrategy, "Symmetric", **kwargs)
+        again = run_simulations(SymmetricStrategy, "Symmetric", **kwargs)
+        row = df.iloc[0]
+        self.assertEqual(row["n_paths"], 20)
+        for column in ("mean_profit", "std_profit", "var_1%", "cvar_5%", "mean_max_inventory", "drawdown_q95%"):
+            self.assertTrue(np.isfinite(row[column]), column)
+            self.assertEqual(row[column], again.iloc[0][column])
+        self.assertGreaterEqual(row["cvar_5%"], row["var_5%"])
+
+
+if __name__ == "__main__":
+    unittest.main()
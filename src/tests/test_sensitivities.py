@@ -0,0 +1,134 @@
+import unittest
+import numpy as np
+from src.core.batch_runner import BatchSimulationRunner
+from src.core.order_execution import quoted_spreads
+from src.executions.batch_poisson_execution import BatchPoissonExecution
+from src.executions.batch_poisson_order_execution import BatchPoissonOrderExecution
+from src.executions.poisson_execution import PoissonOrderExecution
+from src.main_loops import run_simulations
+from src.simulations.arithmetic_brownian import ArithmeticBrownianMotion
+from src.simulations.geometric_brownian import GeometricBrownianMotion
+from src.strategies.avellaneda_stoikov_abm import AvellanedaStoikovStrategyAbm
+from src.strategies.hjb_avellaneda_stoikov import HJBAvellanedaStoikovStrategy
+
+PARAMS = dict(S0=100.0, sigma=2.0, gamma=0.1, k=1.5, A=140.0, dt=0.005, T=1.0)
+
+
+def make_runner(n_paths: int, seed=0, sensitivities: tuple = (), **overrides) -> BatchSimulationRunner:
+    p = {**PARAMS, **overrides}
+    market_seed, fill_seed = np.random.SeedSequence(seed).spawn(2)
+    return BatchSimulationRunner(
+        market=ArithmeticBrownianMotion(S0=p["S0"], sigma=p["sigma"], seed=market_seed),
+        pricing_strategy=AvellanedaStoikovStrategyAbm(p["gamma"], p["sigma"], p["k"]),
+        order_execution=BatchPoissonExecution(p["A"], p["k"], seed=fill_seed),
+        n_paths=n_paths, dt=p["dt"], T=p["T"], sensitivities=sensitivities
+    )
+
+
+def finite_difference(name: str, h: float, n_paths: int, n_repeats: int) -> dict:
+    """Central difference of mean PnL and inventory variance with common random numbers, pooled over seeds."""
+    pnl, variance = [], []
+    for seed in range(100, 100 + n_repeats):
+        up = make_runner(n_paths, seed, **{name: PARAMS[name] + h}).run()
+        down = make_runner(n_paths, seed, **{name: PARAMS[name] - h}).run()
+        pnl.append((up["pnl"].mean() - down["pnl"].mean()) / (2 * h))
+        variance.append((up["inventory"].var() - down["inventory"].var()) / (2 * h))
+    return {
+        "pnl": np.mean(pnl), "pnl_se": np.std(pnl, ddof=1) / np.sqrt(n_repeats),
+        "inventory_variance": np.mean(variance),
+        "inventory_variance_se": np.std(variance, ddof=1) / np.sqrt(n_repeats)
+    }
+
+
+class TestSigmaSensitivity(unittest.TestCase):
+    def test_matches_bumped_paths(self):
+        h = 1e-6
+        for simulator in (ArithmeticBrownianMotion, GeometricBrownianMotion):
+            paths = simulator(S0=100, sigma=0.3, seed=0).simulate_paths(100, 50)
+            up = simulator(S0=100, sigma=0.3 + h, seed=0).simulate_paths(100, 50)
+            down = simulator(S0=100, sigma=0.3 - h, seed=0).simulate_paths(100, 50)
+            sensitivity = simulator(S0=100, sigma=0.3).sigma_sensitivity(paths)
+            np.testing.assert_allclose(sensitivity, (up - down) / (2 * h), atol=1e-6)
+
+
+class TestFillModelGradients(unittest.TestCase):
+    def test_gradients_match_the_intensities(self):
+        mid = np.array([100.0, 100.0, 100.0])
+        bid = np.array([99.2, 99.5, 99.4])
+        ask = np.array([100.9, np.inf, 100.3])
+        h = 1e-6
+        for execution in (BatchPoissonExecution(140, 1.5, A_ask=120, k_ask=2.0), BatchPoissonOrderExecution(140, 1.5)):
+            gradients = execution.log_intensity_gradients(bid, ask, mid)
+            for key, shift in (("bid", (h, 0, 0)), ("ask", (0, h, 0)), ("mid", (0, 0, h))):
+                up = execution.intensities(bid + shift[0], ask + shift[1], mid + shift[2])
+                down = execution.intensities(bid - shift[0], ask - shift[1], mid - shift[2])
+                for side in (0, 1):
+                    with np.errstate(divide="ignore", invalid="ignore"):
+                        numeric = (np.log(up[side]) - np.log(down[side])) / (2 * h)
+                    quoted = np.isfinite(numeric)
+                    np.testing.assert_allclose(np.broadcast_to(gradients[side][key], mid.shape)[quoted],
+                                               numeric[quoted], atol=1e-5, err_msg=key)
+
+    def test_half_spread_model_matches_the_sweep_execution(self):
+        batch = BatchPoissonOrderExecution(140, 1.5)
+        for bid, ask in ((99.2, 100.9), (99.5, np.inf), (-np.inf, 100.3)):
+            # PoissonOrderExecution fills each side at A * exp(-k * spread / 2) with these spreads
+            expected = 140 * np.exp(-1.5 * np.array(quoted_spreads(bid, ask, 100.0)) / 2)
+            intensities = batch.intensities(np.array([bid]), np.array([ask]), np.array([100.0]))
+            np.testing.assert_allclose(np.concatenate(intensities), expected)
+
+
+class TestSinglePassSensitivities(unittest.TestCase):
+    def test_run_is_unchanged(self):
+        plain = make_runner(2000, seed=5).run()
+        with_sensitivities = make_runner(2000, seed=5, sensitivities=("gamma", "k", "sigma")).run()
+        np.testing.assert_array_equal(plain["pnl"], with_sensitivities["pnl"])
+        np.testing.assert_array_equal(plain["inventory"], with_sensitivities["inventory"])
+        self.assertNotIn("sensitivities", plain)
+        self.assertEqual(set(with_sensitivities["sensitivities"]), {"gamma", "k", "sigma"})
+
+    def test_matches_finite_differences(self):
+        estimate = make_runner(20_000, seed=7, sensitivities=("k",)).run()["sensitivities"]["k"]
+        reference = finite_difference("k", 0.03, 20_000, n_repeats=4)
+        for quantity in ("pnl", "inventory_variance"):
+            se = np.hypot(estimate[f"{quantity}_se"], reference[f"{quantity}_se"])
+            self.assertLess(abs(estimate[quantity] - reference[quantity]), 4 * se, quantity)
+        # Wider quotes earn fewer fills: expected PnL falls with k at these parameters
+        self.assertLess(estimate["pnl"], 0)
+
+    def test_sweep_reports_sensitivities_per_cell(self):
+        grid = dict(strategy_class=AvellanedaStoikovStrategyAbm, strategy_name='Inventory', sigma_values=[2.0],
+                    gamma_values=[0.1], k_values=[1.5], num_runs=200, seed=0)
+        plain = run_simulations(**grid)
+        with_sensitivities = run_simulations(**grid, sensitivities=("k",))
+        self.assertEqual(with_sensitivities['mean_profit'].iloc[0], plain['mean_profit'].iloc[0])
+        self.assertNotIn('dprofit_dk', plain)
+        self.assertNotIn('dprofit_dgamma', with_sensitivities)
+        # Same half-spread model as the cell: dPnL/dk is about -46 at these parameters
+        self.assertLess(abs(with_sensitivities['dprofit_dk'].iloc[0] + 46.4),
+                        5 * with_sensitivities['se_dprofit_dk'].iloc[0])
+
+    def test_rejects_parameters_outside_the_quote_formulas(self):
+        with self.assertRaises(ValueError):
+            make_runner(10, sensitivities=("A",))
+        with self.assertRaises(ValueError):
+            BatchSimulationRunner(
+                market=ArithmeticBrownianMotion(S0=PARAMS["S0"], sigma=PARAMS["sigma"]),
+                pricing_strategy=HJBAvellanedaStoikovStrategy(PARAMS["gamma"], PARAMS["sigma"], PARAMS["k"], PARAMS["A"],
+                                                              T=PARAMS["T"], Q=5, n_time=10),
+                order_execution=BatchPoissonExecution(PARAMS["A"], PARAMS["k"]),
+                n_paths=10, dt=PARAMS["dt"], T=PARAMS["T"], sensitivities=("gamma",)
+            )
+
+    def test_rejects_executions_without_fill_gradients(self):
+        with self.assertRaises(ValueError):
+            BatchSimulationRunner(
+                market=ArithmeticBrownianMotion(S0=PARAMS["S0"], sigma=PARAMS["sigma"]),
+                pricing_strategy=AvellanedaStoikovStrategyAbm(PARAMS["gamma"], PARAMS["sigma"], PARAMS["k"]),
+                order_execution=PoissonOrderExecution(PARAMS["A"], PARAMS["k"]),
+                n_paths=10, dt=PARAMS["dt"], T=PARAMS["T"], sensitivities=("k",)
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+import numpy as np
+from src.strategies.avellaneda_stoikov_abm import AvellanedaStoikovStrategyAbm
+from src.tuning import successive_halving
+
+SEARCH = dict(strategy_class=AvellanedaStoikovStrategyAbm, sigma=2.0, k=1.5,
+              gamma_values=[0.01, 5.0], k_offsets=[-0.5, 0.5], min_runs=10, max_runs=40, eta=2, chunk_size=10)
+
+
+class TestSuccessiveHalving(unittest.TestCase):
+    def test_budget_schedule(self):
+        result = successive_halving(**SEARCH, seed=0)
+        history = result['history']
+        # 4 candidates x 10 paths, 2 topped up to 20, the last one to 40
+        self.assertEqual(history.groupby('round').size().tolist(), [4, 2, 1])
+        self.assertEqual(history.groupby('round')['n_paths'].max().tolist(), [10, 20, 40])
+        self.assertEqual(result['total_paths'], 4 * 10 + 2 * 10 + 1 * 20)
+        self.assertEqual(result['grid_paths'], 4 * 40)
+        self.assertEqual(result['n_paths'], 40)
+
+    def test_picks_the_dominant_candidate(self):
+        # A very risk-averse quoter at the far side of the grid earns a fraction of the PnL
+        for objective in ("mean_variance", "sharpe", lambda risk: risk.pnl.mean):
+            result = successive_halving(**SEARCH, objective=objective, seed=1)
+            self.assertEqual(result['gamma'], 0.01)
+            self.assertTrue(np.isfinite(result['objective']))
+
+    def test_reproducible_across_worker_counts(self):
+        serial = successive_halving(**SEARCH, seed=2)
+        parallel = successive_halving(**SEARCH, n_jobs=2, seed=2)
+        self.assertEqual((serial['gamma'], serial['k_offset']), (parallel['gamma'], parallel['k_offset']))
+        np.testing.assert_array_equal(serial['history']['mean_pnl'], parallel['history']['mean_pnl'])
+
+    def test_rejects_non_positive_quoting_depth(self):
+        with self.assertRaises(ValueError):
+            successive_halving(**{**SEARCH, 'k_offsets': [0.0, -1.5]}, seed=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+import functools
+import itertools
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.main_loops import run_chunk
+from src.strategies.avellaneda_stoikov_abm import AvellanedaStoikovStrategyAbm
+from src.utils.risk_metrics import RiskAccumulator
+
+
+def mean_variance(risk: RiskAccumulator, risk_aversion: float = 0.05) -> float:
+    """Mean PnL minus risk_aversion times the PnL variance."""
+    return risk.pnl.mean - risk_aversion * risk.pnl.variance
+
+
+def sharpe(risk: RiskAccumulator) -> float:
+    """Mean PnL per unit of PnL standard deviation."""
+    return risk.pnl.mean / risk.pnl.std if risk.pnl.std > 0 else -np.inf
+
+
+OBJECTIVES = {"mean_variance": mean_variance, "sharpe": sharpe}
+
+
+def _chunk_sizes(num_runs: int, chunk_size: int) -> np.ndarray:
+    n_chunks = max(1, math.ceil(num_runs / chunk_size))
+    return np.diff(np.linspace(0, num_runs, n_chunks + 1).astype(int))
+
+
+def successive_halving(strategy_class, sigma, k, gamma_values, k_offsets=(0.0,), objective="mean_variance",
+                       risk_aversion=0.05, min_runs=50, max_runs=1000, eta=3, chunk_size=50, n_jobs=1, seed=None):
+    """
+    Finds the (gamma, k_offset) pair maximizing `objective` by successive halving.
+
+    Every candidate of the grid gamma_values x k_offsets is simulated with
+    `min_runs` paths; the best 1/eta of them are kept and topped up to eta
+    times as many paths, and so on until the survivors reach `max_runs`. A
+    candidate's RiskAccumulator is merged with each top-up, so no path is ever
+    simulated twice, and clearly dominated candidates stop costing paths after
+    the first round. The strategy quotes with depth k + k_offset while fills
+    decay with the market's k, as in `run_simulations` with a quote offset.
+
+    All candidates of a round are simulated with the same seeds (common random
+    numbers), so they are compared on identical price paths and fill draws.
+    Chunks of `chunk_size` paths are spread over `n_jobs` worker processes;
+    seeds depend only on `seed` and the chunking, so results do not depend on
+    `n_jobs`.
+
+    Args:
+        strategy_class (type): Pricing strategy taking gamma, sigma and k.
+        sigma (float): Volatility of the market and the strategy.
+        k (float): Market depth of the fills.
+        gamma_values (list): Candidate risk aversions.
+        k_offsets (list): Candidate offsets of the quoting depth from k.
+        objective (str or callable): "mean_variance", "sharpe", or a function of
+            a RiskAccumulator returning the value to maximize.
+        risk_aversion (float): Variance penalty of the "mean_variance" objective.
+        min_runs (int): Paths per candidate in the first round.
+        max_runs (int): Paths per candidate in the final round.
+        eta (int): Reduction factor between rounds.
+        chunk_size (int): Paths per worker task.
+        n_jobs (int): Number of worker processes.
+        seed (int, optional): Seed of the root SeedSequence.
+
+    Returns:
+        dict: The best "gamma", "k_offset", "objective", "mean_pnl", "std_pnl"
+        and "n_paths"; "total_paths" simulated against the "grid_paths" of an
+        exhaustive grid with max_runs per cell; and "history", a DataFrame with
+        one row per candidate and round.
+
+    Raises:
+        ValueError: If k + k_offset is not positive for some offset, so that a
+            candidate would quote with a non-positive depth.
+    """
+    import pandas as pd
+
+    invalid = [k_offset for k_offset in k_offsets if not k + k_offset > 0]
+    if invalid:
+        raise ValueError(f"k + k_offset must be positive for every offset; k={k} with offsets {invalid}")
+    if objective == "mean_variance":
+        objective = functools.partial(mean_variance, risk_aversion=risk_aversion)
+    elif isinstance(objective, str):
+        objective = OBJECTIVES[objective]
+
+    candidates = list(itertools.product(gamma_values, k_offsets))
+    risks = {candidate: RiskAccumulator() for candidate in candidates}
+    root = np.random.SeedSequence(seed)
+    survivors = candidates
+    target = min(min_runs, max_runs)
+    total_paths = 0
+    history = []
+    pool = ProcessPoolExecutor(max_workers=n_jobs) if n_jobs > 1 else None
+    try:
+        for round_index in itertools.count():
+            # Every survivor holds the same number of paths, so one set of seeds serves all
+            sizes = _chunk_sizes(target - risks[survivors[0]].count, chunk_size)
+            chunk_seeds = root.spawn(1)[0].spawn(len(sizes))
+            tasks = [
+                (strategy_class, sigma, gamma, k, size, chunk_seed, False, k_offset)
+                for gamma, k_offset in survivors
+                for size, chunk_seed in zip(sizes, chunk_seeds)
+            ]
+            chunks = list(pool.map(run_chunk, tasks)) if pool else [run_chunk(task) for task in tasks]
+            total_paths += int(sizes.sum()) * len(survivors)
+
+            scores = {}
+            for index, candidate in enumerate(survivors):
+                for chunk_risk, _ in chunks[index * len(sizes):(index + 1) * len(sizes)]:
+                    risks[candidate].merge(chunk_risk)
+                risk = risks[candidate]
+                scores[candidate] = objective(risk)
+                history.append({
+                    'round': round_index,
+                    'gamma': candidate[0],
+                    'k_offset': candidate[1],
+                    'n_paths': risk.count,
+                    'mean_pnl': risk.pnl.mean,
+                    'std_pnl': risk.pnl.std,
+                    'objective': scores[candidate]
+                })
+
+            survivors = sorted(survivors, key=scores.get, reverse=True)
+            if target >= max_runs:
+                break
+            survivors = survivors[:math.ceil(len(survivors) / eta)]
+            target = max_runs if len(survivors) == 1 else min(target * eta, max_runs)
+    finally:
+        if pool:
+            pool.shutdown()
+
+    best = survivors[0]
+    return {
+        'gamma': best[0],
+        'k_offset': best[1],
+        'objective': scores[best],
+        'mean_pnl': risks[best].pnl.mean,
+        'std_pnl': risks[best].pnl.std,
+        'n_paths': risks[best].count,
+        'total_paths': total_paths,
+        'grid_paths': len(candidates) * max_runs,
+        'history': pd.DataFrame(history)
+    }
+
+
+def main():
+    gamma_values = np.geomspace(0.01, 1.0, 9)
+    k_offsets = [-0.5, 0.0, 0.5, 1.0]
+    n_jobs = os.cpu_count() or 1
+
+    for objective in ("mean_variance", "sharpe"):
+        result = successive_halving(AvellanedaStoikovStrategyAbm, sigma=2.0, k=1.5, gamma_values=gamma_values,
+                                    k_offsets=k_offsets, objective=objective, n_jobs=n_jobs, seed=0)
+        result['history'].to_csv(f'tuning_{objective}.csv', index=False)
+        print(f"{objective}: gamma={result['gamma']:.4f}, k_offset={result['k_offset']:+.2f}, "
+              f"objective={result['objective']:.3f} from {result['n_paths']} paths; "
+              f"{result['total_paths']} paths in total against {result['grid_paths']} for the full grid")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,192 @@
+# utils/plotting.py
+import numpy as np
+from typing import Optional
+
+# Matplotlib is imported inside the plotting functions; the downsampling and
+# histogram helpers are plain numpy and safe to use in headless workers.
+
+
+def minmax_downsample(y, n_buckets: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Keeps the minimum and maximum of each of `n_buckets` equal slices of `y`.
+
+    With one bucket per horizontal pixel the rendered line is identical to the
+    full-resolution one: every spike survives and nothing is interpolated.
+
+    Returns:
+        (indices, values): At most 2 * n_buckets + 2 points in index order, endpoints included.
+    """
+    y = np.asarray(y)
+    n = y.size
+    if n <= 2 * n_buckets:
+        return np.arange(n), y
+    size = n // n_buckets
+    body = y[:size * n_buckets].reshape(n_buckets, size)
+    offsets = np.arange(n_buckets) * size
+    lo = body.argmin(axis=1) + offsets
+    hi = body.argmax(axis=1) + offsets
+    indices = np.sort(np.concatenate([[0], lo, hi, [n - 1]]))
+    indices = indices[np.concatenate([[True], np.diff(indices) > 0])]
+    return indices, y[indices]
+
+
+def lttb_downsample(y, n_out: int, x=None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Largest-Triangle-Three-Buckets downsampling to `n_out` points.
+
+    Keeps the first and last points and, from each bucket in between, the point
+    forming the largest triangle with the previously selected point and the
+    mean of the next bucket. Preserves the visual shape of smooth traces with
+    fewer points than min-max, at the cost of a Python loop over buckets.
+
+    Returns:
+        (x, y) of the selected points.
+    """
+    y = np.asarray(y, dtype=float)
+    x = np.arange(y.size, dtype=float) if x is None else np.asarray(x, dtype=float)
+    n = y.size
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    selected = np.empty(n_out, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        next_start, next_stop = stop, edges[i + 2] if i + 2 < n_out - 1 else n
+        avg_x = x[next_start:next_stop].mean()
+        avg_y = y[next_start:next_stop].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:stop] - y[a]) - (x[a] - x[start:stop]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        selected[i + 1] = a
+    return x[selected], y[selected]
+
+
+def downsample(y, n_points: int, method: str = "minmax") -> tuple[np.ndarray, np.ndarray]:
+    """Downsamples a series against its index with "minmax" (n_points // 2 buckets) or "lttb"."""
+    if method == "minmax":
+        return minmax_downsample(y, max(1, n_points // 2))
+    if method == "lttb":
+        return lttb_downsample(y, n_points)
+    raise ValueError(f"unknown downsampling method {method!r}")
+
+
+class StreamingHistogram:
+    """
+    Fixed-size histogram whose range grows as data arrives.
+
+    Values are binned into `n_bins` equal bins. When a value falls outside the
+    current range the bin width is doubled (adjacent bins are merged pairwise)
+    until it fits, so memory stays constant no matter how many values are seen.
+    Histograms can be merged, which lets Monte Carlo workers bin their own
+    paths and the plot build a PnL density without ever holding raw rows.
+    """
+
+    def __init__(self, n_bins: int = 512):
+        if n_bins % 2:
+            raise ValueError("n_bins must be even")
+        self.n_bins = n_bins
+        self.counts = np.zeros(n_bins)
+        self.origin = None
+        self.width = None
+
+    @property
+    def edges(self) -> np.ndarray:
+        return self.origin + self.width * np.arange(self.n_bins + 1)
+
+    @property
+    def total(self) -> float:
+        return self.counts.sum()
+
+    def _double(self, extend_left: bool) -> None:
+        shift = self.n_bins if extend_left else 0
+        index = (np.arange(self.n_bins) + shift) // 2
+        self.counts = np.bincount(index, weights=self.counts, minlength=self.n_bins)
+        self.origin -= shift * self.width
+        self.width *= 2
+
+    def _cover(self, lo: float, hi: float) -> None:
+        if self.origin is None:
+            span = hi - lo
+            self.width = span / (self.n_bins - 1) if span > 0 else max(abs(lo) * 1e-6, 1e-12)
+            self.origin = lo
+            return
+        while lo < self.origin or hi >= self.origin + self.n_bins * self.width:
+            self._double(extend_left=lo < self.origin)
+
+    def update(self, values) -> "StreamingHistogram":
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return self
+        self._cover(values.min(), values.max())
+        index = np.minimum(((values - self.origin) / self.width).astype(int), self.n_bins - 1)
+        self.counts += np.bincount(index, minlength=self.n_bins)
+        return self
+
+    def merge(self, other: "StreamingHistogram") -> "StreamingHistogram":
+        """Adds another histogram; its bin centres are re-binned onto this grid."""
+        if other.origin is None:
+            return self
+        centres = other.edges[:-1] + other.width / 2
+        occupied = other.counts > 0
+        self._cover(centres[occupied].min(), centres[occupied].max())
+        while self.width < other.width:
+            self._double(extend_left=False)
+        index = np.minimum(((centres[occupied] - self.origin) / self.width).astype(int), self.n_bins - 1)
+        self.counts += np.bincount(index, weights=other.counts[occupied], minlength=self.n_bins)
+        return self
+
+    def density(self, smooth_bins: float = 0.0) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns bin centres and a normalised density.
+
+        Args:
+            smooth_bins (float): Standard deviation, in bins, of a Gaussian kernel
+                applied to the counts (a binned kernel density estimate).
+        """
+        counts = self.counts
+        if smooth_bins > 0:
+            radius = int(np.ceil(4 * smooth_bins))
+            kernel = np.exp(-0.5 * (np.arange(-radius, radius + 1) / smooth_bins) ** 2)
+            counts = np.convolve(counts, kernel / kernel.sum(), mode="same")
+        centres = self.edges[:-1] + self.width / 2
+        return centres, counts / max(counts.sum() * self.width, 1e-300)
+
+
+def _pixel_width(ax) -> int:
+    return max(100, int(ax.get_window_extent().width))
+
+
+def plot_series(ax, y, method: str = "minmax", n_points: Optional[int] = None, **kwargs):
+    """Plots a downsampled series; by default one min-max bucket per horizontal pixel."""
+    if n_points is None:
+        n_points = 2 * _pixel_width(ax)
+    x, values = downsample(np.asarray(y), n_points, method)
+    return ax.plot(x, values, **kwargs)
+
+
+def plot_pnl_density(histograms: dict, ax=None, smooth_bins: float = 2.0, title: str = "Final PnL Distribution"):
+    """
+    Plots one density line per label from `StreamingHistogram` objects.
+
+    Args:
+        histograms (dict): Mapping from label to a StreamingHistogram of terminal PnL.
+        ax: Matplotlib axes to draw on; a new figure is created when omitted.
+        smooth_bins (float): Gaussian smoothing of the binned counts, in bins.
+    """
+    import matplotlib.pyplot as plt
+
+    if ax is None:
+        _, ax = plt.subplots(figsize=(10, 6))
+    for label, histogram in histograms.items():
+        centres, density = histogram.density(smooth_bins)
+        ax.plot(centres, density, label=label, linewidth=2.0)
+    ax.set_title(title)
+    ax.set_xlabel("PnL")
+    ax.set_ylabel("Density")
+    ax.legend()
+    ax.grid(True)
+    return ax
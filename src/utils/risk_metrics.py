@@ -0,0 +1,316 @@
+# utils/risk_metrics.py
+import numpy as np
+from typing import Optional
+
+
+def max_drawdown(pnl_paths) -> np.ndarray:
+    """Largest peak-to-trough fall of each PnL path (along the last axis)."""
+    pnl_paths = np.asarray(pnl_paths, dtype=float)
+    return np.max(np.maximum.accumulate(pnl_paths, axis=-1) - pnl_paths, axis=-1)
+
+
+def max_inventory_excursion(inventory_paths) -> np.ndarray:
+    """Largest absolute inventory held over each path (along the last axis)."""
+    return np.max(np.abs(np.asarray(inventory_paths)), axis=-1)
+
+
+class MomentAccumulator:
+    """
+    Streaming count, mean, central moments up to order four, minimum and maximum.
+
+    Batches are reduced with numpy and combined with the pairwise update
+    formulas of Chan et al. / Pébay, so accumulators filled by different
+    workers can be merged exactly.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values) -> "MomentAccumulator":
+        values = np.asarray(values, dtype=float).ravel()
+        if values.size == 0:
+            return self
+        batch = MomentAccumulator()
+        batch.count = values.size
+        batch.mean = values.mean()
+        centred = values - batch.mean
+        squared = centred * centred
+        batch.m2 = squared.sum()
+        batch.m3 = (squared * centred).sum()
+        batch.m4 = (squared * squared).sum()
+        batch.min = values.min()
+        batch.max = values.max()
+        return self.merge(batch)
+
+    def merge(self, other: "MomentAccumulator") -> "MomentAccumulator":
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.__dict__.update(other.__dict__)
+            return self
+        na, nb = self.count, other.count
+        n = na + nb
+        delta = other.mean - self.mean
+        delta_n = delta / n
+        m4 = (self.m4 + other.m4
+              + delta * delta_n ** 3 * na * nb * (na * na - na * nb + nb * nb)
+              + 6 * delta_n ** 2 * (na * na * other.m2 + nb * nb * self.m2)
+              + 4 * delta_n * (na * other.m3 - nb * self.m3))
+        m3 = (self.m3 + other.m3
+              + delta * delta_n ** 2 * na * nb * (na - nb)
+              + 3 * delta_n * (na * other.m2 - nb * self.m2))
+        self.m2 += other.m2 + delta * delta_n * na * nb
+        self.m3, self.m4 = m3, m4
+        self.mean += delta_n * nb
+        self.count = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (ddof=1)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else np.nan
+
+    @property
+    def std(self) -> float:
+        return np.sqrt(self.variance)
+
+    @property
+    def skewness(self) -> float:
+        return np.sqrt(self.count) * self.m3 / self.m2 ** 1.5 if self.m2 > 0 else np.nan
+
+    @property
+    def kurtosis(self) -> float:
+        """Excess kurtosis."""
+        return self.count * self.m4 / self.m2 ** 2 - 3 if self.m2 > 0 else np.nan
+
+
+class TDigest:
+    """
+    Mergeable quantile sketch (merging t-digest).
+
+    Values are buffered and periodically compressed into at most about
+    `compression / 2` weighted centroids. Centroid sizes follow the arcsine
+    scale function, so centroids are tiny in the tails and large around the
+    median: extreme quantiles such as 1% or 0.1% stay accurate while memory is
+    independent of the number of values. Compression is fully vectorized
+    (sort, cumulative weights, bin by scale function, reduce).
+    """
+
+    def __init__(self, compression: float = 500, buffer_size: Optional[int] = None):
+        """
+        Args:
+            compression (float): Accuracy parameter δ; more centroids, smaller errors.
+            buffer_size (int, optional): Values buffered between compressions
+                (defaults to 10 * compression).
+        """
+        self.compression = compression
+        self.buffer_size = buffer_size or int(10 * compression)
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min = np.inf
+        self.max = -np.inf
+        self._buffer = []
+        self._buffered = 0
+
+    @property
+    def count(self) -> float:
+        self._flush()
+        return self.weights.sum()
+
+    def update(self, values) -> "TDigest":
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return self
+        self._buffer.append((values, None))
+        self._buffered += values.size
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        if self._buffered >= self.buffer_size:
+            self._flush()
+        return self
+
+    def merge(self, other: "TDigest") -> "TDigest":
+        other._flush()
+        if other.weights.size == 0:
+            return self
+        self._buffer.append((other.means, other.weights))
+        self._buffered += other.weights.size
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._flush()
+        return self
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+        means = np.concatenate([self.means] + [values for values, _ in self._buffer])
+        weights = np.concatenate([self.weights] + [
+            np.ones(values.size) if w is None else w for values, w in self._buffer
+        ])
+        self._buffer = []
+        self._buffered = 0
+
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+        cumulative = np.cumsum(weights)
+        q = (cumulative - weights / 2) / cumulative[-1]
+        scale = np.floor(self.compression / (2 * np.pi) * np.arcsin(2 * q - 1))
+        starts = np.flatnonzero(np.concatenate([[True], np.diff(scale) > 0]))
+        self.weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / self.weights
+
+    def _knots(self) -> tuple[np.ndarray, np.ndarray]:
+        # Piecewise-linear quantile function through (rank, value) knots:
+        # the minimum, each centroid at the middle of its weight, the maximum
+        self._flush()
+        cumulative = np.cumsum(self.weights)
+        ranks = np.concatenate([[0.0], cumulative - self.weights / 2, [cumulative[-1]]])
+        values = np.concatenate([[self.min], self.means, [self.max]])
+        return ranks, values
+
+    def quantile(self, q):
+        """Estimated q-quantile(s), q in [0, 1]."""
+        if self.count == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+        ranks, values = self._knots()
+        return np.interp(np.asarray(q) * ranks[-1], ranks, values)
+
+    def lower_tail_mean(self, q):
+        """Estimated mean of the values at or below the q-quantile(s)."""
+        if self.count == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+        ranks, values = self._knots()
+        areas = np.concatenate([[0.0], np.cumsum(np.diff(ranks) * (values[1:] + values[:-1]) / 2)])
+        target = np.maximum(np.asarray(q, dtype=float) * ranks[-1], 1e-300)
+        segment = np.clip(np.searchsorted(ranks, target, side="right") - 1, 0, ranks.size - 2)
+        width = ranks[segment + 1] - ranks[segment]
+        fraction = np.where(width > 0, (target - ranks[segment]) / np.where(width > 0, width, 1), 0.0)
+        end_value = values[segment] + fraction * (values[segment + 1] - values[segment])
+        partial = (target - ranks[segment]) * (values[segment] + end_value) / 2
+        return (areas[segment] + partial) / target
+
+
+def _level_label(level: float) -> str:
+    return f"{100 * level:g}%"
+
+
+class RiskAccumulator:
+    """
+    Mergeable per-path risk statistics of a Monte Carlo run.
+
+    Each simulated path contributes its terminal PnL, final inventory, maximum
+    absolute inventory and maximum PnL drawdown. Moments and t-digest sketches
+    of these quantities are kept instead of the paths, so workers can each fill
+    an accumulator, merge them, and report quantiles, VaR and CVaR for runs of
+    any size in constant memory.
+    """
+
+    def __init__(self, compression: float = 500):
+        self.pnl = MomentAccumulator()
+        self.pnl_digest = TDigest(compression)
+        self.inventory = MomentAccumulator()
+        self.max_inventory = MomentAccumulator()
+        self.max_inventory_digest = TDigest(compression)
+        self.drawdown = MomentAccumulator()
+        self.drawdown_digest = TDigest(compression)
+
+    @property
+    def count(self) -> int:
+        return self.pnl.count
+
+    def update(self, pnl, final_inventory=None, max_inventory=None, max_drawdown=None) -> "RiskAccumulator":
+        """
+        Adds path-level results; every argument holds one value per path.
+
+        Args:
+            pnl: Terminal PnL.
+            final_inventory: Terminal inventory.
+            max_inventory: Maximum absolute inventory over the path.
+            max_drawdown: Maximum PnL drawdown over the path.
+        """
+        self.pnl.update(pnl)
+        self.pnl_digest.update(pnl)
+        if final_inventory is not None:
+            self.inventory.update(final_inventory)
+        if max_inventory is not None:
+            self.max_inventory.update(max_inventory)
+            self.max_inventory_digest.update(max_inventory)
+        if max_drawdown is not None:
+            self.drawdown.update(max_drawdown)
+            self.drawdown_digest.update(max_drawdown)
+        return self
+
+    def update_paths(self, pnl_paths, inventory_paths) -> "RiskAccumulator":
+        """
+        Adds whole paths, shaped (steps,) for one path or (n_paths, steps).
+
+        The PnL path is marked to market (cash + inventory * mid) at every step.
+        """
+        pnl_paths = np.asarray(pnl_paths, dtype=float)
+        inventory_paths = np.asarray(inventory_paths)
+        return self.update(
+            pnl=pnl_paths[..., -1],
+            final_inventory=inventory_paths[..., -1],
+            max_inventory=max_inventory_excursion(inventory_paths),
+            max_drawdown=max_drawdown(pnl_paths)
+        )
+
+    def merge(self, other: "RiskAccumulator") -> "RiskAccumulator":
+        self.pnl.merge(other.pnl)
+        self.pnl_digest.merge(other.pnl_digest)
+        self.inventory.merge(other.inventory)
+        self.max_inventory.merge(other.max_inventory)
+        self.max_inventory_digest.merge(other.max_inventory_digest)
+        self.drawdown.merge(other.drawdown)
+        self.drawdown_digest.merge(other.drawdown_digest)
+        return self
+
+    def report(self, levels=(0.01, 0.05)) -> dict:
+        """
+        Summary of the accumulated paths as a flat dict (one DataFrame row).
+
+        VaR and CVaR are reported as positive losses at each tail level:
+        VaR = -q_level(PnL) and CVaR = -E[PnL | PnL <= q_level(PnL)].
+        Inventory excursion and drawdown tails are reported at 1 - level.
+        """
+        levels = np.asarray(levels, dtype=float)
+        pnl_quantiles = self.pnl_digest.quantile(levels)
+        pnl_tail_means = self.pnl_digest.lower_tail_mean(levels)
+        inventory_quantiles = self.max_inventory_digest.quantile(1 - levels)
+        drawdown_quantiles = self.drawdown_digest.quantile(1 - levels)
+
+        report = {
+            "n_paths": self.pnl.count,
+            "mean_pnl": self.pnl.mean,
+            "std_pnl": self.pnl.std,
+            "sharpe": self.pnl.mean / self.pnl.std if self.pnl.std > 0 else np.nan,
+            "skew_pnl": self.pnl.skewness,
+            "kurtosis_pnl": self.pnl.kurtosis,
+            "min_pnl": self.pnl.min,
+            "median_pnl": self.pnl_digest.quantile(0.5),
+        }
+        for level, quantile, tail_mean in zip(levels, pnl_quantiles, pnl_tail_means):
+            label = _level_label(level)
+            report[f"pnl_q{label}"] = quantile
+            report[f"var_{label}"] = -quantile
+            report[f"cvar_{label}"] = -tail_mean
+        report["mean_q"] = self.inventory.mean if self.inventory.count else np.nan
+        report["std_q"] = self.inventory.std
+        report["mean_max_inventory"] = self.max_inventory.mean if self.max_inventory.count else np.nan
+        report["max_inventory"] = self.max_inventory.max if self.max_inventory.count else np.nan
+        for level, quantile in zip(levels, inventory_quantiles):
+            report[f"max_inventory_q{_level_label(1 - level)}"] = quantile
+        report["mean_drawdown"] = self.drawdown.mean if self.drawdown.count else np.nan
+        report["max_drawdown"] = self.drawdown.max if self.drawdown.count else np.nan
+        for level, quantile in zip(levels, drawdown_quantiles):
+            report[f"drawdown_q{_level_label(1 - level)}"] = quantile
+        return report
@@ -1,8 +1,11 @@
 from src.core.simulation_runner import SimulationRunner
 from src.core.inventory_manager import InventoryManager
 from src.core.data_logger import DataLogger
-import matplotlib.pyplot as plt
-import pandas as pd
+from typing import Optional
+import numpy as np
+
+# matplotlib and pandas are imported inside the functions that need them so that
+# simulation workers can import this module without paying for the plotting stack.
 
 
 def run_strategy(
@@ -16,18 +19,21 @@ def run_strategy(
     gamma, # Risk aversion parameter
     k, # Market depth (for execution intensity λ(δ))
     sigma,  # Volatility of the mid-price process
-    seed: int = 42
+    seed: int = 42,
+    normal_source=None # Optional quasi-random source of price increments and fill draws (SobolNormalSource)
 ):
     T = steps * dt 
-    # Initialize the mid-price process (ABM or GBM) and simulate a price path over steps
-    market = simulator(S0=100, sigma=sigma)
-    prices = market.simulate(steps)
+    # Initialize the mid-price process (ABM or GBM); the runner simulates the price path.
+    # A quasi-random source drives both the price path and the execution's fill draws.
+    market_kwargs = {} if normal_source is None else {"normal_source": normal_source}
+    execution_kwargs = {} if normal_source is None else {"uniform_source": normal_source}
+    market = simulator(S0=100, sigma=sigma, **market_kwargs)
     
     # Instantiate the quoting strategy (e.g., Avellaneda-Stoikov), passing in model parameters.
     strategy = strategy_class(gamma=gamma, sigma=sigma, k=k)
 
     # Create the Poisson-based trade execution model with a base intensity A and decay rate k
-    execution = execution_class(A=100, k=k)
+    execution = execution_class(A=100, k=k, **execution_kwargs)
 
     # Start with zero inventory and zero cash. Prepare the logging system to track simulation data.
     inventory = InventoryManager(initial_cash=0, initial_inventory=0)
@@ -56,29 +62,40 @@ def run_strategy(
 
     return df
 
-def plot_strategy_diagnostics(df, title="Strategy Behavior"):
+def plot_strategy_diagnostics(
+    df,
+    title="Strategy Behavior",
+    show: bool = True,
+    save_path: Optional[str] = None,
+    method: str = "minmax"
+):
+    # Every series is downsampled to about one bucket per horizontal pixel, so
+    # rendering cost does not depend on the number of simulated steps.
+    import matplotlib.pyplot as plt
+    from src.utils.plotting import plot_series
+
     fig, axs = plt.subplots(3, 1, figsize=(12, 10), sharex=True)
 
     # 1. Price and Quotes
-    axs[0].plot(df["mid_prices"], label="Mid Price")
-    axs[0].plot(df["reservation_prices"], label="Reservation Price")
-    axs[0].plot(df["bid_prices"], label="Bid Price", linestyle="--")
-    axs[0].plot(df["ask_prices"], label="Ask Price", linestyle="--")
+    plot_series(axs[0], df["mid_prices"], method, label="Mid Price")
+    plot_series(axs[0], df["reservation_prices"], method, label="Reservation Price")
+    plot_series(axs[0], df["bid_prices"], method, label="Bid Price", linestyle="--")
+    plot_series(axs[0], df["ask_prices"], method, label="Ask Price", linestyle="--")
     axs[0].set_ylabel("Price")
     axs[0].set_title(f"{title} – Quotes vs Price")
     axs[0].legend()
     axs[0].grid(True)
 
     # 2. Inventory
-    axs[1].plot(df["inventory"], label="Inventory", color="orange")
+    plot_series(axs[1], df["inventory"], method, label="Inventory", color="orange")
     axs[1].set_ylabel("Inventory")
     axs[1].set_title("Inventory Over Time")
     axs[1].legend()
     axs[1].grid(True)
 
     # 3. PnL and Cash
-    axs[2].plot(df["pnl"], label="PnL", color="green")
-    axs[2].plot(df["cash"], label="Cash", color="purple", linestyle="--")
+    plot_series(axs[2], df["pnl"], method, label="PnL", color="green")
+    plot_series(axs[2], df["cash"], method, label="Cash", color="purple", linestyle="--")
     axs[2].set_ylabel("PnL / Cash")
     axs[2].set_xlabel("Time Step")
     axs[2].set_title("PnL and Cash Over Time")
@@ -86,7 +103,12 @@ def plot_strategy_diagnostics(df, title="Strategy Behavior"):
     axs[2].grid(True)
 
     plt.tight_layout()
-    plt.show()
+    if save_path is not None:
+        fig.savefig(save_path)
+    if show:
+        plt.show()
+    else:
+        plt.close(fig)
 
 def run_monte_carlo(
     simulator, # Class or function to simulate mid-price (ABM or GBM)
@@ -99,9 +121,36 @@ def run_monte_carlo(
     gamma, # Risk aversion parameter
     k, # Market depth (for execution intensity λ(δ))
     sigma,  # Volatility of the mid-price process
-    n_simulations # Number of Monte Carlo simulations to run
+    n_simulations, # Number of Monte Carlo simulations to run
+    risk=None, # Optional RiskAccumulator that every path is also merged into
+    histogram=None, # Optional StreamingHistogram of the final PnLs
+    qmc_replicates: int = 0, # Independently scrambled Sobol sequences (0 = pseudo-random paths)
+    seed: Optional[int] = None # Seed of the Sobol scramblings
 ):
-    all_results = []
+    """
+    Runs `n_simulations` paths and folds each one into streaming summaries.
+
+    No per-path rows are kept: every path updates a RiskAccumulator (and the
+    optional PnL histogram) and is then dropped, so memory does not grow with
+    n_simulations.
+
+    Returns:
+        list: One RiskAccumulator per QMC replicate (a single one for
+        pseudo-random paths); `rqmc_estimate` turns them into a mean PnL and its
+        standard error.
+    """
+    from src.utils.risk_metrics import RiskAccumulator
+
+    # With QMC the price paths (Brownian-bridge construction) and fill draws come from
+    # `qmc_replicates` scrambled Sobol sequences; simulation i uses replicate
+    # i % qmc_replicates. Powers of two per replicate keep the balance properties
+    # of the sequences.
+    sources = []
+    if qmc_replicates > 0:
+        from src.simulations.quasi_random import SobolNormalSource
+        # The dimension is fixed by the runner's first draw (int(T / dt) steps)
+        sources = SobolNormalSource.replicates(None, qmc_replicates, seed, uniform_streams=2)
+    replicate_risks = [RiskAccumulator() for _ in range(max(1, len(sources)))]
 
     for i in range(n_simulations):
         df = run_strategy(
@@ -115,9 +164,29 @@ def run_monte_carlo(
             gamma=gamma,
             k=k,
             sigma=sigma,
-            seed=i  
+            seed=i,
+            normal_source=sources[i % len(sources)] if sources else None
         )
-        final = df.iloc[-1]  # take last row (final pnl, inventory, etc.)
-        all_results.append(final)
-
-    return pd.DataFrame(all_results)
\ No newline at end of file
+        # Drawdown and inventory excursion need the whole path, which is dropped here
+        pnl_path, inventory_path = df["pnl"].to_numpy(), df["inventory"].to_numpy()
+        replicate_risks[i % len(replicate_risks)].update_paths(pnl_path, inventory_path)
+        if risk is not None:
+            risk.update_paths(pnl_path, inventory_path)
+        if histogram is not None:
+            histogram.update(pnl_path[-1:])
+
+    return replicate_risks
+
+
+def rqmc_estimate(risks):
+    """
+    Mean PnL and its standard error from the accumulators of `run_monte_carlo`.
+
+    For randomized QMC (several replicates) the error comes from the spread of
+    the replicate means, since QMC points within a replicate are not
+    independent; for a single accumulator it is the usual std / sqrt(n).
+    """
+    if len(risks) == 1:
+        return risks[0].pnl.mean, risks[0].pnl.std / np.sqrt(risks[0].count)
+    means = np.array([r.pnl.mean for r in risks])
+    return means.mean(), means.std(ddof=1) / np.sqrt(len(means))